@@ -5,18 +5,36 @@ This module provides endpoints for querying and retrieving findings
 from processed PDF documents stored in ClickHouse.
 """
 
+import asyncio
+import base64
+import binascii
+import hashlib
 import logging
+import time
+from collections import defaultdict
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Annotated, Any, Dict, Iterator, List, Optional, Tuple
 
-from fastapi import APIRouter, HTTPException, Query, status
-from pydantic import BaseModel, Field
+import orjson
+from fastapi import APIRouter, Header, HTTPException, Query, Response, status
+from pydantic import BaseModel, Field, TypeAdapter
 
+from app.core.config import get_settings
 from app.db.clickhouse import get_db_client
+from app.utils.validators import validate_document_id
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
 router = APIRouter()
 
+# Short-lived cache for the global summary statistics aggregate, kept as
+# serialized JSON so hits skip encoding entirely
+_stats_cache: Dict[str, Any] = {"body": b"", "expires_at": 0.0, "generation": 0}
+_stats_cache_lock = asyncio.Lock()
+
+# Findings of a successfully processed document never change
+IMMUTABLE_CACHE_CONTROL = "public, max-age=3600, immutable"
+
 
 class FindingResponse(BaseModel):
     """Response model for individual finding."""
@@ -41,6 +59,7 @@ class DocumentFindingsResponse(BaseModel):
     upload_timestamp: datetime = Field(..., description="Upload time")
     processing_time_ms: float = Field(..., description="Processing duration")
     status: str = Field(..., description="Processing status")
+    error_message: Optional[str] = Field(None, description="Why processing failed")
     findings: List[FindingResponse] = Field(..., description="List of findings")
     summary: Dict[str, int] = Field(..., description="Summary statistics")
 
@@ -48,10 +67,202 @@ class DocumentFindingsResponse(BaseModel):
 class FindingsListResponse(BaseModel):
     """Response model for paginated findings list."""
     
-    total: int = Field(..., description="Total number of results")
+    total: Optional[int] = Field(..., description="Total number of results (omitted for cursor requests)")
     page: int = Field(..., description="Current page number")
     page_size: int = Field(..., description="Results per page")
     findings: List[DocumentFindingsResponse] = Field(..., description="List of documents with findings")
+    has_more: bool = Field(False, description="Whether more results follow this page")
+    next_cursor: Optional[str] = Field(None, description="Cursor for fetching the next page")
+
+
+# Serializers for the findings responses are built once at import
+DOCUMENT_FINDINGS_ADAPTER = TypeAdapter(DocumentFindingsResponse)
+FINDINGS_LIST_ADAPTER = TypeAdapter(FindingsListResponse)
+
+
+def json_response(
+    adapter: TypeAdapter,
+    content: BaseModel,
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    """
+    Serialize a response model straight to JSON bytes.
+    
+    Returning a Response bypasses FastAPI's ``response_model`` handling,
+    which would dump the model to a dict, validate that dict again and
+    only then serialize it.
+    
+    Args:
+        adapter: Adapter for the model's type.
+        content: Model instance to serialize.
+        headers: Optional extra response headers.
+        
+    Returns:
+        JSON response with the serialized model.
+    """
+    return Response(
+        content=adapter.dump_json(content),
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+def encode_cursor(upload_timestamp: datetime, document_id: str) -> str:
+    """
+    Encode the sort key of a document as an opaque pagination cursor.
+    
+    Args:
+        upload_timestamp: Upload time of the last document on the page.
+        document_id: ID of the last document on the page.
+        
+    Returns:
+        URL-safe cursor string.
+    """
+    raw = f"{upload_timestamp.isoformat()}|{document_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """
+    Decode a pagination cursor produced by encode_cursor.
+    
+    Args:
+        cursor: Cursor string from a previous response.
+        
+    Returns:
+        Tuple of (upload_timestamp, document_id).
+        
+    Raises:
+        HTTPException: If the cursor is malformed or names an invalid document ID.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        timestamp, document_id = raw.split("|", 1)
+        return datetime.fromisoformat(timestamp), validate_document_id(document_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError, HTTPException):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        )
+
+
+def document_etag(document: Dict[str, Any]) -> str:
+    """
+    Compute a strong ETag for a processed document.
+    
+    Args:
+        document: Document dictionary as returned by the database client.
+        
+    Returns:
+        Quoted ETag value.
+    """
+    key = f"{document['document_id']}:{document['upload_timestamp']}"
+    return f'"{hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()}"'
+
+
+def etag_matches(etag: str, if_none_match: str) -> bool:
+    """
+    Check an ETag against an ``If-None-Match`` header value.
+    
+    Args:
+        etag: Current ETag of the resource.
+        if_none_match: Raw header value, possibly a comma-separated list.
+        
+    Returns:
+        True if the client's cached copy is still current.
+    """
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def _row_to_finding(row: Dict[str, Any]) -> FindingResponse:
+    """
+    Build a FindingResponse from a finding row without re-validating it.
+    
+    Rows come from our own ClickHouse tables with a fixed shape, so the
+    fields are mapped directly and validation is skipped.
+    
+    Args:
+        row: Finding dictionary as returned by the database client.
+        
+    Returns:
+        FindingResponse for the row.
+    """
+    return FindingResponse.model_construct(
+        finding_id=row["finding_id"],
+        document_id=row["document_id"],
+        finding_type=row["finding_type"],
+        value=row["value"],
+        page_number=row["page_number"],
+        confidence=row["confidence"],
+        context=row.get("context"),
+        detected_at=row["detected_at"],
+    )
+
+
+def _row_to_document(
+    row: Dict[str, Any],
+    findings: List[FindingResponse],
+    summary: Dict[str, int],
+) -> DocumentFindingsResponse:
+    """
+    Build a DocumentFindingsResponse from a document row without re-validating it.
+    
+    Like finding rows, document rows come from our own tables, and the
+    findings are already response models, so validation is skipped.
+    
+    Args:
+        row: Document dictionary as returned by the database client.
+        findings: The document's findings.
+        summary: Finding counts by type, plus ``total``.
+        
+    Returns:
+        DocumentFindingsResponse for the row.
+    """
+    return DocumentFindingsResponse.model_construct(
+        document_id=row["document_id"],
+        filename=row["filename"],
+        file_size=row["file_size"],
+        page_count=row["page_count"],
+        upload_timestamp=row["upload_timestamp"],
+        processing_time_ms=row["processing_time_ms"],
+        status=row["status"],
+        error_message=row.get("error_message"),
+        findings=findings,
+        summary=summary,
+    )
+
+
+def _columns_to_findings(columns: Dict[str, List[Any]]) -> Iterator[FindingResponse]:
+    """
+    Build FindingResponse objects from columnar finding data.
+    
+    Args:
+        columns: Mapping of column name to values from get_findings_columnar.
+        
+    Yields:
+        FindingResponse for each row, in column order.
+    """
+    for finding_id, document_id, finding_type, value, page_number, confidence, context, detected_at in zip(
+        columns["finding_id"],
+        columns["document_id"],
+        columns["finding_type"],
+        columns["value"],
+        columns["page_number"],
+        columns["confidence"],
+        columns["context"],
+        columns["detected_at"],
+    ):
+        yield FindingResponse.model_construct(
+            finding_id=finding_id,
+            document_id=document_id,
+            finding_type=finding_type,
+            value=value,
+            page_number=page_number,
+            confidence=confidence,
+            context=context,
+            detected_at=detected_at,
+        )
 
 
 def calculate_summary(findings: List[Dict]) -> Dict[str, int]:
@@ -73,6 +284,14 @@ def calculate_summary(findings: List[Dict]) -> Dict[str, int]:
     return summary
 
 
+def invalidate_stats_cache() -> None:
+    """Expire the cached summary statistics so the next request re-queries."""
+    _stats_cache["expires_at"] = 0.0
+    # A refresh already in flight may have read the old data, so it must not
+    # mark its result fresh
+    _stats_cache["generation"] += 1
+
+
 @router.get("/findings", response_model=FindingsListResponse)
 async def get_all_findings(
     page: int = Query(1, ge=1, description="Page number"),
@@ -81,7 +300,9 @@ async def get_all_findings(
     finding_type: Optional[str] = Query(None, description="Filter by finding type (email, ssn)"),
     start_date: Optional[datetime] = Query(None, description="Filter by upload date (from)"),
     end_date: Optional[datetime] = Query(None, description="Filter by upload date (to)"),
-) -> FindingsListResponse:
+    include_findings: bool = Query(True, description="Include individual findings, not just the summary"),
+    cursor: Annotated[Optional[str], Query(description="Cursor from a previous page (overrides page)")] = None,
+) -> Response:
     """
     Get all findings with optional filtering and pagination.
     
@@ -92,85 +313,104 @@ async def get_all_findings(
         finding_type: Optional finding type filter.
         start_date: Optional start date filter.
         end_date: Optional end date filter.
+        include_findings: Whether to return finding rows or only per-document summaries.
+        cursor: Optional keyset cursor; when given, the total count is skipped.
         
     Returns:
-        Paginated list of documents with findings.
+        JSON-serialized FindingsListResponse.
     """
+    before_timestamp, before_document_id = decode_cursor(cursor) if cursor else (None, None)
+    
     logger.info(
-        f"Getting findings - page: {page}, page_size: {page_size}, "
-        f"doc_id: {doc_id}, finding_type: {finding_type}, "
-        f"start_date: {start_date}, end_date: {end_date}"
+        "Getting findings - page: %s, page_size: %s, doc_id: %s, "
+        "finding_type: %s, start_date: %s, end_date: %s",
+        page, page_size, doc_id, finding_type, start_date, end_date,
     )
     
     try:
         db_client = get_db_client()
 
-        offset = (page - 1) * page_size
+        offset = 0 if cursor else (page - 1) * page_size
         
-        total_count = await db_client.count_documents(
+        # Fetch one extra row to learn whether another page follows
+        documents_query = db_client.get_documents(
+            limit=page_size + 1,
+            offset=offset,
             doc_id=doc_id,
             start_date=start_date,
             end_date=end_date,
+            before_timestamp=before_timestamp,
+            before_document_id=before_document_id,
         )
         
-        documents = await db_client.get_documents(
-            limit=page_size,
-            offset=offset,
-            doc_id=doc_id,
-            start_date=start_date,
-            end_date=end_date,
+        if cursor:
+            total_count = None
+            documents = await documents_query
+        else:
+            # The count and the page itself are independent, so overlap their round-trips
+            total_count, documents = await asyncio.gather(
+                db_client.count_documents(
+                    doc_id=doc_id,
+                    start_date=start_date,
+                    end_date=end_date,
+                ),
+                documents_query,
+            )
+        
+        has_more = len(documents) > page_size
+        documents = documents[:page_size]
+        next_cursor = (
+            encode_cursor(documents[-1]["upload_timestamp"], documents[-1]["document_id"])
+            if has_more
+            else None
+        )
+        
+        document_ids = [doc["document_id"] for doc in documents]
+        
+        # Fetch findings for the whole page in one query instead of one per document,
+        # while ClickHouse counts them by type in parallel
+        summary_query = db_client.get_findings_summary(
+            document_ids=document_ids,
+            finding_type=finding_type,
         )
+        findings_by_document = defaultdict(list)
         
+        if include_findings:
+            finding_columns, summaries = await asyncio.gather(
+                db_client.get_findings_columnar(
+                    document_ids=document_ids,
+                    finding_type=finding_type,
+                ),
+                summary_query,
+            )
+            for finding in _columns_to_findings(finding_columns):
+                findings_by_document[finding.document_id].append(finding)
+        else:
+            summaries = await summary_query
 
         results = []
-        
+
         for doc in documents:
-            findings = await db_client.get_findings_by_document(
-                document_id=doc["document_id"],
-                finding_type=finding_type,
-            )
-            
-            # Convert findings to response model
-            finding_responses = [
-                FindingResponse(
-                    finding_id=f["finding_id"],
-                    document_id=f["document_id"],
-                    finding_type=f["finding_type"],
-                    value=f["value"],
-                    page_number=f["page_number"],
-                    confidence=f["confidence"],
-                    context=f.get("context"),
-                    detected_at=f["detected_at"],
-                )
-                for f in findings
-            ]
+            finding_responses = findings_by_document.get(doc["document_id"], [])
             
-            summary = calculate_summary(findings)
+            summary = summaries.get(doc["document_id"], {"total": 0})
             
-            # Build document response
-            doc_response = DocumentFindingsResponse(
-                document_id=doc["document_id"],
-                filename=doc["filename"],
-                file_size=doc["file_size"],
-                page_count=doc["page_count"],
-                upload_timestamp=doc["upload_timestamp"],
-                processing_time_ms=doc["processing_time_ms"],
-                status=doc["status"],
-                findings=finding_responses,
-                summary=summary,
-            )
-            
-            results.append(doc_response)
+            results.append(_row_to_document(doc, finding_responses, summary))
         
-        return FindingsListResponse(
-            total=total_count,
-            page=page,
-            page_size=page_size,
-            findings=results,
+        return json_response(
+            FINDINGS_LIST_ADAPTER,
+            FindingsListResponse(
+                total=total_count,
+                page=page,
+                page_size=page_size,
+                findings=results,
+                has_more=has_more,
+                next_cursor=next_cursor,
+            ),
         )
         
     except Exception as e:
-        logger.error(f"Failed to retrieve findings: {e}", exc_info=True)
+        logger.error("Failed to retrieve findings: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve findings from database",
@@ -178,15 +418,23 @@ async def get_all_findings(
 
 
 @router.get("/findings/{document_id}", response_model=DocumentFindingsResponse)
-async def get_document_findings(document_id: str) -> DocumentFindingsResponse:
+async def get_document_findings(
+    document_id: str,
+    if_none_match: Annotated[Optional[str], Header()] = None,
+) -> Response:
     """
     Get findings for a specific document.
     
+    Findings of successfully processed documents never change, so those
+    responses carry an ETag and a long-lived ``Cache-Control`` header and
+    a matching ``If-None-Match`` is answered with 304 Not Modified.
+    
     Args:
         document_id: UUID of the document.
+        if_none_match: ETag(s) the client already holds.
         
     Returns:
-        Document with all its findings.
+        JSON-serialized DocumentFindingsResponse, or 304 Not Modified.
         
     Raises:
         HTTPException: If document not found.
@@ -203,41 +451,36 @@ async def get_document_findings(document_id: str) -> DocumentFindingsResponse:
                 detail=f"Document {document_id} not found",
             )
         
+        if document["status"] == "success":
+            etag = document_etag(document)
+            cache_headers = {"ETag": etag, "Cache-Control": IMMUTABLE_CACHE_CONTROL}
+            
+            if if_none_match and etag_matches(etag, if_none_match):
+                return Response(
+                    status_code=status.HTTP_304_NOT_MODIFIED,
+                    headers=cache_headers,
+                )
+            
+        else:
+            cache_headers = {"Cache-Control": "no-store"}
+        
         findings = await db_client.get_findings_by_document(document_id)
         
         # Convert to response models
-        finding_responses = [
-            FindingResponse(
-                finding_id=f["finding_id"],
-                document_id=f["document_id"],
-                finding_type=f["finding_type"],
-                value=f["value"],
-                page_number=f["page_number"],
-                confidence=f["confidence"],
-                context=f.get("context"),
-                detected_at=f["detected_at"],
-            )
-            for f in findings
-        ]
+        finding_responses = list(map(_row_to_finding, findings))
 
         summary = calculate_summary(findings)
         
-        return DocumentFindingsResponse(
-            document_id=document["document_id"],
-            filename=document["filename"],
-            file_size=document["file_size"],
-            page_count=document["page_count"],
-            upload_timestamp=document["upload_timestamp"],
-            processing_time_ms=document["processing_time_ms"],
-            status=document["status"],
-            findings=finding_responses,
-            summary=summary,
+        return json_response(
+            DOCUMENT_FINDINGS_ADAPTER,
+            _row_to_document(document, finding_responses, summary),
+            headers=cache_headers,
         )
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to retrieve document findings: {e}")
+        logger.error("Failed to retrieve document findings: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve document findings",
@@ -245,30 +488,51 @@ async def get_document_findings(document_id: str) -> DocumentFindingsResponse:
 
 
 @router.get("/findings/stats/summary")
-async def get_findings_summary() -> Dict:
+async def get_findings_summary() -> Response:
     """
     Get summary statistics for all findings.
     
+    Results are cached for ``stats_cache_ttl_seconds`` and invalidated
+    whenever an upload completes and again when buffered inserts are
+    flushed. Only one request refreshes an expired
+    entry; concurrent callers wait for it and share its result.
+    
     Returns:
-        Dictionary with overall statistics.
+        JSON response with overall statistics.
     """
     
+    if time.monotonic() < _stats_cache["expires_at"]:
+        return Response(content=_stats_cache["body"], media_type="application/json")
+    
     try:
-        db_client = get_db_client()
-        
-        stats = await db_client.get_summary_statistics()
-        
-        return {
-            "total_documents": stats.get("total_documents", 0),
-            "total_findings": stats.get("total_findings", 0),
-            "findings_by_type": stats.get("findings_by_type", {}),
-            "average_processing_time_ms": stats.get("avg_processing_time", 0),
-            "total_pages_processed": stats.get("total_pages", 0),
-            "documents_with_findings": stats.get("documents_with_findings", 0),
-        }
+        async with _stats_cache_lock:
+            # Another request may have refreshed the entry while this one waited
+            if time.monotonic() < _stats_cache["expires_at"]:
+                return Response(content=_stats_cache["body"], media_type="application/json")
+            
+            generation = _stats_cache["generation"]
+            db_client = get_db_client()
+            
+            stats = await db_client.get_summary_statistics()
+            
+            summary = {
+                "total_documents": stats.get("total_documents", 0),
+                "total_findings": stats.get("total_findings", 0),
+                "findings_by_type": stats.get("findings_by_type", {}),
+                "average_processing_time_ms": stats.get("avg_processing_time", 0),
+                "total_pages_processed": stats.get("total_pages", 0),
+                "documents_with_findings": stats.get("documents_with_findings", 0),
+            }
+            
+            body = orjson.dumps(summary)
+            _stats_cache["body"] = body
+            if _stats_cache["generation"] == generation:
+                _stats_cache["expires_at"] = time.monotonic() + settings.stats_cache_ttl_seconds
+            
+            return Response(content=body, media_type="application/json")
         
     except Exception as e:
-        logger.error(f"Failed to retrieve summary statistics: {e}", exc_info=True)
+        logger.error("Failed to retrieve summary statistics: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve summary statistics",
@@ -8,18 +8,21 @@ storage of results in ClickHouse.
 import asyncio
 import logging
 import uuid
-from datetime import datetime
-from pathlib import Path
-from typing import Dict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from tempfile import NamedTemporaryFile
+from typing import BinaryIO, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, File, HTTPException, UploadFile, status
 
+from app.api.endpoints.findings import invalidate_stats_cache
 from app.core.config import get_settings
+from app.core.detector import create_detector
 from app.db.clickhouse import get_db_client
 from app.services.pdf_processor import (
-    CorruptedPDFError,
     PDFProcessingError,
-    PDFSizeLimitError,
+    PDFProcessingResult,
     create_pdf_processor,
 )
 
@@ -27,8 +30,32 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 router = APIRouter()
 
-# Semaphore for concurrent upload limiting
-upload_semaphore = asyncio.Semaphore(settings.max_concurrent_uploads)
+
+@dataclass
+class UploadJob:
+    """An accepted upload waiting to be processed."""
+    
+    document_id: str
+    filename: str
+    pdf_stream: BinaryIO
+    file_size: int
+    upload_timestamp: datetime
+
+
+# Uploads waiting for a processing worker; created when the workers start
+_work_queue: Optional[asyncio.Queue] = None
+_workers: List[asyncio.Task] = []
+
+# Process pool for CPU-bound PDF parsing; created alongside the workers
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+
+# Uploads are copied to the job's temporary file in chunks
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Settings are cached for the process lifetime, so hot-path values are bound once
+_ALLOWED_EXTENSIONS = settings.allowed_extensions
+_MAX_UPLOAD_SIZE = settings.max_upload_size
+_ENABLE_METRICS = settings.enable_metrics
 
 
 def validate_file_extension(filename: str) -> None:
@@ -41,9 +68,10 @@ def validate_file_extension(filename: str) -> None:
     Raises:
         HTTPException: If file extension is not allowed.
     """
-    file_ext = Path(filename).suffix.lower()
+    dot = filename.rfind(".")
+    file_ext = filename[dot:].lower() if dot > 0 else ""
     
-    if file_ext not in settings.allowed_file_extensions:
+    if file_ext not in _ALLOWED_EXTENSIONS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"File type {file_ext} not allowed. Allowed types: {settings.allowed_file_extensions}",
@@ -60,214 +88,360 @@ def validate_file_size(file_size: int) -> None:
     Raises:
         HTTPException: If file size exceeds limit.
     """
-    if file_size > settings.max_upload_size:
+    if file_size > _MAX_UPLOAD_SIZE:
         raise HTTPException(
             status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail=f"File size {file_size} bytes exceeds maximum {settings.max_upload_size} bytes",
+            detail=f"File size {file_size} bytes exceeds maximum {_MAX_UPLOAD_SIZE} bytes",
         )
 
 
-async def process_pdf_async(pdf_data: bytes, filename: str) -> Dict:
+async def spool_upload(file: UploadFile) -> Tuple[BinaryIO, int]:
+    """
+    Copy an uploaded file into a temporary file owned by the upload job.
+    
+    Starlette has already parsed the request body into its own temporary file,
+    which is closed once the response is sent, so the queued job needs its own
+    copy. Bodies declaring an oversized Content-Length are refused before
+    parsing by ``UploadSizeLimitMiddleware``; the running total enforces the
+    limit on the file itself.
+    
+    Args:
+        file: Uploaded file.
+        
+    Returns:
+        Tuple of (named temporary file rewound to the start, size in bytes).
+        
+    Raises:
+        HTTPException: If the file cannot be read or exceeds the size limit.
+    """
+    spooled = NamedTemporaryFile(suffix=".pdf")
+    total_size = 0
+    
+    try:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            total_size += len(chunk)
+            validate_file_size(total_size)
+            spooled.write(chunk)
+    except HTTPException:
+        spooled.close()
+        raise
+    except Exception as e:
+        spooled.close()
+        logger.error("Failed to read uploaded file %s: %s", file.filename, e, exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Failed to read uploaded file",
+        )
+    
+    # Worker processes open the file by path, so nothing may stay buffered here
+    spooled.flush()
+    spooled.seek(0)
+    return spooled, total_size
+
+
+def _process_pdf_worker(pdf_path: str, filename: str) -> PDFProcessingResult:
+    """
+    Process a PDF inside an executor worker.
+    
+    The processor is created here rather than passed in, and the file is
+    opened by path, so only picklable arguments cross the process boundary
+    and the upload is never copied into memory. Page extraction stays in
+    this process: the pool already runs one document per core.
+    
+    Args:
+        pdf_path: Path of the temporary file holding the upload.
+        filename: Name of the PDF file.
+        
+    Returns:
+        Processing result.
+    """
+    processor = create_pdf_processor(num_workers=1)
+    with open(pdf_path, "rb") as pdf_file:
+        return processor.process_pdf(pdf_file, filename)
+
+
+async def process_pdf_async(pdf_path: str, filename: str) -> PDFProcessingResult:
     """
-    Process PDF in background thread to avoid blocking.
+    Process PDF in a worker process to avoid blocking.
+    
+    Falls back to the default thread pool when the process pool is not
+    running, e.g. outside the application lifespan.
     
     Args:
-        pdf_data: Raw PDF file data.
+        pdf_path: Path of the temporary file holding the upload.
         filename: Name of the PDF file.
         
     Returns:
-        Processing result dictionary.
+        Processing result.
         
     Raises:
         Various PDF processing exceptions.
     """
-    loop = asyncio.get_event_loop()
-    processor = create_pdf_processor()
+    loop = asyncio.get_running_loop()
     
-    # Run PDF processing in a separate thread from the async event loop.
-    # This prevents blocking other async tasks, even though CPU work still runs one at a time due to Python's GIL.
+    # Parsing and regex scanning are CPU-bound; separate processes let them use
+    # every core instead of contending for the GIL.
     result = await loop.run_in_executor(
-        None,
-        processor.process_pdf,
-        pdf_data,
+        _pdf_pool,
+        _process_pdf_worker,
+        pdf_path,
         filename
     )
     
     return result
 
 
-@router.post("/upload", status_code=status.HTTP_201_CREATED)
+async def store_pending_document(job: UploadJob) -> None:
+    """
+    Record an accepted upload before it is processed.
+    
+    Clients polling ``/findings/{document_id}`` then see a ``pending`` status
+    instead of a 404. The row shares the upload's sort key, so the row written
+    once processing finishes replaces it.
+    
+    Args:
+        job: The accepted upload.
+    """
+    db_client = get_db_client()
+    await db_client.insert_document(
+        document_id=job.document_id,
+        filename=job.filename,
+        file_size=job.file_size,
+        page_count=0,
+        upload_timestamp=job.upload_timestamp,
+        processing_time_ms=0,
+        status="pending",
+    )
+
+
+async def store_failed_document(job: UploadJob, error: Exception) -> None:
+    """
+    Record a failed processing attempt for an upload.
+    
+    Args:
+        job: The upload that failed.
+        error: The error that stopped processing.
+    """
+    db_client = get_db_client()
+    await db_client.insert_document(
+        document_id=job.document_id,
+        filename=job.filename,
+        file_size=job.file_size,
+        page_count=0,
+        upload_timestamp=job.upload_timestamp,
+        processing_time_ms=0,
+        status="failed",
+        error_message=str(error),
+    )
+
+
+async def process_upload_job(job: UploadJob) -> None:
+    """
+    Process a queued upload and store its document, findings and metrics.
+    
+    Failures are recorded as a document with ``failed`` status so clients
+    polling ``/findings/{document_id}`` see the outcome.
+    
+    Args:
+        job: The upload to process.
+    """
+    db_client = get_db_client()
+    
+    try:
+        result = await process_pdf_async(job.pdf_stream.name, job.filename)
+        
+        # The document row marks the upload as processed and its findings as
+        # final, so findings and metrics are written first. Buffered inserts
+        # flush documents last, so a buffered document never becomes visible
+        # before the rows queued ahead of it
+        pending_inserts = {}
+        
+        if result.findings:
+            pending_inserts["findings"] = db_client.insert_findings_bulk([
+                {
+                    "document_id": job.document_id,
+                    "finding_type": finding.type.value,
+                    "value": finding.value,
+                    "page_number": getattr(finding, 'page_number', 1),
+                    "confidence": finding.confidence,
+                    "context": finding.context,
+                }
+                for finding in result.findings
+            ])
+        
+        if _ENABLE_METRICS:
+            pending_inserts["metrics"] = db_client.insert_metrics_bulk([
+                {
+                    "document_id": job.document_id,
+                    "metric_type": metric_type,
+                    "value": value,
+                    "timestamp": job.upload_timestamp,
+                }
+                for metric_type, value in (
+                    ("processing_time", result.processing_time_ms),
+                    ("page_count", float(result.page_count)),
+                    ("file_size", float(result.file_size)),
+                )
+            ])
+        
+        outcomes = await asyncio.gather(*pending_inserts.values(), return_exceptions=True)
+        for name, outcome in zip(pending_inserts, outcomes):
+            if not isinstance(outcome, Exception):
+                continue
+            # Metrics are not critical, but a document must not be marked
+            # processed without its findings
+            logger.error("Failed to insert %s: %s", name, outcome)
+            if name == "findings":
+                raise outcome
+        
+        logger.info("Storing document metadata for: %s", job.document_id)
+        await db_client.insert_document(
+            document_id=job.document_id,
+            filename=job.filename,
+            file_size=result.file_size,
+            page_count=result.page_count,
+            upload_timestamp=job.upload_timestamp,
+            processing_time_ms=result.processing_time_ms,
+            status=result.status,
+        )
+        logger.info("Document metadata stored successfully: %s", job.document_id)
+        
+        # Rows still in the client insert buffer expire the cache again when flushed
+        invalidate_stats_cache()
+        
+        logger.info("PDF processed: %s - %d findings found", job.filename, len(result.findings))
+        
+    except PDFProcessingError as e:
+        logger.warning("PDF processing failed for %s: %s", job.document_id, e)
+        await store_failed_document(job, e)
+        
+    except Exception as e:
+        logger.error(
+            "Unexpected error processing PDF %s (ID: %s): %s",
+            job.filename, job.document_id, e,
+            exc_info=True
+        )
+        
+        # Try to store failed processing attempt
+        try:
+            await store_failed_document(job, e)
+        except Exception as db_error:
+            logger.error("Failed to store error document: %s", db_error, exc_info=True)
+
+
+async def _upload_worker(queue: asyncio.Queue) -> None:
+    """
+    Drain the upload queue, processing one job at a time.
+    
+    Args:
+        queue: Queue of UploadJob instances.
+    """
+    while True:
+        job = await queue.get()
+        try:
+            with job.pdf_stream:
+                await process_upload_job(job)
+        except Exception as e:
+            logger.error("Upload worker failed on %s: %s", job.document_id, e, exc_info=True)
+        finally:
+            queue.task_done()
+
+
+def start_upload_workers(worker_count: int) -> None:
+    """
+    Create the upload queue and process pool and start the processing workers.
+    
+    Args:
+        worker_count: Number of concurrent processing workers.
+    """
+    global _work_queue, _pdf_pool
+    
+    # Compile the detection patterns once at startup: forked workers inherit
+    # the compiled detector, other start methods build it as each worker starts
+    create_detector()
+    _pdf_pool = ProcessPoolExecutor(max_workers=worker_count, initializer=create_detector)
+    _work_queue = asyncio.Queue(maxsize=settings.max_concurrent_uploads * 2)
+    _workers.extend(
+        asyncio.create_task(_upload_worker(_work_queue)) for _ in range(worker_count)
+    )
+    logger.info("Started %d upload processing workers", worker_count)
+
+
+async def stop_upload_workers() -> None:
+    """Wait for queued uploads to finish, then stop the workers and process pool."""
+    global _work_queue, _pdf_pool
+    
+    if _work_queue is None:
+        return
+    
+    await _work_queue.join()
+    
+    for worker in _workers:
+        worker.cancel()
+    await asyncio.gather(*_workers, return_exceptions=True)
+    
+    _workers.clear()
+    _work_queue = None
+    
+    _pdf_pool.shutdown(wait=True)
+    _pdf_pool = None
+    logger.info("Upload processing workers stopped")
+
+
+@router.post("/upload", status_code=status.HTTP_202_ACCEPTED)
 async def upload_pdf(file: UploadFile = File(...)) -> Dict:
     """
-    Upload and process a PDF file for sensitive data detection.
+    Accept a PDF file and queue it for sensitive data detection.
+    
+    Processing happens in the background; poll ``/findings/{document_id}``
+    for the result.
     
     Args:
         file: Uploaded PDF file.
         
     Returns:
-        Dictionary containing document ID and processing status.
+        Dictionary containing document ID and queued status.
         
     Raises:
-        HTTPException: For various error conditions.
+        HTTPException: For invalid uploads or when processing is unavailable.
     """
 
     validate_file_extension(file.filename)
     
-    try:
-        pdf_data = await file.read()
-    except Exception as e:
-        logger.error(f"Failed to read uploaded file {file.filename}: {e}", exc_info=True)
+    if _work_queue is None:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Failed to read uploaded file",
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Upload processing is not available",
         )
     
-    validate_file_size(len(pdf_data))
+    pdf_stream, file_size = await spool_upload(file)
     
-    document_id = str(uuid.uuid4())
-    upload_timestamp = datetime.utcnow()
+    job = UploadJob(
+        document_id=uuid.uuid4().hex,
+        filename=file.filename,
+        pdf_stream=pdf_stream,
+        file_size=file_size,
+        upload_timestamp=datetime.now(timezone.utc),
+    )
     
-    # Acquire semaphore for concurrent upload limiting
-    async with upload_semaphore:
-        # Get database client early so it's available in exception handlers
-        db_client = get_db_client()
-        
-        try:
-            result = await process_pdf_async(pdf_data, file.filename)
-            
-            logger.info(f"Storing document metadata for: {document_id}")
-            await db_client.insert_document(
-                document_id=document_id,
-                filename=file.filename,
-                file_size=result.file_size,
-                page_count=result.page_count,
-                upload_timestamp=upload_timestamp,
-                processing_time_ms=result.processing_time_ms,
-                status=result.status,
-            )
-            logger.info(f"Document metadata stored successfully: {document_id}")
-            
-            for finding in result.findings:
-                try:
-                    await db_client.insert_finding(
-                        document_id=document_id,
-                        finding_type=finding.type.value,
-                        value=finding.value,
-                        page_number=getattr(finding, 'page_number', 1),
-                        confidence=finding.confidence,
-                        context=finding.context,
-                    )
-                except Exception as e:
-                    # Log error but continue processing other findings
-                    logger.error(f"Failed to insert finding: {e}")
-            
-            if settings.enable_metrics:
-                try:
-                    await db_client.insert_metric(
-                        document_id=document_id,
-                        metric_type="processing_time",
-                        value=result.processing_time_ms,
-                        timestamp=upload_timestamp,
-                    )
-                    
-                    await db_client.insert_metric(
-                        document_id=document_id,
-                        metric_type="page_count",
-                        value=float(result.page_count),
-                        timestamp=upload_timestamp,
-                    )
-                    
-                    await db_client.insert_metric(
-                        document_id=document_id,
-                        metric_type="file_size",
-                        value=float(result.file_size),
-                        timestamp=upload_timestamp,
-                    )
-                except Exception as e:
-                    # Log metric insertion error but don't fail the request
-                    logger.error(f"Failed to insert metric: {e}")
-            
-            logger.info(f"PDF processed: {file.filename} - {len(result.findings)} findings found")
-            
-            return {
-                "document_id": document_id,
-                "filename": file.filename,
-                "status": "success",
-                "page_count": result.page_count,
-                "findings_count": len(result.findings),
-                "processing_time_ms": result.processing_time_ms,
-                "message": f"PDF processed successfully with {len(result.findings)} findings",
-            }
-            
-        except PDFSizeLimitError as e:
-            logger.warning(f"PDF size limit exceeded: {e}")
-            raise HTTPException(
-                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                detail=str(e),
-            )
-            
-        except CorruptedPDFError as e:
-            logger.warning(f"Corrupted PDF uploaded: {e}")
-            
-            # Store failed processing attempt
-            await db_client.insert_document(
-                document_id=document_id,
-                filename=file.filename,
-                file_size=len(pdf_data),
-                page_count=0,
-                upload_timestamp=upload_timestamp,
-                processing_time_ms=0,
-                status="failed",
-                error_message=str(e),
-            )
-            
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail=f"PDF file is corrupted or unreadable: {str(e)}",
-            )
-            
-        except PDFProcessingError as e:
-            logger.error(f"PDF processing failed: {e}")
-            
-            # Store failed processing attempt
-            await db_client.insert_document(
-                document_id=document_id,
-                filename=file.filename,
-                file_size=len(pdf_data),
-                page_count=0,
-                upload_timestamp=upload_timestamp,
-                processing_time_ms=0,
-                status="failed",
-                error_message=str(e),
-            )
-            
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to process PDF: {str(e)}",
-            )
-            
-        except Exception as e:
-            logger.error(
-                f"Unexpected error processing PDF {file.filename} (ID: {document_id}): {e}",
-                exc_info=True
-            )
-            
-            # Try to store failed processing attempt
-            try:
-                await db_client.insert_document(
-                    document_id=document_id,
-                    filename=file.filename,
-                    file_size=len(pdf_data),
-                    page_count=0,
-                    upload_timestamp=upload_timestamp,
-                    processing_time_ms=0,
-                    status="failed",
-                    error_message=str(e),
-                )
-            except Exception as db_error:
-                logger.error(f"Failed to store error document: {db_error}", exc_info=True)
-            
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="An unexpected error occurred while processing the PDF",
-            )
+    # Written before the job is queued so it cannot land after the final row
+    try:
+        await store_pending_document(job)
+    except Exception as e:
+        logger.warning("Failed to record pending document %s: %s", job.document_id, e)
+    
+    # Waits for space when the queue is full, applying backpressure to uploads
+    try:
+        await _work_queue.put(job)
+    except BaseException:
+        pdf_stream.close()
+        raise
+    
+    logger.info("PDF queued: %s (ID: %s)", job.filename, job.document_id)
+    
+    return {
+        "document_id": job.document_id,
+        "filename": job.filename,
+        "status": "queued",
+        "message": "PDF accepted for processing",
+    }
@@ -6,12 +6,13 @@ for type safety and environment variable support.
 """
 
 import logging
+import os
 from functools import lru_cache
-from typing import List, Optional
+from typing import Any, FrozenSet, List, Literal, Optional
 
+from pydantic import PrivateAttr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -45,10 +46,20 @@ class Settings(BaseSettings):
     clickhouse_password: str = ""
     clickhouse_secure: bool = False
     clickhouse_verify: bool = True
+    clickhouse_driver: Literal["connect", "asynch", "connect_async"] = "connect"
+    clickhouse_insert_batch_size: int = 1000  # 1 disables insert buffering
+    clickhouse_flush_interval_ms: int = 500
+    clickhouse_async_insert: bool = True  # server-side insert coalescing
+    clickhouse_compression: Literal["none", "lz4", "zstd"] = "lz4"
+    clickhouse_pool_size: int = 32  # pooled connections per ClickHouse client
+    clickhouse_pool_min_size: int = 5  # native connections opened at startup; 0 disables the pool
+    clickhouse_findings_buffer: bool = False  # write findings through a Buffer table
     
     # Performance settings
     max_concurrent_uploads: int = 10
+    processing_workers: int = os.cpu_count() or 1
     processing_timeout: int = 300  # 5 minutes
+    stats_cache_ttl_seconds: int = 30
     
     # Metrics settings
     enable_metrics: bool = True
@@ -60,13 +71,37 @@ class Settings(BaseSettings):
         case_sensitive=False,
     )
     
+    # Derived values, computed by validate_settings and reset when their inputs change
+    _clickhouse_url: Optional[str] = PrivateAttr(default=None)
+    _allowed_exts: Optional[FrozenSet[str]] = PrivateAttr(default=None)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name.startswith("clickhouse_"):
+            self._clickhouse_url = None
+        elif name == "allowed_file_extensions":
+            self._allowed_exts = None
+    
+    @property
+    def allowed_extensions(self) -> FrozenSet[str]:
+        """Allowed file extensions, lower-cased, for membership checks."""
+        if self._allowed_exts is None:
+            self._allowed_exts = frozenset(ext.lower() for ext in self.allowed_file_extensions)
+        return self._allowed_exts
+    
     def get_clickhouse_url(self) -> str:
         """
-        Construct ClickHouse connection URL.
+        Get the ClickHouse connection URL.
         
         Returns:
             ClickHouse connection string.
         """
+        if self._clickhouse_url is None:
+            self._clickhouse_url = self._build_clickhouse_url()
+        return self._clickhouse_url
+    
+    def _build_clickhouse_url(self) -> str:
+        """Construct the ClickHouse connection URL from the current settings."""
         protocol = "clickhouse+https" if self.clickhouse_secure else "clickhouse"
         auth = f"{self.clickhouse_user}:{self.clickhouse_password}@" if self.clickhouse_password else ""
         return f"{protocol}://{auth}{self.clickhouse_host}:{self.clickhouse_port}/{self.clickhouse_database}"
@@ -87,6 +122,15 @@ class Settings(BaseSettings):
         if self.processing_timeout <= 0:
             raise ValueError("processing_timeout must be positive")
         
+        if self.processing_workers <= 0:
+            raise ValueError("processing_workers must be positive")
+        
+        if self.stats_cache_ttl_seconds < 0:
+            raise ValueError("stats_cache_ttl_seconds must not be negative")
+        
+        self._clickhouse_url = self._build_clickhouse_url()
+        self._allowed_exts = frozenset(ext.lower() for ext in self.allowed_file_extensions)
+        
         logger.info("Settings validation passed")
 
 
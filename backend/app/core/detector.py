@@ -6,14 +6,34 @@ email addresses and Social Security Numbers (SSNs) with validation and
 context-aware confidence scoring.
 """
 
-import re
+import heapq
 import logging
-from dataclasses import dataclass
+import sys
+from bisect import bisect_right
+from dataclasses import dataclass, replace
 from enum import Enum
-from typing import List, Optional, Set, Tuple
+from functools import lru_cache
+from itertools import accumulate
+from typing import Any, ClassVar, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+# RE2 guarantees linear-time matching on untrusted text; fall back to re if unavailable
+try:
+    import re2 as re_engine
+except ImportError:
+    import re as re_engine
+
+# re (3.11+) can use possessive quantifiers to avoid backtracking; RE2 never
+# backtracks and rejects the syntax
+_POSSESSIVE = "+" if re_engine.__name__ == "re" and sys.version_info >= (3, 11) else ""
 
 logger = logging.getLogger(__name__)
 
+# Replacement text shared by every finding and by redact()
+DEFAULT_REDACTION = "[REDACTED]"
+
+# Lower-cases ASCII only, so offsets always line up with the original text
+_ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
 
 class FindingType(Enum):
     """Types of sensitive data that can be detected."""
@@ -21,16 +41,22 @@ class FindingType(Enum):
     SSN = "ssn"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Finding:
-    """Represents a sensitive data finding in text."""
+    """
+    Represents a sensitive data finding in text.
+    
+    Slotted and immutable, since large documents produce thousands of these.
+    """
     type: FindingType
     value: str
     start_pos: int
     end_pos: int
     confidence: float = 1.0
     context: Optional[str] = None
-    redaction_text: str = "[REDACTED]"
+    
+    # Identical for every finding, so kept on the class rather than per instance
+    redaction_text: ClassVar[str] = DEFAULT_REDACTION
 
 
 class DetectorError(Exception):
@@ -52,13 +78,36 @@ class SensitiveDataDetector:
     context-aware confidence scoring.
     """
     
-    # Email regex pattern based on RFC 5322 simplified for practical use
-    EMAIL_PATTERN = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+    # Email regex pattern based on RFC 5322 simplified for practical use. The
+    # local part cannot contain "@", so matching it possessively is equivalent.
+    EMAIL_PATTERN = rf'\b[A-Za-z0-9._%+-]+{_POSSESSIVE}@[A-Za-z0-9.-]+\.[A-Za-z]{{2,}}\b'
+    
+    # SSN components restricted to values valid under SSA guidelines, so the
+    # regex engine rejects invalid candidates without a trip through Python:
+    # area excludes 000, 666 and 900-999, group excludes 00, serial excludes 0000
+    SSN_AREA_PATTERN = r'(?:00[1-9]|0[1-9]\d|[1-57-8]\d\d|6[0-57-9]\d|66[0-57-9])'
+    SSN_GROUP_PATTERN = r'(?:0[1-9]|[1-9]\d)'
+    SSN_SERIAL_PATTERN = r'(?:000[1-9]|00[1-9]\d|0[1-9]\d\d|[1-9]\d{3})'
+    
+    # SSN pattern covering dashed, spaced and continuous formats in one pass.
+    # RE2 has no backreferences, so matching separator kinds are checked in
+    # code; any whitespace counts as a space, so line-wrapped SSNs still match
+    SSN_PATTERN = (
+        rf'\b({SSN_AREA_PATTERN})([-\s]?)({SSN_GROUP_PATTERN})([-\s]?)({SSN_SERIAL_PATTERN})\b'
+    )
     
-    # SSN format patterns
-    SSN_DASHED_PATTERN = r'\b(\d{3})-(\d{2})-(\d{4})\b'
-    SSN_CONTINUOUS_PATTERN = r'\b(\d{3})(\d{2})(\d{4})\b'
-    SSN_SPACED_PATTERN = r'\b(\d{3})\s(\d{2})\s(\d{4})\b'
+    # Replacement emitted by redact() for each sensitive value
+    REDACTION_TEXT = DEFAULT_REDACTION
+    
+    # Text carried across chunks by detect_stream(); must exceed the longest
+    # email local part, the SSN keyword window and the context window so
+    # findings near chunk edges come out exactly as from detect()
+    STREAM_OVERLAP = 256
+    
+    # Joins pages for detect_pages(). The newlines end every pattern at a page
+    # edge and no pattern matches the record separators between them; longer
+    # than the SSN keyword window so a page's keywords never reach the next page
+    PAGE_SEPARATOR = "\n" + "\x1e" * 62 + "\n"
     
     # Context indicators for SSN detection
     SSN_CONTEXT_KEYWORDS = frozenset([
@@ -66,29 +115,37 @@ class SensitiveDataDetector:
         'tax id', 'social security number', 'ss#', 'soc sec'
     ])
     
-    # Invalid SSN prefixes according to SSA guidelines
-    INVALID_SSN_AREA_NUMBERS = frozenset(['000', '666'] + [f'{i:03d}' for i in range(900, 1000)])
-    
     def __init__(self):
         """Initialize the detector with compiled regex patterns."""
         try:
-            self._email_pattern = re.compile(self.EMAIL_PATTERN)
-            self._ssn_patterns = [
-                re.compile(self.SSN_DASHED_PATTERN),
-                re.compile(self.SSN_CONTINUOUS_PATTERN),
-                re.compile(self.SSN_SPACED_PATTERN),
-            ]
-        except re.error as e:
+            self._email_pattern = re_engine.compile(self.EMAIL_PATTERN)
+            self._ssn_pattern = re_engine.compile(self.SSN_PATTERN)
+            # Byte-pattern twins for ASCII-only text, where the engine can
+            # step through single bytes instead of code points
+            self._email_pattern_bytes = re_engine.compile(self.EMAIL_PATTERN.encode())
+            self._ssn_pattern_bytes = re_engine.compile(self.SSN_PATTERN.encode())
+            # All context keywords in one alternation, found in a single scan
+            self._ssn_context_pattern = re_engine.compile(
+                "|".join(re_engine.escape(keyword) for keyword in sorted(self.SSN_CONTEXT_KEYWORDS))
+            )
+            # Emails and SSNs in one pattern for single-pass redaction
+            self._combined_pattern = re_engine.compile(
+                f"(?P<email>{self.EMAIL_PATTERN})|(?P<ssn>{self.SSN_PATTERN})"
+            )
+            self._ssn_group = self._combined_pattern.groupindex["ssn"]
+        except re_engine.error as e:
             raise InvalidPatternError(f"Failed to compile regex pattern: {e}")
         
         logger.info("SensitiveDataDetector initialized successfully")
     
-    def detect(self, text: Optional[str]) -> List[Finding]:
+    def detect(self, text: Optional[str], include_context: bool = True) -> List[Finding]:
         """
         Detect all sensitive data in the given text.
         
         Args:
             text: The text to scan for sensitive data.
+            include_context: Whether to extract surrounding context for each
+                finding. Callers that only count or locate findings can skip it.
             
         Returns:
             List of Finding objects sorted by position in text.
@@ -100,21 +157,35 @@ class SensitiveDataDetector:
             return []
         
         try:
-            findings = []
-            findings.extend(self._detect_emails(text))
-            findings.extend(self._detect_ssns(text))
+            # Lower-case once for all SSN context checks; str.lower() can change
+            # the length of some non-ASCII text, which would shift offsets
+            text_lower = text.lower()
+            if len(text_lower) != len(text):
+                text_lower = text.translate(_ASCII_LOWER)
+            
+            # ASCII text is scanned as bytes; offsets are identical to the
+            # str offsets, so findings are built straight from text
+            try:
+                ascii_text = text.encode("ascii")
+            except UnicodeEncodeError:
+                ascii_text = None
             
-            # Sort by position for consistent output
-            findings.sort(key=lambda f: f.start_pos)
+            # Each detector yields findings in text order, so a linear merge
+            # replaces a full sort
+            findings = list(heapq.merge(
+                self._detect_emails(text, include_context, ascii_text),
+                self._detect_ssns(text, text_lower, include_context, ascii_text),
+                key=lambda f: f.start_pos,
+            ))
             
-            logger.debug(f"Detected {len(findings)} sensitive items in text")
+            logger.debug("Detected %d sensitive items in text", len(findings))
             return findings
             
         except Exception as e:
             logger.error(f"Unexpected error during detection: {e}")
             raise DetectorError(f"Detection failed: {e}") from e
     
-    def detect_all(self, text: Optional[str]) -> List[Finding]:
+    def detect_all(self, text: Optional[str], include_context: bool = True) -> List[Finding]:
         """
         Detect all types of sensitive data in the given text.
         
@@ -123,6 +194,7 @@ class SensitiveDataDetector:
         
         Args:
             text: The text to scan for sensitive data.
+            include_context: Whether to extract surrounding context for each finding.
             
         Returns:
             List of Finding objects sorted by position in text.
@@ -130,7 +202,194 @@ class SensitiveDataDetector:
         Raises:
             DetectorError: If detection fails unexpectedly.
         """
-        return self.detect(text)
+        return self.detect(text, include_context)
+    
+    def detect_stream(self, chunks: Iterable[str], include_context: bool = True) -> Iterator[Finding]:
+        """
+        Detect sensitive data in text that arrives in chunks.
+        
+        Only a bounded window of text is held at a time, so large documents
+        can be scanned as they are extracted. Findings are yielded in order,
+        with positions relative to the start of the stream, once enough text
+        follows them that further chunks cannot change them.
+        
+        Args:
+            chunks: Consecutive pieces of the text.
+            include_context: Whether to extract surrounding context for each finding.
+            
+        Yields:
+            Finding objects in position order, as detect() would return them
+            for the concatenated text.
+            
+        Raises:
+            DetectorError: If detection fails unexpectedly.
+        """
+        buffer = ""
+        base = 0  # Stream position of buffer[0]
+        settled = 0  # Stream position before which every finding has been yielded
+        
+        for chunk in chunks:
+            buffer += chunk
+            limit = len(buffer) - self.STREAM_OVERLAP
+            if limit <= max(self.STREAM_OVERLAP, settled - base):
+                continue
+            
+            # Findings before the settled point were decided by an earlier scan
+            # that saw more preceding text; matches the trimmed buffer start
+            # creates there (e.g. inside a digit run) are not real
+            ready = []
+            next_settled = base + limit
+            for finding in self.detect(buffer, include_context):
+                start = base + finding.start_pos
+                if start < settled:
+                    continue
+                if finding.end_pos > limit:
+                    # May still change with the next chunk; rescan it, and
+                    # anything else starting there, once more text arrives
+                    next_settled = min(next_settled, start)
+                    break
+                ready.append(finding)
+            
+            for finding in ready:
+                start = base + finding.start_pos
+                if start < next_settled:
+                    yield replace(finding, start_pos=start, end_pos=base + finding.end_pos)
+            
+            # Keep enough text before the settled point for word boundaries,
+            # keywords and context
+            settled = next_settled
+            cut = settled - self.STREAM_OVERLAP - base
+            if cut > 0:
+                buffer = buffer[cut:]
+                base += cut
+        
+        for finding in self.detect(buffer, include_context):
+            if base + finding.start_pos >= settled:
+                yield replace(
+                    finding,
+                    start_pos=base + finding.start_pos,
+                    end_pos=base + finding.end_pos,
+                )
+    
+    def detect_pages(
+        self,
+        pages: Sequence[str],
+        include_context: bool = True
+    ) -> List[Tuple[int, Finding]]:
+        """
+        Detect sensitive data in every page of a document with a single scan.
+        
+        The pages are joined with PAGE_SEPARATOR and scanned once, then each
+        finding is mapped back to its page.
+        
+        Args:
+            pages: Text of each page, in order.
+            include_context: Whether to extract surrounding context for each finding.
+            
+        Returns:
+            (page index, Finding) pairs in document order, with positions and
+            context relative to the page, as detect() would return them per page.
+            
+        Raises:
+            DetectorError: If detection fails unexpectedly.
+        """
+        if not pages:
+            return []
+        
+        # Position of each page in the joined text
+        separator_length = len(self.PAGE_SEPARATOR)
+        page_starts = list(accumulate(
+            (len(page) + separator_length for page in pages[:-1]),
+            initial=0,
+        ))
+        
+        results = []
+        extract_context = self._extract_context
+        
+        # Context is taken from the page itself, so it never shows separators
+        for finding in self.detect(self.PAGE_SEPARATOR.join(pages), include_context=False):
+            index = bisect_right(page_starts, finding.start_pos) - 1
+            page = pages[index]
+            start = finding.start_pos - page_starts[index]
+            end = finding.end_pos - page_starts[index]
+            
+            # Cannot happen with the patterns above; skip rather than misplace
+            if end > len(page):
+                continue
+            
+            results.append((index, replace(
+                finding,
+                start_pos=start,
+                end_pos=end,
+                context=extract_context(page, start, end) if include_context else None,
+            )))
+        
+        return results
+    
+    def redact(self, text: Optional[str], replacement: str = REDACTION_TEXT) -> str:
+        """
+        Replace all sensitive data in the text in a single pass.
+        
+        Unlike detect(), no Finding objects are built; matches are validated
+        and substituted as the combined pattern scans the text.
+        
+        Args:
+            text: The text to redact.
+            replacement: Text substituted for each sensitive value.
+            
+        Returns:
+            Text with every detected email and valid SSN replaced.
+            
+        Raises:
+            DetectorError: If redaction fails unexpectedly.
+        """
+        if not text:
+            return ""
+        
+        try:
+            return self._combined_pattern.sub(
+                lambda match: self._redact_match(match, replacement), text
+            )
+        except Exception as e:
+            logger.error(f"Unexpected error during redaction: {e}")
+            raise DetectorError(f"Redaction failed: {e}") from e
+    
+    @staticmethod
+    def _separator_kind(separator: Union[str, bytes]) -> int:
+        """
+        Classify an SSN separator as none (0), a dash (1) or whitespace (2).
+        
+        Args:
+            separator: Separator captured between two SSN components.
+            
+        Returns:
+            The separator kind.
+        """
+        if not separator:
+            return 0
+        return 1 if separator in ("-", b"-") else 2
+    
+    def _redact_match(self, match: Any, replacement: str) -> str:
+        """
+        Choose the substitution for one match of the combined pattern.
+        
+        Args:
+            match: Match object from the combined email/SSN pattern.
+            replacement: Text substituted for sensitive values.
+            
+        Returns:
+            The replacement, or the original text for SSN candidates with
+            mixed separator kinds.
+        """
+        if match.group("email") is not None:
+            return replacement
+        
+        base = self._ssn_group
+        separator_kind = self._separator_kind
+        if separator_kind(match.group(base + 2)) != separator_kind(match.group(base + 4)):
+            return match.group()
+        
+        return replacement
     
     def _extract_context(self, text: str, start: int, end: int, window: int = 30) -> str:
         """
@@ -155,137 +414,173 @@ class SensitiveDataDetector:
         
         return f"{prefix}{context}{suffix}"
     
-    def _detect_emails(self, text: str) -> List[Finding]:
+    def _detect_emails(
+        self,
+        text: str,
+        include_context: bool = True,
+        ascii_text: Optional[bytes] = None
+    ) -> List[Finding]:
         """
         Detect email addresses in text.
         
         Args:
             text: Text to search for email addresses.
+            include_context: Whether to extract surrounding context.
+            ascii_text: ASCII encoding of text, scanned in its place when given.
             
         Returns:
             List of Finding objects for detected emails.
         """
+        # Every email contains "@"; the substring test runs at memchr speed and
+        # spares the regex a full scan of pages without any
+        if "@" not in text:
+            return []
+        
         findings = []
+        append = findings.append
+        extract_context = self._extract_context
+        debug = logger.isEnabledFor(logging.DEBUG)
         
-        for match in self._email_pattern.finditer(text):
-            email_address = match.group()
+        if ascii_text is not None:
+            matches = self._email_pattern_bytes.finditer(ascii_text)
+        else:
+            matches = self._email_pattern.finditer(text)
+        
+        for match in matches:
+            start, end = match.span()
+            email_address = text[start:end]
             
-            finding = Finding(
+            append(Finding(
                 type=FindingType.EMAIL,
                 value=email_address,
-                start_pos=match.start(),
-                end_pos=match.end(),
+                start_pos=start,
+                end_pos=end,
                 confidence=1.0,
-                context=self._extract_context(text, match.start(), match.end())
-            )
-            findings.append(finding)
+                context=extract_context(text, start, end) if include_context else None
+            ))
             
-            logger.debug(f"Found email: {email_address} at position {match.start()}")
+            if debug:
+                logger.debug("Found email: %s at position %d", email_address, start)
         
         return findings
     
-    def _is_valid_ssn_format(self, area: str, group: str, serial: str) -> bool:
+    def _find_context_keywords(self, text_lower: str) -> Tuple[List[int], List[int]]:
         """
-        Validate SSN components according to SSA rules.
-        
-        Invalid SSNs:
-        - Area numbers: 000, 666, 900-999
-        - Group number: 00
-        - Serial number: 0000
+        Locate every SSN context keyword in the text in a single scan.
         
         Args:
-            area: First 3 digits of SSN.
-            group: Middle 2 digits of SSN.
-            serial: Last 4 digits of SSN.
+            text_lower: Lower-cased full text.
             
         Returns:
-            True if SSN format is valid, False otherwise.
+            Tuple of (start positions, end positions), both ascending.
         """
-        if area in self.INVALID_SSN_AREA_NUMBERS:
-            return False
+        starts = []
+        ends = []
         
-        if group == '00':
-            return False
+        for match in self._ssn_context_pattern.finditer(text_lower):
+            starts.append(match.start())
+            ends.append(match.end())
         
-        if serial == '0000':
-            return False
-        
-        return True
+        return starts, ends
     
-    def _calculate_ssn_confidence(self, text: str, position: int, context_window: int = 50) -> float:
+    def _calculate_ssn_confidence(
+        self,
+        keywords: Tuple[List[int], List[int]],
+        position: int,
+        context_window: int = 50,
+    ) -> float:
         """
         Calculate confidence score for SSN detection based on surrounding context.
         
         Args:
-            text: Full text containing the SSN.
+            keywords: Keyword start and end positions from _find_context_keywords.
             position: Starting position of the SSN.
             context_window: Number of characters to examine before the SSN.
             
         Returns:
             Confidence score between 0.8 and 1.0.
         """
-        context_start = max(0, position - context_window)
-        context_text = text[context_start:position].lower()
+        keyword_starts, keyword_ends = keywords
         
-        # Check for context keywords
-        for keyword in self.SSN_CONTEXT_KEYWORDS:
-            if keyword in context_text:
-                return 1.0
+        # Keyword matches never overlap, so the last one ending before the SSN
+        # is also the one starting latest
+        index = bisect_right(keyword_ends, position)
+        if index and keyword_starts[index - 1] >= position - context_window:
+            return 1.0
         
         # Default confidence without strong context indicators
         return 0.8
     
-    def _detect_ssns(self, text: str) -> List[Finding]:
+    def _detect_ssns(
+        self,
+        text: str,
+        text_lower: str,
+        include_context: bool = True,
+        ascii_text: Optional[bytes] = None
+    ) -> List[Finding]:
         """
         Detect Social Security Numbers in text with validation.
         
         Args:
             text: Text to search for SSNs.
+            text_lower: Lower-cased copy of text, offset-aligned, for context checks.
+            include_context: Whether to extract surrounding context.
+            ascii_text: ASCII encoding of text, scanned in its place when given.
             
         Returns:
             List of Finding objects for detected and validated SSNs.
         """
         findings = []
-        seen_positions: Set[Tuple[int, int]] = set()
-        
-        for pattern in self._ssn_patterns:
-            for match in pattern.finditer(text):
-                position_key = (match.start(), match.end())
-                
-                # Skip if already found at this position
-                if position_key in seen_positions:
-                    continue
-                
-                ssn_value = match.group()
-                area_number = match.group(1)
-                group_number = match.group(2)
-                serial_number = match.group(3)
-                
-                if not self._is_valid_ssn_format(area_number, group_number, serial_number):
-                    continue
-                
-                confidence = self._calculate_ssn_confidence(text, match.start())
-                
-                finding = Finding(
-                    type=FindingType.SSN,
-                    value=ssn_value,
-                    start_pos=match.start(),
-                    end_pos=match.end(),
-                    confidence=confidence,
-                    context=self._extract_context(text, match.start(), match.end())
-                )
-                
-                findings.append(finding)
-                seen_positions.add(position_key)
-                
-                logger.debug(f"Found SSN at position {match.start()} with confidence {confidence}")
+        append = findings.append
+        calculate_confidence = self._calculate_ssn_confidence
+        extract_context = self._extract_context
+        separator_kind = self._separator_kind
+        debug = logger.isEnabledFor(logging.DEBUG)
+        keywords = None
+        
+        if ascii_text is not None:
+            matches = self._ssn_pattern_bytes.finditer(ascii_text)
+        else:
+            matches = self._ssn_pattern.finditer(text)
+        
+        for match in matches:
+            first_separator, second_separator = match.group(2, 4)
+            
+            # Mixed separators such as 123-45 6789 are not SSN formats, but a
+            # space and a line break are both whitespace, as in a wrapped line
+            if separator_kind(first_separator) != separator_kind(second_separator):
+                continue
+            
+            # Keywords are located on the first valid SSN, so SSN-free text
+            # never pays for the scan
+            if keywords is None:
+                keywords = self._find_context_keywords(text_lower)
+            
+            start, end = match.span()
+            confidence = calculate_confidence(keywords, start)
+            
+            append(Finding(
+                type=FindingType.SSN,
+                value=text[start:end],
+                start_pos=start,
+                end_pos=end,
+                confidence=confidence,
+                context=extract_context(text, start, end) if include_context else None
+            ))
+            
+            if debug:
+                logger.debug("Found SSN at position %d with confidence %s", start, confidence)
         
         return findings
 
 
+@lru_cache(maxsize=1)
 def create_detector() -> SensitiveDataDetector:
     """
-    Factory function to create a configured SensitiveDataDetector instance.
+    Factory function to get the shared SensitiveDataDetector instance.
+    
+    The detector holds only compiled patterns, which are safe to use from
+    multiple threads, so one instance is created and reused by every caller.
     
     Returns:
         Configured SensitiveDataDetector instance.
@@ -3,16 +3,18 @@ Logging configuration for the PDF sensitive data scanner.
 """
 
 import logging
+import re
 import sys
 from typing import Dict, Any
 
 
-def setup_logging(log_level: str = "INFO") -> None:
+def setup_logging(log_level: str = "INFO", debug: bool = False) -> None:
     """
     Configure logging for the application.
     
     Args:
         log_level: The logging level (DEBUG, INFO, WARNING, ERROR)
+        debug: Whether to emit per-request uvicorn access logs
     """
     # Define log format - simplified for production
     log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -26,7 +28,7 @@ def setup_logging(log_level: str = "INFO") -> None:
         force=True
     )
     
-    logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
+    logging.getLogger("uvicorn.access").setLevel(logging.INFO if debug else logging.WARNING)
 
     logging.getLogger("sqlalchemy").setLevel(logging.WARNING)
 
@@ -56,6 +58,9 @@ class SummaryLogFilter(logging.Filter):
     Filter to reduce verbosity of certain log messages.
     """
     
+    # Health checks in any case, CORS preflight OPTIONS requests as written
+    _SKIP_PATTERN = re.compile(r"(?i:health)|OPTIONS")
+    
     def filter(self, record: logging.LogRecord) -> bool:
         """
         Filter log records to reduce verbosity.
@@ -70,10 +75,4 @@ class SummaryLogFilter(logging.Filter):
         if record.levelno >= logging.WARNING:
             return True
         
-        if "health" in record.getMessage().lower():
-            return False
-        
-        if "OPTIONS" in record.getMessage():
-            return False
-        
-        return True
+        return self._SKIP_PATTERN.search(record.getMessage()) is None
@@ -6,11 +6,17 @@ PDF processing results and findings in ClickHouse Cloud.
 """
 
 import asyncio
+import importlib
 import logging
 import ssl
 import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, suppress
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from functools import lru_cache, partial
+from operator import itemgetter
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional, Sequence, Tuple, Union
 
 from app.core.config import get_settings
 
@@ -26,6 +32,591 @@ class DatabaseError(Exception):
     pass
 
 
+# Column order of the findings SELECT read by get_findings_columnar
+FINDING_COLUMNS = (
+    "finding_id",
+    "document_id",
+    "finding_type",
+    "value",
+    "page_number",
+    "confidence",
+    "context",
+    "detected_at",
+)
+
+# Columns of the documents table read and written by the client, in the order
+# the row mappers expect; created_at is left to its default
+DOCUMENT_COLUMNS = (
+    "document_id", "filename", "file_size", "page_count",
+    "upload_timestamp", "processing_time_ms", "status", "error_message",
+)
+
+# Explicit projection so ClickHouse reads only the column files that are used;
+# FINAL collapses a document recorded twice whose rows are not merged yet
+DOCUMENT_SELECT = f"SELECT {', '.join(DOCUMENT_COLUMNS)} FROM documents FINAL"
+
+# Same projection plus the size of the filtered set, computed before LIMIT
+DOCUMENT_SELECT_WITH_TOTAL = (
+    f"SELECT {', '.join(DOCUMENT_COLUMNS)}, count() OVER () AS total_count "
+    "FROM documents FINAL"
+)
+
+# Lead time between choosing the cutoff of a new aggregate view and copying the
+# rows before it, so inserts already in flight at creation land on one side only
+VIEW_BACKFILL_DELAY_MS = 2000
+
+# Row layout of the buffered single-row inserts, in flush order; documents go
+# last so a document never becomes visible before the rows written with it
+BUFFERED_INSERT_COLUMNS = {
+    "findings": (
+        "document_id", "finding_type", "value",
+        "page_number", "confidence", "context",
+    ),
+    "metrics": ("document_id", "metric_type", "value", "timestamp"),
+    "documents": DOCUMENT_COLUMNS,
+}
+
+# ClickHouse types of the inserted columns; passing them to clickhouse-connect
+# saves the table description query it otherwise runs before every insert
+INSERT_COLUMN_TYPES = {
+    "documents": {
+        "document_id": "UUID",
+        "filename": "String",
+        "file_size": "UInt64",
+        "page_count": "UInt32",
+        "upload_timestamp": "DateTime('UTC')",
+        "processing_time_ms": "Float32",
+        "status": "String",
+        "error_message": "Nullable(String)",
+    },
+    "findings": {
+        "document_id": "UUID",
+        "finding_type": "String",
+        "value": "String",
+        "page_number": "UInt32",
+        "confidence": "Float32",
+        "context": "Nullable(String)",
+    },
+    "metrics": {
+        "document_id": "UUID",
+        "metric_type": "String",
+        "value": "Float64",
+        "timestamp": "DateTime('UTC')",
+    },
+}
+
+# Per-query settings that let the server coalesce small INSERTs into larger
+# parts; waiting keeps rows visible once the insert returns
+ASYNC_INSERT_SETTINGS = {
+    "async_insert": 1,
+    "wait_for_async_insert": 1,
+    "async_insert_max_data_size": 10_000_000,
+    "async_insert_busy_timeout_ms": 200,
+}
+
+# Metrics are best-effort, so their inserts return before the server flushes
+FIRE_AND_FORGET_INSERT_SETTINGS = {**ASYNC_INSERT_SETTINGS, "wait_for_async_insert": 0}
+FIRE_AND_FORGET_TABLES = frozenset({"metrics"})
+
+
+def format_id(value: Any) -> str:
+    """
+    Render a UUID column value as the 32-character hex ID used by the API.
+    
+    Args:
+        value: UUID object or UUID string returned by the driver.
+        
+    Returns:
+        Lower-case hex string without hyphens.
+    """
+    return str(value).replace("-", "")
+
+
+def row_to_document(row: tuple) -> Dict[str, Any]:
+    """
+    Convert a row selected with ``DOCUMENT_SELECT`` into document metadata.
+    
+    Args:
+        row: Row tuple in ``DOCUMENT_COLUMNS`` order.
+        
+    Returns:
+        Document metadata keyed by column name.
+    """
+    document = dict(zip(DOCUMENT_COLUMNS, row))
+    document["document_id"] = format_id(row[0])
+    return document
+
+
+@lru_cache(maxsize=None)
+def insert_statement(table: str, column_names: Tuple[str, ...]) -> str:
+    """
+    Build the native driver's INSERT ... VALUES prefix once per column layout.
+    
+    Args:
+        table: Target table.
+        column_names: Inserted columns, in row order.
+        
+    Returns:
+        INSERT statement without data, which clickhouse-driver completes
+        with the rows it is given.
+    """
+    return f"INSERT INTO {table} ({', '.join(column_names)}) VALUES"
+
+
+def placeholder(cloud: bool, name: str, type_name: str) -> str:
+    """
+    Render a query parameter in the syntax of the active driver.
+    
+    Args:
+        cloud: Whether the query goes through clickhouse-connect.
+        name: Parameter name.
+        type_name: ClickHouse type, used only by clickhouse-connect.
+        
+    Returns:
+        ``{name:Type}`` for clickhouse-connect, ``%(name)s`` for clickhouse-driver.
+    """
+    return f"{{{name}:{type_name}}}" if cloud else f"%({name})s"
+
+
+# The query builders below depend only on which filters are present, so each
+# shape is built once per driver and then served from the cache
+
+@lru_cache(maxsize=16)
+def build_documents_filter_sql(
+    cloud: bool,
+    has_doc_id: bool,
+    has_start: bool,
+    has_end: bool,
+) -> str:
+    """
+    Build the PREWHERE/WHERE clause shared by the documents queries.
+    
+    Args:
+        cloud: Whether the query goes through clickhouse-connect.
+        has_doc_id: Whether to filter on ``doc_id``.
+        has_start: Whether to filter on ``start_date``.
+        has_end: Whether to filter on ``end_date``.
+        
+    Returns:
+        Clause text, starting with a space.
+    """
+    sql = ""
+    
+    # Filters on the sort key stay in WHERE where the primary index handles them
+    if has_doc_id:
+        sql += f" PREWHERE document_id = {placeholder(cloud, 'doc_id', 'UUID')}"
+    
+    sql += " WHERE 1=1"
+    
+    if has_start:
+        sql += f" AND upload_timestamp >= {placeholder(cloud, 'start_date', 'DateTime')}"
+    
+    if has_end:
+        sql += f" AND upload_timestamp <= {placeholder(cloud, 'end_date', 'DateTime')}"
+    
+    return sql
+
+
+@lru_cache(maxsize=64)
+def build_documents_sql(
+    select: str,
+    cloud: bool,
+    has_doc_id: bool,
+    has_start: bool,
+    has_end: bool,
+    keyset: bool,
+) -> str:
+    """
+    Build a filtered, paginated documents query.
+    
+    Args:
+        select: SELECT ... FROM documents prefix.
+        cloud: Whether the query goes through clickhouse-connect.
+        has_doc_id: Whether to filter on ``doc_id``.
+        has_start: Whether to filter on ``start_date``.
+        has_end: Whether to filter on ``end_date``.
+        keyset: Whether to seek past ``before_timestamp``/``before_document_id``
+            instead of skipping ``offset`` rows.
+        
+    Returns:
+        Query text.
+    """
+    sql = select + build_documents_filter_sql(cloud, has_doc_id, has_start, has_end)
+    
+    if keyset:
+        if cloud:
+            sql += (
+                " AND (upload_timestamp, document_id)"
+                " < ({before_timestamp:DateTime}, {before_document_id:UUID})"
+            )
+        else:
+            sql += (
+                " AND (upload_timestamp, document_id)"
+                " < (%(before_timestamp)s, toUUID(%(before_document_id)s))"
+            )
+    
+    # The sort key matches the table's ORDER BY, so the scan reads in index
+    # order and stops after the limit
+    sql += " ORDER BY upload_timestamp DESC, document_id DESC"
+    sql += f" LIMIT {placeholder(cloud, 'limit', 'UInt32')}"
+    
+    # A keyset cursor already seeks to the page start
+    if not keyset:
+        sql += f" OFFSET {placeholder(cloud, 'offset', 'UInt32')}"
+    
+    return sql
+
+
+@lru_cache(maxsize=16)
+def build_count_documents_sql(
+    cloud: bool,
+    has_doc_id: bool,
+    has_start: bool,
+    has_end: bool,
+) -> str:
+    """
+    Build the documents count query.
+    
+    Args:
+        cloud: Whether the query goes through clickhouse-connect.
+        has_doc_id: Whether to filter on ``doc_id``.
+        has_start: Whether to filter on ``start_date``.
+        has_end: Whether to filter on ``end_date``.
+        
+    Returns:
+        Query text.
+    """
+    return "SELECT COUNT(*) FROM documents FINAL" + build_documents_filter_sql(
+        cloud, has_doc_id, has_start, has_end
+    )
+
+
+@lru_cache(maxsize=8)
+def build_findings_by_document_sql(
+    cloud: bool, has_finding_type: bool, table: str = "findings"
+) -> str:
+    """
+    Build the query for the findings of one document.
+    
+    Args:
+        cloud: Whether the query goes through clickhouse-connect.
+        has_finding_type: Whether to filter on ``finding_type``.
+        table: Table the findings are read from.
+        
+    Returns:
+        Query text.
+    """
+    sql = f"""
+        SELECT finding_id, document_id, finding_type, value,
+               page_number, confidence, context, detected_at
+        FROM {table}
+        WHERE document_id = {placeholder(cloud, 'doc_id', 'UUID')}
+    """
+    
+    if has_finding_type:
+        sql += f" AND finding_type = {placeholder(cloud, 'finding_type', 'String')}"
+    
+    return sql + " ORDER BY page_number, detected_at"
+
+
+class ConnectBackend:
+    """
+    Backend that runs the synchronous drivers in the default executor.
+    
+    The default for reads and writes; the asynch driver replaces it for
+    reads and the connect_async driver for both.
+    """
+    
+    def __init__(self, client: "ClickHouseClient"):
+        """
+        Initialize the backend.
+        
+        Args:
+            client: Client whose synchronous query methods are used.
+        """
+        self._client = client
+    
+    async def fetch(self, query: str, params: Any = None) -> List[tuple]:
+        """Run a SELECT in the executor and return its rows."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._client._execute_query, query, params)
+    
+    async def fetch_columnar(self, query: str, params: Any = None) -> List[List[Any]]:
+        """Run a SELECT in the executor and return one sequence per column."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._client._execute_columnar, query, params)
+    
+    async def execute(self, query: str, params: Any = None) -> Any:
+        """Run a statement such as a single-row INSERT in the executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._client._execute_query, query, params)
+    
+    async def insert(self, table: str, column_names: List[str], columns: List[Sequence[Any]]) -> None:
+        """Insert one list of values per column with a single INSERT in the executor."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._client._insert_columns, table, column_names, columns)
+    
+    async def close(self) -> None:
+        """Nothing to release; connections belong to the client."""
+        pass
+
+
+class AsyncConnectBackend:
+    """
+    Backend using the native async HTTP client of clickhouse-connect.
+    
+    Queries and inserts await the HTTP round trip on the event loop instead
+    of holding an executor thread, so concurrent requests overlap. Queries
+    use the cloud driver's parameter syntax.
+    """
+    
+    def __init__(self, client: "ClickHouseClient"):
+        """
+        Initialize the backend.
+        
+        Args:
+            client: Client providing connection and insert settings.
+        """
+        self._client = client
+        self._async_client: Optional[Any] = None
+    
+    async def connect(self) -> None:
+        """
+        Open the async HTTP client.
+        
+        Raises:
+            DatabaseError: If the async extra of clickhouse-connect is not installed.
+        """
+        try:
+            import clickhouse_connect
+            
+            self._async_client = await clickhouse_connect.get_async_client(
+                **self._client._cloud_client_args()
+            )
+        except ImportError:
+            raise DatabaseError(
+                "clickhouse-connect[async] is required for the connect_async ClickHouse driver"
+            )
+    
+    async def fetch(self, query: str, params: Any = None) -> List[tuple]:
+        """Run a SELECT and return its rows."""
+        result = await self._async_client.query(query, parameters=params)
+        return result.result_rows
+    
+    async def fetch_columnar(self, query: str, params: Any = None) -> List[List[Any]]:
+        """Run a SELECT and return one sequence per column."""
+        result = await self._async_client.query(query, parameters=params)
+        return result.result_columns
+    
+    async def execute(self, query: str, params: Any = None) -> Any:
+        """Run a statement such as a single-row INSERT."""
+        return await self._async_client.command(
+            query,
+            parameters=params,
+            **self._client._query_settings(query)
+        )
+    
+    async def insert(self, table: str, column_names: List[str], columns: List[Sequence[Any]]) -> None:
+        """Insert one list of values per column with a single column-oriented INSERT."""
+        await self._async_client.insert(
+            self._client._insert_table(table),
+            columns,
+            column_names=column_names,
+            database=self._client.database,
+            column_oriented=True,
+            **self._client._insert_column_types(table, column_names),
+            **self._client._insert_settings(table)
+        )
+    
+    async def close(self) -> None:
+        """Close the HTTP session."""
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+
+
+class AsynchBackend:
+    """
+    Read backend speaking the native protocol asynchronously via asynch.
+    
+    Reads yield to the event loop on socket I/O instead of occupying an
+    executor thread. Queries use the native driver's parameter syntax.
+    """
+    
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        database: str,
+        user: str,
+        password: str = "",
+        secure: bool = False,
+        verify: bool = True,
+        pool_size: int = 10,
+        compression: Union[str, bool] = False,
+    ):
+        """
+        Initialize the backend.
+        
+        Args:
+            host: ClickHouse host.
+            port: Native protocol port.
+            database: Database name.
+            user: Username.
+            password: Password.
+            secure: Use secure connection.
+            verify: Verify SSL certificates.
+            pool_size: Maximum number of pooled connections.
+            compression: Block compression method, or False for none.
+        """
+        self.host = host
+        self.port = port
+        self.database = database
+        self.user = user
+        self.password = password
+        self.secure = secure
+        self.verify = verify
+        self.pool_size = pool_size
+        self.compression = compression
+        self._pool: Optional[Any] = None
+    
+    async def connect(self) -> None:
+        """
+        Open the connection pool.
+        
+        Raises:
+            DatabaseError: If asynch is not installed.
+        """
+        try:
+            import asynch
+        except ImportError:
+            raise DatabaseError("asynch is required for the asynch ClickHouse driver")
+        
+        self._pool = await asynch.create_pool(
+            host=self.host,
+            port=self.port,
+            database=self.database,
+            user=self.user,
+            password=self.password,
+            secure=self.secure,
+            verify=self.verify,
+            compression=self.compression,
+            minsize=1,
+            maxsize=self.pool_size,
+        )
+    
+    async def fetch(self, query: str, params: Any = None) -> List[tuple]:
+        """Run a SELECT on a pooled connection and return its rows."""
+        async with self._pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(query, params)
+                return await cursor.fetchall()
+    
+    async def fetch_columnar(self, query: str, params: Any = None) -> List[List[Any]]:
+        """Run a SELECT on a pooled connection and return one sequence per column."""
+        rows = await self.fetch(query, params)
+        return [list(column) for column in zip(*rows)]
+    
+    async def close(self) -> None:
+        """Close the connection pool."""
+        if self._pool is not None:
+            self._pool.close()
+            await self._pool.wait_closed()
+            self._pool = None
+
+
+class NativePoolBackend:
+    """
+    Backend running clickhouse-driver queries on a bounded pool of clients.
+    
+    A clickhouse-driver client owns one connection and refuses simultaneous
+    queries, so concurrent requests each take a client of their own. Calls
+    run on a dedicated executor sized to the pool, so blocking driver calls
+    never wait for or starve the default executor.
+    """
+    
+    def __init__(self, client: "ClickHouseClient", min_size: int = 5, max_size: int = 20):
+        """
+        Initialize the backend.
+        
+        Args:
+            client: Client whose synchronous query methods and native client
+                factory are used.
+            min_size: Connections opened up front.
+            max_size: Maximum number of pooled connections.
+        """
+        self._client = client
+        self.min_size = min(min_size, max_size)
+        self.max_size = max_size
+        self._idle: asyncio.Queue = asyncio.Queue()
+        # One slot per connection in use, so at most max_size are ever open
+        self._slots = asyncio.Semaphore(max_size)
+        self._size = 0
+        self._executor = ThreadPoolExecutor(max_workers=max_size, thread_name_prefix="clickhouse")
+    
+    async def connect(self) -> None:
+        """Open ``min_size`` connections so early requests skip the handshake."""
+        loop = asyncio.get_running_loop()
+        for _ in range(self.min_size):
+            connection = self._client._create_native_client()
+            await loop.run_in_executor(self._executor, connection.connection.force_connect)
+            self._size += 1
+            self._idle.put_nowait(connection)
+    
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Any]:
+        """
+        Borrow an idle client, opening a new one when none is idle.
+        
+        A client whose query raised is disconnected instead of returned, since
+        a network or protocol error can leave it mid-response.
+        """
+        async with self._slots:
+            if self._idle.empty():
+                connection = self._client._create_native_client()
+                self._size += 1
+            else:
+                connection = self._idle.get_nowait()
+            try:
+                yield connection
+            except BaseException:
+                self._size -= 1
+                connection.disconnect()
+                raise
+            self._idle.put_nowait(connection)
+    
+    async def _run(self, method: Any, *args: Any) -> Any:
+        """Run a synchronous client method on a pooled connection."""
+        async with self.acquire() as connection:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, partial(method, *args, connection=connection)
+            )
+    
+    async def fetch(self, query: str, params: Any = None) -> List[tuple]:
+        """Run a SELECT on a pooled connection and return its rows."""
+        return await self._run(self._client._execute_query, query, params)
+    
+    async def fetch_columnar(self, query: str, params: Any = None) -> List[List[Any]]:
+        """Run a SELECT on a pooled connection and return one sequence per column."""
+        return await self._run(self._client._execute_columnar, query, params)
+    
+    async def execute(self, query: str, params: Any = None) -> Any:
+        """Run a statement such as a single-row INSERT on a pooled connection."""
+        return await self._run(self._client._execute_query, query, params)
+    
+    async def insert(self, table: str, column_names: List[str], columns: List[Sequence[Any]]) -> None:
+        """Insert one list of values per column with a single INSERT on a pooled connection."""
+        await self._run(self._client._insert_columns, table, column_names, columns)
+    
+    async def close(self) -> None:
+        """Disconnect the idle clients and stop the executor."""
+        while not self._idle.empty():
+            self._idle.get_nowait().disconnect()
+        self._size = 0
+        self._executor.shutdown(wait=False)
+
+
 class ClickHouseClient:
     """
     Async wrapper for ClickHouse database operations.
@@ -44,6 +635,14 @@ class ClickHouseClient:
         secure: bool = True,
         verify: bool = True,
         use_cloud_driver: bool = None,
+        driver: str = "connect",
+        batch_size: int = 1,
+        flush_interval_ms: int = 500,
+        async_insert: bool = False,
+        compression: str = "none",
+        pool_size: int = 32,
+        findings_buffer: bool = False,
+        pool_min_size: int = 0,
     ):
         """
         Initialize ClickHouse client.
@@ -57,6 +656,17 @@ class ClickHouseClient:
             secure: Use secure connection.
             verify: Verify SSL certificates.
             use_cloud_driver: Force use of cloud driver (auto-detected if None).
+            driver: Query backend, "connect" (executor), "asynch" (native async
+                reads) or "connect_async" (async HTTP reads and writes).
+            batch_size: Rows buffered per table before single-row inserts are
+                flushed as one INSERT; 1 writes every row immediately.
+            flush_interval_ms: Maximum time a buffered row waits for a flush.
+            async_insert: Send INSERTs with server-side async insert settings.
+            compression: Wire compression, "none", "lz4" or "zstd".
+            pool_size: Maximum pooled connections per client.
+            findings_buffer: Write findings through a server-side Buffer table.
+            pool_min_size: Native connections opened at startup; 0 keeps the
+                native driver on a single connection.
         """
         self.host = host
         self.port = port
@@ -71,28 +681,99 @@ class ClickHouseClient:
             self.use_cloud_driver = (port == 8443 or port == 8123) and secure
         else:
             self.use_cloud_driver = use_cloud_driver
+        
+        # asynch speaks the native TCP protocol, so it cannot serve cloud HTTP ports
+        if driver == "asynch" and self.use_cloud_driver:
+            logger.warning("asynch driver requires the native protocol, falling back to connect")
+            driver = "connect"
+        # connect_async speaks HTTP, so it cannot serve native TCP ports
+        if driver == "connect_async" and not self.use_cloud_driver:
+            logger.warning("connect_async driver requires the HTTP protocol, falling back to connect")
+            driver = "connect"
+        self.driver = driver
+        backend = ConnectBackend(self)
+        self._reader: Union[
+            ConnectBackend, AsynchBackend, AsyncConnectBackend, NativePoolBackend
+        ] = backend
+        self._writer: Union[ConnectBackend, AsyncConnectBackend, NativePoolBackend] = backend
             
         self._client: Optional[Any] = None
         self._initialized = False
         self._lock = asyncio.Lock()  # Add lock for thread safety
         
+        # Single-row inserts are buffered per table and written in batches
+        self.batch_size = batch_size
+        self.flush_interval_ms = flush_interval_ms
+        self._insert_buffers: Dict[str, Deque[tuple]] = {
+            table: deque() for table in BUFFERED_INSERT_COLUMNS
+        }
+        # Buffered rows discarded per table because inserts kept failing
+        self.dropped_rows: Dict[str, int] = dict.fromkeys(BUFFERED_INSERT_COLUMNS, 0)
+        self._flush_lock = asyncio.Lock()
+        self._flusher_task: Optional[asyncio.Task] = None
+        self._flush_listeners: List[Callable[[], None]] = []
+        # Set when this process created the findings view and still owes its backfill
+        self._view_backfill_cutoff_ms: Optional[int] = None
+        self._backfill_task: Optional[asyncio.Task] = None
+        self.async_insert = async_insert
+        self.compression = compression
+        self.pool_size = pool_size
+        self.findings_buffer = findings_buffer
+        self.pool_min_size = pool_min_size
+        
         logger.info(f"Using {'cloud' if self.use_cloud_driver else 'native'} driver for ClickHouse connection")
     
+    def _cloud_client_args(self) -> Dict[str, Any]:
+        """Connection arguments shared by the sync and async clickhouse-connect clients."""
+        return {
+            "host": self.host,
+            "port": self.port,
+            "username": self.user,
+            "password": self.password,
+            "database": self.database,
+            "secure": self.secure,
+            "verify": self.verify,
+            # lz4 and zstandard ship with clickhouse-connect
+            "compress": self.compression if self.compression != "none" else False,
+        }
+    
+    def _native_compression(self) -> Union[str, bool]:
+        """
+        Resolve the compression method for the native driver.
+        
+        clickhouse-driver compresses only when clickhouse-cityhash and the
+        codec package are installed; without them the connection falls back
+        to running uncompressed.
+        
+        Returns:
+            Compression method name, or False to disable compression.
+        """
+        if self.compression == "none":
+            return False
+        
+        try:
+            importlib.import_module(f"clickhouse_driver.compression.{self.compression}")
+        except (ImportError, RuntimeError) as e:
+            logger.warning(f"{self.compression} compression unavailable, connecting uncompressed: {e}")
+            return False
+        
+        return self.compression
+    
     def _create_cloud_client(self):
         """Create ClickHouse Cloud client using clickhouse-connect."""
         try:
             import clickhouse_connect
             
-            # ClickHouse Cloud connection parameters
+            from clickhouse_connect.driver.httputil import get_pool_manager
+            
+            # One sessionless client is shared by all executor threads; the
+            # pool keeps TLS connections alive between queries
             client = clickhouse_connect.get_client(
-                host=self.host,
-                port=self.port,
-                username=self.user,
-                password=self.password,
-                database=self.database,
-                secure=self.secure,
-                verify=self.verify,
-                compress=False,  # Disable compression to avoid issues
+                **self._cloud_client_args(),
+                pool_mgr=get_pool_manager(maxsize=self.pool_size),
+                connect_timeout=5,
+                send_receive_timeout=300,
+                autogenerate_session_id=False,
             )
             
             return client
@@ -115,7 +796,7 @@ class ClickHouseClient:
                 'database': self.database,
                 'secure': self.secure,
                 'verify': self.verify,
-                'compression': False,
+                'compression': self._native_compression(),
                 'connect_timeout': 10,
                 'send_receive_timeout': 300,
                 'sync_request_timeout': 5,
@@ -130,34 +811,76 @@ class ClickHouseClient:
         except ImportError:
             raise DatabaseError("clickhouse-driver is required for native ClickHouse connections")
     
-    def _get_new_client(self):
-        """Create a new client connection for thread-safe operations."""
-        if self.use_cloud_driver:
-            return self._create_cloud_client()
-        else:
-            return self._create_native_client()
+    def _insert_settings(self, table: str) -> Dict[str, Any]:
+        """
+        Build driver keyword arguments carrying the settings for an INSERT.
+        
+        Args:
+            table: Target table of the INSERT.
+            
+        Returns:
+            ``{"settings": ...}`` when async inserts are enabled, else empty.
+        """
+        if not self.async_insert:
+            return {}
+        if table in FIRE_AND_FORGET_TABLES:
+            return {"settings": FIRE_AND_FORGET_INSERT_SETTINGS}
+        return {"settings": ASYNC_INSERT_SETTINGS}
+    
+    def _insert_table(self, table: str) -> str:
+        """Return the table that receives INSERTs meant for table."""
+        if table == "findings" and self.findings_buffer:
+            return "findings_buffer"
+        return table
     
-    def _execute_query(self, query: str, params: Any = None) -> Any:
-        """Execute a query using the appropriate driver."""
+    def _findings_read_table(self) -> str:
+        """
+        Return the table findings are read from.
+        
+        Reading through the Buffer table returns rows it has not flushed yet
+        together with those already in findings.
+        """
+        return "findings_buffer" if self.findings_buffer else "findings"
+    
+    def _insert_column_types(self, table: str, column_names: List[str]) -> Dict[str, Any]:
+        """
+        Build clickhouse-connect keyword arguments naming the inserted column types.
+        
+        Args:
+            table: Target table of the INSERT.
+            column_names: Inserted columns, in row order.
+            
+        Returns:
+            ``{"column_type_names": ...}`` when every column is known, else empty
+            so the driver looks the types up itself.
+        """
+        column_types = INSERT_COLUMN_TYPES.get(table, {})
+        if not all(column in column_types for column in column_names):
+            return {}
+        return {"column_type_names": [column_types[column] for column in column_names]}
+    
+    def _query_settings(self, query: str) -> Dict[str, Any]:
+        """Return the INSERT settings for query, or nothing for other statements."""
+        tokens = query.split(None, 3)
+        if len(tokens) < 3 or tokens[0].upper() != "INSERT":
+            return {}
+        return self._insert_settings(tokens[2].split("(")[0])
+    
+    def _execute_query(self, query: str, params: Any = None, connection: Any = None) -> Any:
+        """Execute a query using the appropriate driver, or on a pooled native connection."""
         try:
-            # For cloud driver, create a new client for each query to avoid concurrency issues
+            # The cloud client is sessionless, so executor threads share it and
+            # its pooled keep-alive connections
             if self.use_cloud_driver:
-                client = self._get_new_client()
-                try:
-                    # Ensure we're using the correct database
-                    client.command(f"USE {self.database}")
-                    
-                    if query.strip().upper().startswith(('INSERT', 'CREATE', 'DROP', 'ALTER', 'DELETE', 'UPDATE')):
-                        return client.command(query, parameters=params)
-                    else:
-                        result = client.query(query, parameters=params)
-                        return result.result_rows if hasattr(result, 'result_rows') else result
-                finally:
-                    # Cloud driver doesn't have explicit close
-                    pass
+                if query.strip().upper().startswith(('INSERT', 'CREATE', 'DROP', 'ALTER', 'DELETE', 'UPDATE')):
+                    return self._client.command(query, parameters=params, **self._query_settings(query))
+                else:
+                    result = self._client.query(query, parameters=params)
+                    return result.result_rows if hasattr(result, 'result_rows') else result
             else:
-                # For native driver, use the existing client
-                return self._client.execute(query, params)
+                # For native driver, use the pooled connection or the existing client
+                native = connection or self._client
+                return native.execute(query, params, **self._query_settings(query))
         except Exception as e:
             logger.error(
                 f"Query execution failed: {e}\n"
@@ -167,6 +890,164 @@ class ClickHouseClient:
             )
             raise
     
+    def _execute_columnar(
+        self, query: str, params: Any = None, connection: Any = None
+    ) -> List[List[Any]]:
+        """Execute a SELECT and return one sequence per column instead of rows."""
+        try:
+            if self.use_cloud_driver:
+                return self._client.query(query, parameters=params).result_columns
+            else:
+                return (connection or self._client).execute(query, params, columnar=True)
+        except Exception as e:
+            logger.error(
+                f"Columnar query execution failed: {e}\n"
+                f"Query: {query[:200]}...\n"
+                f"Params: {params}",
+                exc_info=True
+            )
+            raise
+    
+    def _insert_columns(
+        self,
+        table: str,
+        column_names: List[str],
+        columns: List[Sequence[Any]],
+        connection: Any = None,
+    ) -> None:
+        """
+        Insert one list of values per column in a single INSERT using the appropriate driver.
+        
+        Both drivers encode data column by column, so callers hand over
+        columns and neither side builds or transposes per-row tuples.
+        """
+        try:
+            if self.use_cloud_driver:
+                self._client.insert(
+                    self._insert_table(table),
+                    columns,
+                    column_names=column_names,
+                    database=self.database,
+                    column_oriented=True,
+                    **self._insert_column_types(table, column_names),
+                    **self._insert_settings(table)
+                )
+            else:
+                (connection or self._client).execute(
+                    insert_statement(self._insert_table(table), tuple(column_names)),
+                    columns,
+                    columnar=True,
+                    types_check=False,
+                    **self._insert_settings(table)
+                )
+        except Exception as e:
+            logger.error(
+                f"Bulk insert into {table} failed: {e}\n"
+                f"Rows: {len(columns[0]) if columns else 0}",
+                exc_info=True
+            )
+            raise
+    
+    async def _enqueue(self, table: str, *rows: tuple) -> None:
+        """
+        Buffer rows for a batched insert, flushing once the buffer is full.
+        
+        Flush failures are logged rather than raised: the rows stay buffered
+        for the next flush. Rows are only lost once a table's buffer outgrows
+        ten batches, which is logged and counted in ``dropped_rows``.
+        
+        Args:
+            table: Table name, a key of BUFFERED_INSERT_COLUMNS.
+            rows: Column values in BUFFERED_INSERT_COLUMNS order.
+        """
+        buffer = self._insert_buffers[table]
+        buffer.extend(rows)
+        
+        if len(buffer) >= self.batch_size:
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(
+                    f"Insert flush failed, {len(buffer)} {table} rows stay buffered: {e}"
+                )
+    
+    def add_flush_listener(self, listener: Callable[[], None]) -> None:
+        """
+        Register a callback run after each flush that wrote buffered rows.
+        
+        Buffered rows only become visible once flushed, so caches of data they
+        change are expired here rather than when the rows are inserted.
+        
+        Args:
+            listener: Synchronous callable taking no arguments.
+        """
+        self._flush_listeners.append(listener)
+    
+    async def flush(self) -> None:
+        """
+        Write all buffered rows with one INSERT per table.
+        
+        Tables are flushed in BUFFERED_INSERT_COLUMNS order. When a table fails
+        its rows go back to the front of the buffer and the remaining tables
+        wait for the next flush, keeping documents behind their findings.
+        Flush listeners run once any table was written.
+        
+        Raises:
+            DatabaseError: If an insert fails.
+        """
+        async with self._flush_lock:
+            flushed = False
+            try:
+                for table, column_names in BUFFERED_INSERT_COLUMNS.items():
+                    buffer = self._insert_buffers[table]
+                    if not buffer:
+                        continue
+                    
+                    # Swap the rows out so inserts arriving during the write start a new batch
+                    rows = list(buffer)
+                    buffer.clear()
+                    
+                    try:
+                        # Transposed once per flush; the buffer itself stays row-oriented
+                        # so failed rows can be requeued and trimmed one by one
+                        await self._writer.insert(table, list(column_names), list(zip(*rows)))
+                    except Exception as e:
+                        buffer.extendleft(reversed(rows))
+                        self._trim_buffer(table)
+                        raise DatabaseError(f"Failed to flush {table}: {e}")
+                    
+                    flushed = True
+                    logger.debug(f"Flushed {len(rows)} rows into {table}")
+            finally:
+                if flushed:
+                    for listener in self._flush_listeners:
+                        listener()
+    
+    def _trim_buffer(self, table: str) -> None:
+        """Drop the oldest rows of a buffer that outgrew ten batches while inserts fail."""
+        buffer = self._insert_buffers[table]
+        excess = len(buffer) - self.batch_size * 10
+        
+        if excess > 0:
+            for _ in range(excess):
+                buffer.popleft()
+            self.dropped_rows[table] += excess
+            logger.error(
+                f"Dropped {excess} buffered {table} rows after repeated insert failures "
+                f"({self.dropped_rows[table]} dropped in total)"
+            )
+    
+    async def _flush_periodically(self) -> None:
+        """Flush the insert buffers every flush_interval_ms until cancelled."""
+        interval = self.flush_interval_ms / 1000
+        
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Periodic insert flush failed: {e}")
+    
     def _initialize_sync(self) -> None:
         """Synchronous initialization of database connection and tables."""
         # Create client with appropriate driver
@@ -193,72 +1074,219 @@ class ClickHouseClient:
         
         self._create_tables()
     
+    def _create_object(self, label: str, ddl: str) -> None:
+        """Run one CREATE ... IF NOT EXISTS statement and log the outcome."""
+        try:
+            self._execute_query(ddl)
+            logger.info(f"{label.capitalize()} created/verified")
+        except Exception as e:
+            logger.error(f"Error creating {label}: {e}")
+            raise
+    
+    def _create_objects(self, statements: List[Tuple[str, str]]) -> None:
+        """
+        Run independent DDL statements.
+        
+        The pooled HTTP client sends them concurrently so startup waits for one
+        round trip instead of one per statement. The native client owns a single
+        connection that cannot carry simultaneous queries, so it runs them in turn.
+        
+        Args:
+            statements: (label, DDL) pairs with no dependencies between them.
+        """
+        if not self.use_cloud_driver:
+            for label, ddl in statements:
+                self._create_object(label, ddl)
+            return
+        
+        with ThreadPoolExecutor(max_workers=len(statements)) as pool:
+            futures = [pool.submit(self._create_object, label, ddl) for label, ddl in statements]
+        for future in futures:
+            future.result()
+    
     def _create_tables(self) -> None:
         """Create required database tables with ClickHouse Cloud compatible schemas."""
         logger.info("Creating database tables...")
         
-        # Documents table
-        try:
-            self._execute_query("""
-                CREATE TABLE IF NOT EXISTS documents (
-                    document_id UUID,
-                    filename String,
-                    file_size UInt64,
-                    page_count UInt32,
-                    upload_timestamp DateTime('UTC'),
-                    processing_time_ms Float32,
-                    status String,
-                    error_message Nullable(String),
-                    created_at DateTime('UTC') DEFAULT now()
-                ) ENGINE = MergeTree()
-                ORDER BY (upload_timestamp, document_id)
-                SETTINGS index_granularity = 8192
-            """)
-            logger.info("Documents table created/verified")
-        except Exception as e:
-            logger.error(f"Error creating documents table: {e}")
-            raise
+        # A document re-recorded as failed after its success row collapses to
+        # the latest row at merge time; the sort key keeps one row per document.
+        # Monthly partitions let date-range filters skip whole months of parts
+        documents_ddl = """
+            CREATE TABLE IF NOT EXISTS documents (
+                document_id UUID,
+                filename String,
+                file_size UInt64,
+                page_count UInt32,
+                upload_timestamp DateTime('UTC'),
+                processing_time_ms Float32,
+                status String,
+                error_message Nullable(String),
+                created_at DateTime('UTC') DEFAULT now()
+            ) ENGINE = ReplacingMergeTree()
+            PARTITION BY toYYYYMM(upload_timestamp)
+            ORDER BY (upload_timestamp, document_id)
+            SETTINGS index_granularity = 8192
+        """
         
-        # Findings table
-        try:
-            self._execute_query("""
-                CREATE TABLE IF NOT EXISTS findings (
-                    finding_id UUID DEFAULT generateUUIDv4(),
-                    document_id UUID,
-                    finding_type String,
-                    value String,
-                    page_number UInt32,
-                    confidence Float32,
-                    context Nullable(String),
-                    detected_at DateTime('UTC') DEFAULT now()
-                ) ENGINE = MergeTree()
-                ORDER BY (document_id, finding_type, detected_at)
-                SETTINGS index_granularity = 8192
-            """)
-            logger.info("Findings table created/verified")
-        except Exception as e:
-            logger.error(f"Error creating findings table: {e}")
-            raise
+        # finding_type has a handful of values, so it is dictionary-encoded and
+        # gets a projection sorted by type for filters that do not name a document
+        findings_ddl = """
+            CREATE TABLE IF NOT EXISTS findings (
+                finding_id UUID DEFAULT generateUUIDv4(),
+                document_id UUID,
+                finding_type LowCardinality(String),
+                value String CODEC(ZSTD(3)),
+                page_number UInt32,
+                confidence Float32,
+                context Nullable(String),
+                detected_at DateTime('UTC') DEFAULT now(),
+                INDEX idx_finding_type finding_type TYPE set(100) GRANULARITY 4,
+                PROJECTION proj_by_type (
+                    SELECT * ORDER BY (finding_type, document_id)
+                )
+            ) ENGINE = MergeTree()
+            PARTITION BY toYYYYMM(detected_at)
+            ORDER BY (document_id, finding_type, detected_at)
+            SETTINGS index_granularity = 8192
+        """
         
-        # Metrics table with TTL for automatic cleanup
+        # Metrics expire through a TTL for automatic cleanup
+        metrics_ddl = """
+            CREATE TABLE IF NOT EXISTS metrics (
+                metric_id UUID DEFAULT generateUUIDv4(),
+                document_id UUID,
+                metric_type String,
+                value Float64,
+                timestamp DateTime('UTC'),
+                created_at DateTime('UTC') DEFAULT now()
+            ) ENGINE = MergeTree()
+            ORDER BY (timestamp, metric_type)
+            TTL created_at + INTERVAL 30 DAY
+            SETTINGS index_granularity = 8192
+        """
+        
+        # Memory-backed buffer in front of findings that the server flushes in
+        # large blocks; rows show up in findings once flushed, at most 60s later
+        findings_buffer_ddl = """
+            CREATE TABLE IF NOT EXISTS findings_buffer AS findings
+            ENGINE = Buffer(currentDatabase(), findings, 8, 10, 60, 10000, 1000000, 10000000, 100000000)
+        """
+        
+        # The views and the buffer read from the tables, so the tables must exist first
+        self._create_objects([
+            ("documents table", documents_ddl),
+            ("findings table", findings_ddl),
+            ("metrics table", metrics_ddl),
+        ])
+        self._check_documents_engine()
+        
+        if self.findings_buffer:
+            self._create_object("findings buffer table", findings_buffer_ddl)
+        self._view_backfill_cutoff_ms = self._create_findings_by_type_view()
+    
+    def _findings_by_type_view_definition(self) -> Optional[str]:
+        """Return the CREATE statement of the findings view, or None if it does not exist."""
+        result = self._execute_query(
+            """
+            SELECT create_table_query FROM system.tables
+            WHERE database = currentDatabase() AND name = 'findings_by_type_mv'
+            """
+        )
+        return result[0][0] if result else None
+    
+    def _create_findings_by_type_view(self) -> Optional[int]:
+        """
+        Create the per-type findings aggregate if it does not exist yet.
+        
+        POPULATE misses rows inserted while it runs, so the view aggregates only
+        findings detected from a cutoff slightly in the future and the older rows
+        are copied in by _backfill_findings_by_type once the cutoff has passed.
+        
+        Returns:
+            The cutoff in epoch milliseconds when this process created the view
+            and must backfill it; None when the view already existed or a
+            concurrently starting worker created it first.
+        """
+        if self._findings_by_type_view_definition() is not None:
+            return None
+        
+        result = self._execute_query("SELECT toUnixTimestamp64Milli(now64(3))")
+        cutoff_ms = result[0][0] + VIEW_BACKFILL_DELAY_MS
+        cutoff = f"fromUnixTimestamp64Milli(toInt64({cutoff_ms}), 'UTC')"
+        
+        self._create_object("findings by type view", f"""
+            CREATE MATERIALIZED VIEW IF NOT EXISTS findings_by_type_mv
+            ENGINE = AggregatingMergeTree()
+            ORDER BY finding_type
+            AS SELECT
+                finding_type,
+                countState() AS findings,
+                uniqExactState(document_id) AS documents
+            FROM findings
+            WHERE detected_at >= {cutoff}
+            GROUP BY finding_type
+        """)
+        
+        definition = self._findings_by_type_view_definition()
+        if not definition or str(cutoff_ms) not in definition:
+            return None
+        return cutoff_ms
+    
+    async def _backfill_findings_by_type(self, cutoff_ms: int) -> None:
+        """
+        Copy the findings detected before the view cutoff into the view.
+        
+        Runs in the background after startup: findings stamped just before the
+        cutoff may still be in flight until the server clock has passed it.
+        
+        Args:
+            cutoff_ms: Cutoff of the view definition, in epoch milliseconds.
+        """
+        cutoff = f"fromUnixTimestamp64Milli(toInt64({cutoff_ms}), 'UTC')"
         try:
-            self._execute_query("""
-                CREATE TABLE IF NOT EXISTS metrics (
-                    metric_id UUID DEFAULT generateUUIDv4(),
-                    document_id UUID,
-                    metric_type String,
-                    value Float64,
-                    timestamp DateTime('UTC'),
-                    created_at DateTime('UTC') DEFAULT now()
-                ) ENGINE = MergeTree()
-                ORDER BY (timestamp, metric_type)
-                TTL created_at + INTERVAL 30 DAY
-                SETTINGS index_granularity = 8192
+            result = await self._writer.fetch("SELECT toUnixTimestamp64Milli(now64(3))")
+            remaining_ms = cutoff_ms - result[0][0]
+            if remaining_ms > 0:
+                await asyncio.sleep(remaining_ms / 1000)
+            
+            await self._writer.execute(f"""
+                INSERT INTO findings_by_type_mv
+                SELECT
+                    finding_type,
+                    countState() AS findings,
+                    uniqExactState(document_id) AS documents
+                FROM {self._findings_read_table()}
+                WHERE detected_at < {cutoff}
+                GROUP BY finding_type
             """)
-            logger.info("Metrics table created/verified")
+            logger.info("Findings by type view backfilled")
         except Exception as e:
-            logger.error(f"Error creating metrics table: {e}")
-            raise
+            logger.error(
+                f"Failed to backfill findings by type view: {e}; drop "
+                "findings_by_type_mv and restart to rebuild it"
+            )
+    
+    def _check_documents_engine(self) -> None:
+        """
+        Warn when the documents table predates the ReplacingMergeTree engine.
+        
+        CREATE TABLE IF NOT EXISTS leaves an existing table untouched, so a
+        deployment created with the plain MergeTree engine keeps every row of a
+        re-recorded document until it is migrated as described in the README.
+        """
+        result = self._execute_query(
+            """
+            SELECT engine FROM system.tables
+            WHERE database = currentDatabase() AND name = 'documents'
+            """
+        )
+        engine = result[0][0] if result else None
+        if engine != "ReplacingMergeTree":
+            logger.warning(
+                f"documents table uses the {engine} engine; re-recorded documents "
+                "will not be deduplicated until it is migrated to ReplacingMergeTree "
+                "(see 'Upgrading an existing database' in the README)"
+            )
     
     async def initialize(self) -> None:
         """
@@ -269,9 +1297,43 @@ class ClickHouseClient:
         """
         try:
             # Run in executor to avoid blocking async tasks
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             await loop.run_in_executor(None, self._initialize_sync)
+            
+            if self.driver == "asynch":
+                reader = AsynchBackend(
+                    host=self.host,
+                    port=self.port,
+                    database=self.database,
+                    user=self.user,
+                    password=self.password,
+                    secure=self.secure,
+                    verify=self.verify,
+                    pool_size=self.pool_size,
+                    compression=self._native_compression(),
+                )
+                await reader.connect()
+                self._reader = reader
+            elif self.driver == "connect_async":
+                backend = AsyncConnectBackend(self)
+                await backend.connect()
+                self._reader = backend
+                self._writer = backend
+            elif not self.use_cloud_driver and self.pool_min_size > 0:
+                backend = NativePoolBackend(self, self.pool_min_size, self.pool_size)
+                await backend.connect()
+                self._reader = backend
+                self._writer = backend
+            
             self._initialized = True
+            
+            if self.batch_size > 1:
+                self._flusher_task = asyncio.create_task(self._flush_periodically())
+            if self._view_backfill_cutoff_ms is not None:
+                self._backfill_task = asyncio.create_task(
+                    self._backfill_findings_by_type(self._view_backfill_cutoff_ms)
+                )
+            
             logger.info("ClickHouse client initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize ClickHouse: {e}")
@@ -289,12 +1351,7 @@ class ClickHouseClient:
         
         try:
             async with self._lock:
-                loop = asyncio.get_event_loop()
-                result = await loop.run_in_executor(
-                    None,
-                    self._execute_query,
-                    "SELECT 1"
-                )
+                result = await self._reader.fetch("SELECT 1")
                 return len(result) > 0 if result else True
         except Exception as e:
             logger.error(f"Health check failed: {e}")
@@ -308,31 +1365,21 @@ class ClickHouseClient:
             Dictionary with connection test results.
         """
         try:
-            loop = asyncio.get_event_loop()
-            
-            version = await loop.run_in_executor(
-                None,
-                self._execute_query,
-                "SELECT version()"
-            )
-            
-            current_db = await loop.run_in_executor(
-                None,
-                self._execute_query,
-                "SELECT currentDatabase()"
-            )
-            
-            tables = await loop.run_in_executor(
-                None,
-                self._execute_query,
-                "SHOW TABLES"
+            # One round trip; the aggregate always yields exactly one row
+            result = await self._reader.fetch(
+                """
+                SELECT version(), currentDatabase(), groupArray(name)
+                FROM system.tables
+                WHERE database = currentDatabase()
+                """
             )
+            version, current_db, tables = result[0] if result else ("unknown", "unknown", [])
             
             return {
                 "status": "connected",
-                "version": version[0][0] if version else "unknown",
-                "database": current_db[0][0] if current_db else "unknown",
-                "tables": [t[0] for t in tables] if tables else [],
+                "version": version,
+                "database": current_db,
+                "tables": list(tables),
                 "host": self.host,
                 "port": self.port,
                 "secure": self.secure,
@@ -374,14 +1421,17 @@ class ClickHouseClient:
         if not self._initialized:
             raise DatabaseError("Client not initialized")
         
+        if self.batch_size > 1:
+            await self._enqueue("documents", (
+                document_id, filename, file_size, page_count,
+                upload_timestamp, processing_time_ms, status, error_message
+            ))
+            return
+        
         try:
-            loop = asyncio.get_event_loop()
-            
             if self.use_cloud_driver:
                 # clickhouse-connect style
-                await loop.run_in_executor(
-                    None,
-                    self._execute_query,
+                await self._writer.execute(
                     """
                     INSERT INTO documents (
                         document_id, filename, file_size, page_count,
@@ -403,15 +1453,8 @@ class ClickHouseClient:
                 )
             else:
                 # clickhouse-driver style
-                await loop.run_in_executor(
-                    None,
-                    self._execute_query,
-                    """
-                    INSERT INTO documents (
-                        document_id, filename, file_size, page_count,
-                        upload_timestamp, processing_time_ms, status, error_message
-                    ) VALUES
-                    """,
+                await self._writer.execute(
+                    insert_statement("documents", BUFFERED_INSERT_COLUMNS["documents"]),
                     [(
                         document_id, filename, file_size, page_count,
                         upload_timestamp, processing_time_ms, status, error_message
@@ -450,16 +1493,18 @@ class ClickHouseClient:
         if not self._initialized:
             raise DatabaseError("Client not initialized")
         
+        if self.batch_size > 1:
+            await self._enqueue("findings", (
+                document_id, finding_type, value,
+                page_number, confidence, context
+            ))
+            return
+        
         try:
-            loop = asyncio.get_event_loop()
-            
             if self.use_cloud_driver:
                 # clickhouse-connect style
-                await loop.run_in_executor(
-                    None,
-                    self._execute_query,
-                    """
-                    INSERT INTO findings (
+                await self._writer.execute(
+                    "INSERT INTO " + self._insert_table("findings") + """ (
                         document_id, finding_type, value,
                         page_number, confidence, context
                     ) VALUES ({document_id:UUID}, {finding_type:String}, {value:String},
@@ -476,15 +1521,10 @@ class ClickHouseClient:
                 )
             else:
                 # clickhouse-driver style
-                await loop.run_in_executor(
-                    None,
-                    self._execute_query,
-                    """
-                    INSERT INTO findings (
-                        document_id, finding_type, value,
-                        page_number, confidence, context
-                    ) VALUES
-                    """,
+                await self._writer.execute(
+                    insert_statement(
+                        self._insert_table("findings"), BUFFERED_INSERT_COLUMNS["findings"]
+                    ),
                     [(
                         document_id, finding_type, value,
                         page_number, confidence, context
@@ -511,51 +1551,113 @@ class ClickHouseClient:
         Insert performance metric.
         
         Args:
-            document_id: Associated document ID.
-            metric_type: Type of metric.
-            value: Metric value.
-            timestamp: Metric timestamp.
+            document_id: Associated document ID.
+            metric_type: Type of metric.
+            value: Metric value.
+            timestamp: Metric timestamp.
+        """
+        if not self._initialized:
+            raise DatabaseError("Client not initialized")
+        
+        if self.batch_size > 1:
+            await self._enqueue("metrics", (document_id, metric_type, value, timestamp))
+            return
+        
+        try:
+            if self.use_cloud_driver:
+                # clickhouse-connect style
+                await self._writer.execute(
+                    """
+                    INSERT INTO metrics (
+                        document_id, metric_type, value, timestamp
+                    ) VALUES ({document_id:UUID}, {metric_type:String}, 
+                             {value:Float64}, {timestamp:DateTime})
+                    """,
+                    {
+                        "document_id": document_id,
+                        "metric_type": metric_type,
+                        "value": value,
+                        "timestamp": timestamp,
+                    }
+                )
+            else:
+                # clickhouse-driver style
+                await self._writer.execute(
+                    insert_statement("metrics", BUFFERED_INSERT_COLUMNS["metrics"]),
+                    [(document_id, metric_type, value, timestamp)]
+                )
+            
+            logger.debug(f"Inserted metric for document {document_id}")
+        except Exception as e:
+            logger.error(f"Failed to insert metric: {e}")
+            # Don't raise error for metrics - they're not critical
+    
+    async def insert_findings_bulk(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Insert many findings with a single INSERT statement.
+        
+        With insert buffering enabled, a list smaller than a batch joins the
+        buffer instead, so the findings of several documents share one INSERT.
+        
+        Args:
+            rows: Finding dictionaries with document_id, finding_type, value,
+                page_number, confidence and context keys.
+        """
+        if not self._initialized:
+            raise DatabaseError("Client not initialized")
+        
+        if not rows:
+            return
+        
+        column_names = BUFFERED_INSERT_COLUMNS["findings"]
+        
+        if self.batch_size > 1 and len(rows) < self.batch_size:
+            await self._enqueue("findings", *map(itemgetter(*column_names), rows))
+            return
+        
+        # Gather each column straight from the dictionaries, without per-row tuples
+        columns = [list(map(itemgetter(name), rows)) for name in column_names]
+        
+        try:
+            await self._writer.insert("findings", list(column_names), columns)
+            
+            logger.debug(f"Inserted {len(rows)} findings")
+        except Exception as e:
+            logger.error(f"Failed to insert {len(rows)} findings: {e}", exc_info=True)
+            raise DatabaseError(f"Failed to insert findings: {e}")
+    
+    async def insert_metrics_bulk(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Insert many performance metrics with a single INSERT statement.
+        
+        With insert buffering enabled, a list smaller than a batch joins the
+        buffer instead.
+        
+        Args:
+            rows: Metric dictionaries with document_id, metric_type, value
+                and timestamp keys.
         """
         if not self._initialized:
             raise DatabaseError("Client not initialized")
         
+        if not rows:
+            return
+        
+        column_names = BUFFERED_INSERT_COLUMNS["metrics"]
+        
+        if self.batch_size > 1 and len(rows) < self.batch_size:
+            await self._enqueue("metrics", *map(itemgetter(*column_names), rows))
+            return
+        
+        # Gather each column straight from the dictionaries, without per-row tuples
+        columns = [list(map(itemgetter(name), rows)) for name in column_names]
+        
         try:
-            loop = asyncio.get_event_loop()
-            
-            if self.use_cloud_driver:
-                # clickhouse-connect style
-                await loop.run_in_executor(
-                    None,
-                    self._execute_query,
-                    """
-                    INSERT INTO metrics (
-                        document_id, metric_type, value, timestamp
-                    ) VALUES ({document_id:UUID}, {metric_type:String}, 
-                             {value:Float64}, {timestamp:DateTime})
-                    """,
-                    {
-                        "document_id": document_id,
-                        "metric_type": metric_type,
-                        "value": value,
-                        "timestamp": timestamp,
-                    }
-                )
-            else:
-                # clickhouse-driver style
-                await loop.run_in_executor(
-                    None,
-                    self._execute_query,
-                    """
-                    INSERT INTO metrics (
-                        document_id, metric_type, value, timestamp
-                    ) VALUES
-                    """,
-                    [(document_id, metric_type, value, timestamp)]
-                )
+            await self._writer.insert("metrics", list(column_names), columns)
             
-            logger.debug(f"Inserted metric for document {document_id}")
+            logger.debug(f"Inserted {len(rows)} metrics")
         except Exception as e:
-            logger.error(f"Failed to insert metric: {e}")
+            logger.error(f"Failed to insert metrics: {e}")
             # Don't raise error for metrics - they're not critical
     
     async def get_document(self, document_id: str) -> Optional[Dict[str, Any]]:
@@ -571,49 +1673,75 @@ class ClickHouseClient:
         if not self._initialized:
             raise DatabaseError("Client not initialized")
         
+        # document_id is not the sort key prefix, so PREWHERE reads only that
+        # column to find the row before loading the others
         try:
-            loop = asyncio.get_event_loop()
-            
-            if self.use_cloud_driver:
-                result = await loop.run_in_executor(
-                    None,
-                    self._execute_query,
-                    """
-                    SELECT * FROM documents
-                    WHERE document_id = {doc_id:UUID}
-                    """,
-                    {"doc_id": document_id}
-                )
-            else:
-                result = await loop.run_in_executor(
-                    None,
-                    self._execute_query,
-                    """
-                    SELECT * FROM documents
-                    WHERE document_id = %(doc_id)s
-                    FORMAT JSONEachRow
-                    """,
-                    {"doc_id": document_id}
-                )
+            doc_id = placeholder(self.use_cloud_driver, "doc_id", "UUID")
+            result = await self._reader.fetch(
+                f"{DOCUMENT_SELECT} PREWHERE document_id = {doc_id}",
+                {"doc_id": document_id}
+            )
             
             if result:
-                row = result[0]
-                return {
-                    "document_id": str(row[0]),
-                    "filename": row[1],
-                    "file_size": row[2],
-                    "page_count": row[3],
-                    "upload_timestamp": row[4],
-                    "processing_time_ms": row[5],
-                    "status": row[6],
-                    "error_message": row[7],
-                }
+                return row_to_document(result[0])
             return None
             
         except Exception as e:
             logger.error(f"Failed to get document: {e}")
             raise DatabaseError(f"Failed to get document: {e}")
     
+    def _documents_query(
+        self,
+        select: str,
+        limit: int,
+        offset: int,
+        doc_id: Optional[str],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        before_timestamp: Optional[datetime] = None,
+        before_document_id: Optional[str] = None,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Build a filtered, paginated documents query.
+        
+        Args:
+            select: SELECT ... FROM documents prefix.
+            limit: Maximum results.
+            offset: Results offset, ignored with a keyset cursor.
+            doc_id: Optional document ID filter.
+            start_date: Optional start date filter.
+            end_date: Optional end date filter.
+            before_timestamp: Optional keyset cursor upload timestamp.
+            before_document_id: Optional keyset cursor document ID.
+            
+        Returns:
+            Query text and its parameters.
+        """
+        keyset = bool(before_timestamp and before_document_id)
+        query = build_documents_sql(
+            select,
+            self.use_cloud_driver,
+            bool(doc_id),
+            bool(start_date),
+            bool(end_date),
+            keyset,
+        )
+        
+        params = {"limit": limit}
+        if doc_id:
+            params["doc_id"] = doc_id
+        if start_date:
+            params["start_date"] = start_date
+        if end_date:
+            params["end_date"] = end_date
+        if keyset:
+            params["before_timestamp"] = before_timestamp
+            params["before_document_id"] = before_document_id
+        else:
+            params["offset"] = offset
+        
+        return query, params
+    
     async def get_documents(
         self,
         limit: int = 20,
@@ -621,16 +1749,24 @@ class ClickHouseClient:
         doc_id: Optional[str] = None,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
+        before_timestamp: Optional[datetime] = None,
+        before_document_id: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         Get documents with pagination and filtering.
         
+        Passing ``before_timestamp`` and ``before_document_id`` (the sort key of
+        the last row of the previous page) switches to keyset pagination, which
+        seeks past earlier pages instead of scanning and discarding them.
+        
         Args:
             limit: Maximum results.
-            offset: Results offset.
+            offset: Results offset, ignored with a keyset cursor.
             doc_id: Optional document ID filter.
             start_date: Optional start date filter.
             end_date: Optional end date filter.
+            before_timestamp: Optional keyset cursor upload timestamp.
+            before_document_id: Optional keyset cursor document ID.
             
         Returns:
             List of document metadata.
@@ -638,68 +1774,84 @@ class ClickHouseClient:
         if not self._initialized:
             raise DatabaseError("Client not initialized")
         
-        query = "SELECT * FROM documents WHERE 1=1"
-        params = {}
+        query, params = self._documents_query(
+            DOCUMENT_SELECT,
+            limit,
+            offset,
+            doc_id,
+            start_date,
+            end_date,
+            before_timestamp,
+            before_document_id,
+        )
         
-        if doc_id:
-            if self.use_cloud_driver:
-                query += " AND document_id = {doc_id:UUID}"
-            else:
-                query += " AND document_id = %(doc_id)s"
-            params["doc_id"] = doc_id
+        try:
+            result = await self._reader.fetch(query, params)
+            
+            return [row_to_document(row) for row in result]
+            
+        except Exception as e:
+            logger.error(
+                f"Failed to get documents: {e}\n"
+                f"Query params - limit: {limit}, offset: {offset}, doc_id: {doc_id}",
+                exc_info=True
+            )
+            raise DatabaseError(f"Failed to get documents: {e}")
+    
+    async def get_documents_with_count(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        doc_id: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Get a page of documents and the total number matching the filters.
         
-        if start_date:
-            if self.use_cloud_driver:
-                query += " AND upload_timestamp >= {start_date:DateTime}"
-            else:
-                query += " AND upload_timestamp >= %(start_date)s"
-            params["start_date"] = start_date
+        The total comes from a window over the filtered rows, so both arrive in
+        one round trip. The window reads every matching row, so callers that
+        already overlap ``count_documents`` with ``get_documents`` gain little.
         
-        if end_date:
-            if self.use_cloud_driver:
-                query += " AND upload_timestamp <= {end_date:DateTime}"
-            else:
-                query += " AND upload_timestamp <= %(end_date)s"
-            params["end_date"] = end_date
+        Args:
+            limit: Maximum results.
+            offset: Results offset.
+            doc_id: Optional document ID filter.
+            start_date: Optional start date filter.
+            end_date: Optional end date filter.
+            
+        Returns:
+            List of document metadata and the total count.
+        """
+        if not self._initialized:
+            raise DatabaseError("Client not initialized")
         
-        if self.use_cloud_driver:
-            query += " ORDER BY upload_timestamp DESC LIMIT {limit:UInt32} OFFSET {offset:UInt32}"
-        else:
-            query += " ORDER BY upload_timestamp DESC LIMIT %(limit)s OFFSET %(offset)s"
-        params["limit"] = limit
-        params["offset"] = offset
+        query, params = self._documents_query(
+            DOCUMENT_SELECT_WITH_TOTAL,
+            limit,
+            offset,
+            doc_id,
+            start_date,
+            end_date,
+        )
         
         try:
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None,
-                self._execute_query,
-                query,
-                params
-            )
-            
-            documents = []
-            for row in result:
-                documents.append({
-                    "document_id": str(row[0]),
-                    "filename": row[1],
-                    "file_size": row[2],
-                    "page_count": row[3],
-                    "upload_timestamp": row[4],
-                    "processing_time_ms": row[5],
-                    "status": row[6],
-                    "error_message": row[7],
-                })
-            
-            return documents
-            
+            result = await self._reader.fetch(query, params)
         except Exception as e:
             logger.error(
-                f"Failed to get documents: {e}\n"
+                f"Failed to get documents with count: {e}\n"
                 f"Query params - limit: {limit}, offset: {offset}, doc_id: {doc_id}",
                 exc_info=True
             )
             raise DatabaseError(f"Failed to get documents: {e}")
+        
+        if result:
+            return [row_to_document(row) for row in result], result[0][-1]
+        
+        # A page past the end carries no rows to read the total from
+        if offset:
+            return [], await self.count_documents(doc_id, start_date, end_date)
+        return [], 0
     
     async def count_documents(
         self,
@@ -721,38 +1873,23 @@ class ClickHouseClient:
         if not self._initialized:
             raise DatabaseError("Client not initialized")
         
-        query = "SELECT COUNT(*) FROM documents WHERE 1=1"
-        params = {}
+        query = build_count_documents_sql(
+            self.use_cloud_driver,
+            bool(doc_id),
+            bool(start_date),
+            bool(end_date),
+        )
         
+        params = {}
         if doc_id:
-            if self.use_cloud_driver:
-                query += " AND document_id = {doc_id:UUID}"
-            else:
-                query += " AND document_id = %(doc_id)s"
             params["doc_id"] = doc_id
-        
         if start_date:
-            if self.use_cloud_driver:
-                query += " AND upload_timestamp >= {start_date:DateTime}"
-            else:
-                query += " AND upload_timestamp >= %(start_date)s"
             params["start_date"] = start_date
-        
         if end_date:
-            if self.use_cloud_driver:
-                query += " AND upload_timestamp <= {end_date:DateTime}"
-            else:
-                query += " AND upload_timestamp <= %(end_date)s"
             params["end_date"] = end_date
         
         try:
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None,
-                self._execute_query,
-                query,
-                params
-            )
+            result = await self._reader.fetch(query, params)
             
             return result[0][0] if result else 0
             
@@ -778,45 +1915,22 @@ class ClickHouseClient:
         if not self._initialized:
             raise DatabaseError("Client not initialized")
         
-        if self.use_cloud_driver:
-            query = """
-                SELECT finding_id, document_id, finding_type, value,
-                       page_number, confidence, context, detected_at
-                FROM findings
-                WHERE document_id = {doc_id:UUID}
-            """
-        else:
-            query = """
-                SELECT finding_id, document_id, finding_type, value,
-                       page_number, confidence, context, detected_at
-                FROM findings
-                WHERE document_id = %(doc_id)s
-            """
-        params = {"doc_id": document_id}
+        query = build_findings_by_document_sql(
+            self.use_cloud_driver, bool(finding_type), self._findings_read_table()
+        )
         
+        params = {"doc_id": document_id}
         if finding_type:
-            if self.use_cloud_driver:
-                query += " AND finding_type = {finding_type:String}"
-            else:
-                query += " AND finding_type = %(finding_type)s"
             params["finding_type"] = finding_type
         
-        query += " ORDER BY page_number, detected_at"
-        
         try:
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None,
-                self._execute_query,
-                query,
-                params
-            )
+            result = await self._reader.fetch(query, params)
             
             findings = []
             for row in result:
                 findings.append({
-                    "finding_id": str(row[0]),
-                    "document_id": str(row[1]),
+                    "finding_id": format_id(row[0]),
+                    "document_id": format_id(row[1]),
                     "finding_type": row[2],
                     "value": row[3],
                     "page_number": row[4],
@@ -834,7 +1948,128 @@ class ClickHouseClient:
                 exc_info=True
             )
             raise DatabaseError(f"Failed to get findings: {e}")
-    
+
+    async def get_findings_columnar(
+        self,
+        document_ids: List[str],
+        finding_type: Optional[str] = None,
+    ) -> Dict[str, List[Any]]:
+        """
+        Get findings for several documents in a single query, column by column.
+
+        Returning one list per column avoids allocating a dict for every row
+        on large result sets.
+
+        Args:
+            document_ids: Document identifiers.
+            finding_type: Optional finding type filter.
+
+        Returns:
+            Mapping of column name to values, ordered by document, page and
+            detection time. Every list is empty when there are no findings.
+        """
+        if not self._initialized:
+            raise DatabaseError("Client not initialized")
+
+        if not document_ids:
+            return {column: [] for column in FINDING_COLUMNS}
+
+        query = f"""
+            SELECT finding_id, document_id, finding_type, value,
+                   page_number, confidence, context, detected_at
+            FROM {self._findings_read_table()}
+            WHERE document_id IN {placeholder(self.use_cloud_driver, 'doc_ids', 'Array(UUID)')}
+        """
+        if self.use_cloud_driver:
+            params = {"doc_ids": list(document_ids)}
+        else:
+            params = {"doc_ids": tuple(document_ids)}
+
+        if finding_type:
+            if self.use_cloud_driver:
+                query += " AND finding_type = {finding_type:String}"
+            else:
+                query += " AND finding_type = %(finding_type)s"
+            params["finding_type"] = finding_type
+
+        query += " ORDER BY document_id, page_number, detected_at"
+
+        try:
+            result = await self._reader.fetch_columnar(query, params)
+
+            if not result:
+                return {column: [] for column in FINDING_COLUMNS}
+
+            columns = dict(zip(FINDING_COLUMNS, result))
+            columns["finding_id"] = [format_id(v) for v in columns["finding_id"]]
+            columns["document_id"] = [format_id(v) for v in columns["document_id"]]
+
+            return columns
+
+        except Exception as e:
+            logger.error(
+                f"Failed to get findings for {len(document_ids)} documents: {e}\n"
+                f"Finding type filter: {finding_type}",
+                exc_info=True
+            )
+            raise DatabaseError(f"Failed to get findings: {e}")
+
+    async def get_findings_summary(
+        self,
+        document_ids: List[str],
+        finding_type: Optional[str] = None,
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        Count findings by type for several documents using a GROUP BY query.
+
+        Args:
+            document_ids: Document identifiers.
+            finding_type: Optional finding type filter.
+
+        Returns:
+            Mapping of document ID to counts by type plus a "total" entry.
+            Documents without findings are omitted.
+        """
+        if not self._initialized:
+            raise DatabaseError("Client not initialized")
+
+        if not document_ids:
+            return {}
+
+        query = f"""
+            SELECT document_id, finding_type, count()
+            FROM {self._findings_read_table()}
+            WHERE document_id IN {placeholder(self.use_cloud_driver, 'doc_ids', 'Array(UUID)')}
+        """
+        if self.use_cloud_driver:
+            params = {"doc_ids": list(document_ids)}
+        else:
+            params = {"doc_ids": tuple(document_ids)}
+
+        if finding_type:
+            if self.use_cloud_driver:
+                query += " AND finding_type = {finding_type:String}"
+            else:
+                query += " AND finding_type = %(finding_type)s"
+            params["finding_type"] = finding_type
+
+        query += " GROUP BY document_id, finding_type"
+
+        try:
+            result = await self._reader.fetch(query, params)
+
+            summaries: Dict[str, Dict[str, int]] = {}
+            for row in result:
+                summary = summaries.setdefault(format_id(row[0]), {"total": 0})
+                summary[row[1]] = row[2]
+                summary["total"] += row[2]
+
+            return summaries
+
+        except Exception as e:
+            logger.error(f"Failed to get findings summary: {e}", exc_info=True)
+            raise DatabaseError(f"Failed to get findings summary: {e}")
+
     async def get_summary_statistics(self) -> Dict[str, Any]:
         """
         Get overall summary statistics.
@@ -846,77 +2081,109 @@ class ClickHouseClient:
             raise DatabaseError("Client not initialized")
         
         try:
-            loop = asyncio.get_event_loop()
-            
-            # Get document stats
-            doc_stats = await loop.run_in_executor(
-                None,
-                self._execute_query,
+            # One round trip. Document totals come from documents FINAL so a
+            # re-recorded document counts once; the per-type finding counts
+            # merge findings_by_type_mv's states in its sort order and are
+            # summed server-side
+            result = await self._reader.fetch(
                 """
                 SELECT
-                    COUNT(*) as total_documents,
-                    SUM(page_count) as total_pages,
-                    AVG(processing_time_ms) as avg_processing_time,
-                    COUNT(DISTINCT document_id) as unique_documents
-                FROM documents
+                    count() as total_documents,
+                    sum(page_count) as total_pages,
+                    avg(processing_time_ms) as avg_processing_time,
+                    (
+                        SELECT groupArray((finding_type, count))
+                        FROM (
+                            SELECT finding_type, countMerge(findings) as count
+                            FROM findings_by_type_mv
+                            GROUP BY finding_type
+                            ORDER BY finding_type
+                            SETTINGS optimize_aggregation_in_order = 1
+                        )
+                    ) as findings_by_type,
+                    (
+                        SELECT uniqExactMerge(documents)
+                        FROM findings_by_type_mv
+                    ) as documents_with_findings,
+                    arraySum(pair -> pair.2, findings_by_type) as total_findings
+                FROM documents FINAL
                 WHERE status = 'success'
                 """
             )
             
-            findings_stats = await loop.run_in_executor(
-                None,
-                self._execute_query,
-                """
-                SELECT
-                    finding_type,
-                    COUNT(*) as count
-                FROM findings
-                GROUP BY finding_type
-                """
-            )
-            
-            docs_with_findings = await loop.run_in_executor(
-                None,
-                self._execute_query,
-                """
-                SELECT COUNT(DISTINCT document_id)
-                FROM findings
-                """
-            )
+            if result:
+                (
+                    total_documents, total_pages, avg_processing_time,
+                    type_counts, docs_with_findings, total_findings,
+                ) = result[0]
+            else:
+                (
+                    total_documents, total_pages, avg_processing_time,
+                    type_counts, docs_with_findings, total_findings,
+                ) = 0, 0, 0, [], 0, 0
             
-            # Build response
-            stats = {
-                "total_documents": doc_stats[0][0] if doc_stats else 0,
-                "total_pages": doc_stats[0][1] if doc_stats else 0,
-                "avg_processing_time": doc_stats[0][2] if doc_stats else 0,
-                "documents_with_findings": docs_with_findings[0][0] if docs_with_findings else 0,
-                "findings_by_type": {},
-                "total_findings": 0,
+            return {
+                "total_documents": total_documents,
+                "total_pages": total_pages,
+                "avg_processing_time": avg_processing_time,
+                "documents_with_findings": docs_with_findings,
+                "findings_by_type": dict(type_counts),
+                "total_findings": total_findings,
             }
             
-            for row in findings_stats:
-                stats["findings_by_type"][row[0]] = row[1]
-                stats["total_findings"] += row[1]
-            
-            return stats
-            
         except Exception as e:
             logger.error(f"Failed to get summary statistics: {e}")
             raise DatabaseError(f"Failed to get summary statistics: {e}")
     
     async def close(self) -> None:
-        """Close database connection."""
-        if self._client:
-            try:
-                loop = asyncio.get_event_loop()
-                if self.use_cloud_driver:
-                    # clickhouse-connect doesn't have a disconnect method
-                    pass
-                else:
-                    await loop.run_in_executor(None, self._client.disconnect)
-                logger.info("ClickHouse connection closed")
-            except Exception as e:
-                logger.error(f"Error closing connection: {e}")
+        """Flush buffered inserts and close database connection."""
+        if self._backfill_task:
+            # Never cancelled: rows it has not copied would be missing from the view for good
+            await self._backfill_task
+            self._backfill_task = None
+        await self._flush_on_close()
+        await self._close_connections()
+    
+    async def _flush_on_close(self) -> None:
+        """Stop the periodic flusher and write the rows still buffered."""
+        if self._flusher_task:
+            self._flusher_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._flusher_task
+            self._flusher_task = None
+        
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"Error flushing buffered inserts: {e}")
+            
+            # Nothing flushes after close, so whatever is still buffered is lost
+            for table, buffer in self._insert_buffers.items():
+                if buffer:
+                    self.dropped_rows[table] += len(buffer)
+                    logger.error(f"Dropped {len(buffer)} buffered {table} rows on close")
+                    buffer.clear()
+    
+    async def _close_connections(self) -> None:
+        """Close the query backends and the driver connection."""
+        try:
+            await self._reader.close()
+            if self._writer is not self._reader:
+                await self._writer.close()
+        except Exception as e:
+            logger.error(f"Error closing query backend: {e}")
+        
+        if not self._client:
+            return
+        
+        try:
+            # clickhouse-connect doesn't have a disconnect method
+            if not self.use_cloud_driver:
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(None, self._client.disconnect)
+            logger.info("ClickHouse connection closed")
+        except Exception as e:
+            logger.error(f"Error closing connection: {e}")
 
 
 def create_clickhouse_client() -> ClickHouseClient:
@@ -926,7 +2193,9 @@ def create_clickhouse_client() -> ClickHouseClient:
     Returns:
         Configured ClickHouseClient instance.
     """
-    # Get fresh settings instead of using module-level cached settings
+    # get_settings() is cached, so this is a lookup rather than a re-parse of
+    # the environment; it is called here instead of binding settings at import
+    # so a cleared settings cache is picked up by the next client
     current_settings = get_settings()
     return ClickHouseClient(
         host=current_settings.clickhouse_host,
@@ -936,6 +2205,14 @@ def create_clickhouse_client() -> ClickHouseClient:
         password=current_settings.clickhouse_password,
         secure=current_settings.clickhouse_secure,
         verify=current_settings.clickhouse_verify,
+        driver=current_settings.clickhouse_driver,
+        batch_size=current_settings.clickhouse_insert_batch_size,
+        flush_interval_ms=current_settings.clickhouse_flush_interval_ms,
+        async_insert=current_settings.clickhouse_async_insert,
+        compression=current_settings.clickhouse_compression,
+        pool_size=current_settings.clickhouse_pool_size,
+        findings_buffer=current_settings.clickhouse_findings_buffer,
+        pool_min_size=current_settings.clickhouse_pool_min_size,
     )
 
 
@@ -949,14 +2226,18 @@ def get_db_client() -> ClickHouseClient:
     Raises:
         DatabaseError: If client not initialized.
     """
-    global _db_client
-    
-    if not _db_client:
-        # Import here to avoid circular import
-        from app.main import db_client
-        _db_client = db_client
-    
     if not _db_client:
         raise DatabaseError("Database client not initialized")
     
     return _db_client
+
+
+def set_db_client(client: Optional[ClickHouseClient]) -> None:
+    """
+    Set the global database client instance returned by get_db_client.
+    
+    Args:
+        client: Initialized client, or None once it has been closed.
+    """
+    global _db_client
+    _db_client = client
@@ -5,12 +5,17 @@ This module defines Pydantic models for data validation and
 serialization between the API and database layers.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+
+def utc_now() -> datetime:
+    """Return the current time as a timezone-aware UTC datetime."""
+    return datetime.now(timezone.utc)
 
 
 class ProcessingStatus(str, Enum):
@@ -52,6 +57,8 @@ class DocumentCreate(DocumentBase):
 
 class Document(DocumentBase):
     """Complete document model with all fields."""
+    model_config = ConfigDict(from_attributes=True)
+    
     document_id: UUID
     upload_timestamp: datetime
     processing_time_ms: float
@@ -67,24 +74,6 @@ class Document(DocumentBase):
             except ValueError:
                 raise ValueError('Invalid UUID format')
         return v
-    
-    @field_validator('file_size')
-    def validate_file_size(cls, v):
-        """Validate file size is positive."""
-        if v < 0:
-            raise ValueError('File size must be non-negative')
-        return v
-    
-    @field_validator('page_count')
-    def validate_page_count(cls, v):
-        """Validate page count is non-negative."""
-        if v < 0:
-            raise ValueError('Page count must be non-negative')
-        return v
-    
-    class Config:
-        """Pydantic configuration."""
-        from_attributes = True
 
 
 class FindingBase(BaseModel):
@@ -103,34 +92,18 @@ class FindingCreate(FindingBase):
 
 class Finding(FindingBase):
     """Complete finding model with all fields."""
+    model_config = ConfigDict(from_attributes=True)
+    
     finding_id: UUID
     document_id: UUID
     detected_at: datetime
-    
-    @field_validator('page_number')
-    def validate_page_number(cls, v):
-        """Validate page number is positive."""
-        if v < 1:
-            raise ValueError('Page number must be positive')
-        return v
-    
-    @field_validator('confidence')
-    def validate_confidence(cls, v):
-        """Validate confidence is between 0 and 1."""
-        if not 0 <= v <= 1:
-            raise ValueError('Confidence must be between 0 and 1')
-        return v
-    
-    class Config:
-        """Pydantic configuration."""
-        from_attributes = True
 
 
 class MetricBase(BaseModel):
     """Base model for metric data."""
     metric_type: MetricType
     value: float
-    recorded_at: datetime = Field(default_factory=datetime.utcnow)
+    recorded_at: datetime = Field(default_factory=utc_now)
 
 
 class MetricCreate(MetricBase):
@@ -140,12 +113,10 @@ class MetricCreate(MetricBase):
 
 class Metric(MetricBase):
     """Complete metric model with all fields."""
+    model_config = ConfigDict(from_attributes=True)
+    
     metric_id: UUID
     document_id: UUID
-    
-    class Config:
-        """Pydantic configuration."""
-        from_attributes = True
 
 
 class ProcessingRequest(BaseModel):
@@ -250,13 +221,12 @@ class FilterParams(BaseModel):
     end_date: Optional[datetime] = None
     status: Optional[ProcessingStatus] = None
     
-    @field_validator('end_date')
-    def validate_date_range(cls, v: Optional[datetime], values: dict) -> Optional[datetime]:
+    @model_validator(mode='after')
+    def validate_date_range(self) -> 'FilterParams':
         """Ensure end_date is after start_date if both provided."""
-        start_date = values.get('start_date')
-        if start_date and v and v < start_date:
+        if self.start_date and self.end_date and self.end_date < self.start_date:
             raise ValueError('end_date must be after start_date')
-        return v
+        return self
 
 
 class StatisticsResponse(BaseModel):
@@ -269,10 +239,10 @@ class StatisticsResponse(BaseModel):
     documents_with_findings: int = Field(..., ge=0)
     success_rate: float = Field(..., ge=0.0, le=1.0)
     
-    @field_validator('success_rate')
-    def calculate_success_rate(cls, v: float, values: dict) -> float:
+    @model_validator(mode='after')
+    def calculate_success_rate(self) -> 'StatisticsResponse':
         """Calculate success rate if not provided."""
-        if v == 0 and values.get('total_documents', 0) > 0:
+        if self.success_rate == 0 and self.total_documents > 0:
             # This would be calculated from actual data
-            return 1.0
-        return v
+            self.success_rate = 1.0
+        return self
@@ -8,25 +8,38 @@ and includes all API routers for handling PDF uploads and findings retrieval.
 import logging
 import time
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Callable
+from typing import AsyncGenerator
 
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.api.endpoints import findings, upload
 from app.core.config import get_settings
 from app.core.logging_config import setup_logging
-from app.db.clickhouse import ClickHouseClient, create_clickhouse_client
-
-setup_logging(log_level="INFO")
-logger = logging.getLogger(__name__)
+from app.db.clickhouse import ClickHouseClient, create_clickhouse_client, set_db_client
 
 settings = get_settings()
 
+setup_logging(log_level="INFO", debug=settings.debug)
+logger = logging.getLogger(__name__)
+
 # Global database client
 db_client: ClickHouseClient = None
 
+UPLOAD_PATH = "/api/upload"
+SLOW_REQUEST_NS = 5_000_000_000  # requests slower than 5 seconds are logged
+
+# Allowance for the multipart boundaries and part headers around the file
+UPLOAD_BODY_OVERHEAD = 64 * 1024
+
+# Liveness probes within this window of a successful database check reuse it
+_HEALTH_TTL_NS = 2_000_000_000
+_last_health_ok_ns = 0
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator:
@@ -43,15 +56,28 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     try:
         db_client = create_clickhouse_client()
         await db_client.initialize()
+        # Buffered inserts change the statistics only once they are flushed
+        db_client.add_flush_listener(findings.invalidate_stats_cache)
+        set_db_client(db_client)
         logger.info("ClickHouse connection established")
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
         raise
     
+    upload.start_upload_workers(settings.processing_workers)
+    
+    # Build the OpenAPI schema, and with it the JSON schema of every request
+    # and response model, during startup instead of on the first docs request
+    app.openapi()
+    
     yield
     
     logger.info("Shutting down application")
     
+    await upload.stop_upload_workers()
+    
+    set_db_client(None)
+    
     try:
         if db_client:
             await db_client.close()
@@ -60,48 +86,119 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
         logger.error(f"Error during shutdown: {e}")
 
 
-async def log_requests(request: Request, call_next: Callable) -> Response:
+class LoggingASGIMiddleware:
     """
     Middleware to log only errors and summaries.
     
-    Args:
-        request: The incoming request
-        call_next: The next middleware or endpoint handler
-        
-    Returns:
-        The response from the endpoint
+    Implemented as plain ASGI rather than ``@app.middleware("http")``, which
+    would pipe every response body through an extra memory stream; here only
+    ``send`` is wrapped, to note the status code as the response starts.
     """
-    start_time = time.time()
     
-    # Skip logging for health checks
-    if "health" in request.url.path:
-        return await call_next(request)
+    def __init__(self, app: ASGIApp):
+        """
+        Initialize the middleware.
+        
+        Args:
+            app: The next middleware or application in the stack
+        """
+        self.app = app
     
-    try:
-        response = await call_next(request)
-        duration = time.time() - start_time
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle one ASGI connection, logging failed, slow and upload requests.
+        
+        Args:
+            scope: Connection scope
+            receive: Callable receiving client messages
+            send: Callable sending messages to the client
+        """
+        path = scope.get("path", "")
+        
+        # Skip logging for health checks and non-HTTP traffic
+        if scope["type"] != "http" or "health" in path:
+            await self.app(scope, receive, send)
+            return
+        
+        method = scope["method"]
+        status_code = 500
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+        
+        start_ns = time.perf_counter_ns()
         
-        # Only log errors or slow requests
-        if response.status_code >= 400:
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            elapsed_ns = time.perf_counter_ns() - start_ns
             logger.error(
-                f"{request.method} {request.url.path} - {response.status_code} ({duration:.1f}s)"
+                "Request failed: %s %s - %s (%.1fs)",
+                method, path, e, elapsed_ns / 1e9,
+                exc_info=True,
             )
-        elif duration > 5.0:  # Log slow requests (> 5 seconds)
+            raise
+        
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        
+        # Only log errors or slow requests; durations are formatted only when logged
+        if status_code >= 400:
+            logger.error("%s %s - %d (%.1fs)", method, path, status_code, elapsed_ns / 1e9)
+        elif elapsed_ns > SLOW_REQUEST_NS:
             logger.warning(
-                f"Slow request: {request.method} {request.url.path} - {response.status_code} ({duration:.1f}s)"
+                "Slow request: %s %s - %d (%.1fs)",
+                method, path, status_code, elapsed_ns / 1e9,
             )
-        elif request.method == "POST" and request.url.path == "/api/upload":
-            logger.info(f"PDF uploaded successfully ({duration:.1f}s)")
-            
-        return response
+        elif path == UPLOAD_PATH and method == "POST":
+            logger.info("PDF uploaded successfully (%.1fs)", elapsed_ns / 1e9)
+
+
+class UploadSizeLimitMiddleware:
+    """
+    Refuse uploads whose declared body size exceeds the upload limit.
+    
+    FastAPI parses the whole multipart body before the endpoint runs, so the
+    Content-Length header is checked here, before any of the body is read.
+    Bodies without the header are still limited by the endpoint after parsing.
+    """
+    
+    def __init__(self, app: ASGIApp, max_body_size: int):
+        """
+        Initialize the middleware.
         
-    except Exception as e:
-        duration = time.time() - start_time
-        logger.error(
-            f"Request failed: {request.method} {request.url.path} - {str(e)} ({duration:.1f}s)",
-            exc_info=True
-        )
-        raise
+        Args:
+            app: The next middleware or application in the stack
+            max_body_size: Largest accepted upload request body in bytes
+        """
+        self.app = app
+        self.max_body_size = max_body_size
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle one ASGI connection, answering 413 for oversized upload bodies.
+        
+        Args:
+            scope: Connection scope
+            receive: Callable receiving client messages
+            send: Callable sending messages to the client
+        """
+        if scope["type"] == "http" and scope["method"] == "POST" and scope["path"] == UPLOAD_PATH:
+            content_length = Headers(scope=scope).get("content-length", "")
+            if content_length.isdigit() and int(content_length) > self.max_body_size:
+                response = ORJSONResponse(
+                    {
+                        "detail": f"Request body of {content_length} bytes exceeds "
+                        f"maximum {self.max_body_size} bytes",
+                    },
+                    status_code=413,
+                )
+                await response(scope, receive, send)
+                return
+        
+        await self.app(scope, receive, send)
 
 
 def create_application() -> FastAPI:
@@ -119,11 +216,15 @@ def create_application() -> FastAPI:
         redoc_url="/api/redoc",
         openapi_url="/api/openapi.json",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
     
-    @app.middleware("http")
-    async def request_logger(request: Request, call_next: Callable) -> Response:
-        return await log_requests(request, call_next)
+    app.add_middleware(
+        UploadSizeLimitMiddleware,
+        max_body_size=settings.max_upload_size + UPLOAD_BODY_OVERHEAD,
+    )
+    
+    app.add_middleware(LoggingASGIMiddleware)
     
     app.add_middleware(
         CORSMiddleware,
@@ -161,14 +262,17 @@ def create_application() -> FastAPI:
     @app.get("/api/health", tags=["health"])
     async def health_check():
         """Detailed health check including database status."""
+        global _last_health_ok_ns
         db_status = "healthy"
         
-        try:
-            if db_client:
-                await db_client.health_check()
-        except Exception as e:
-            logger.error(f"Database health check failed: {e}")
-            db_status = "unhealthy"
+        now_ns = time.monotonic_ns()
+        if now_ns - _last_health_ok_ns >= _HEALTH_TTL_NS:
+            try:
+                if db_client and await db_client.health_check():
+                    _last_health_ok_ns = now_ns
+            except Exception as e:
+                logger.error(f"Database health check failed: {e}")
+                db_status = "unhealthy"
         
         return {
             "status": "healthy",
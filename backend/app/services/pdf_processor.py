@@ -7,10 +7,15 @@ with the sensitive data detector to identify PII in PDF documents.
 
 import io
 import logging
+import os
+import re
 import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
-from typing import BinaryIO, Dict, List, Optional, Union, Tuple
+from typing import BinaryIO, Dict, List, Optional, Union
 
 import pypdf
 import pdfplumber
@@ -20,6 +25,46 @@ from app.core.detector import Finding, FindingType, create_detector, SensitiveDa
 
 logger = logging.getLogger(__name__)
 
+# PDF input accepted by the processor: raw bytes or a seekable binary stream
+PDFSource = Union[bytes, BinaryIO]
+
+# Below this many pages, starting worker processes costs more than it saves
+PARALLEL_EXTRACTION_MIN_PAGES = 4
+
+# Bytes at each end of a PDF searched for the trailer's /Encrypt entry. The
+# trailer is at the end of the file; linearized files repeat it at the start
+ENCRYPTION_SCAN_BYTES = 64 * 1024
+
+# The /Encrypt name, not a longer name such as /EncryptMetadata
+_ENCRYPT_KEY = re.compile(rb"/Encrypt(?![A-Za-z0-9])")
+
+
+def _extract_page_text(page: "pdfplumber.page.Page", page_num: int) -> str:
+    """Extract one page's text, treating extraction failures as an empty page."""
+    try:
+        return page.extract_text() or ""
+    except Exception as e:
+        logger.warning(f"Failed to extract page {page_num + 1}: {e}")
+        return ""
+
+
+def _extract_page_range(pdf_bytes: bytes, start: int, stop: int) -> List[str]:
+    """
+    Extract text for pages ``start`` to ``stop - 1`` in a worker process.
+    
+    Module-level so it can be pickled; each worker opens its own copy of the PDF.
+    
+    Args:
+        pdf_bytes: Raw PDF bytes.
+        start: Index of the first page to extract.
+        stop: Index one past the last page to extract.
+        
+    Returns:
+        Text of each page in the range, in page order.
+    """
+    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        return [_extract_page_text(pdf.pages[page_num], page_num) for page_num in range(start, stop)]
+
 
 class PDFProcessingError(Exception):
     """Base exception for PDF processing errors."""
@@ -36,7 +81,7 @@ class PDFSizeLimitError(PDFProcessingError):
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PageFinding(Finding):
     """Finding with additional page number information."""
     page_number: int = 1
@@ -50,10 +95,15 @@ class PDFProcessingResult:
     page_count: int
     file_size: int
     findings: List[Finding]
-    extracted_text: str
+    page_texts: List[str]
     processing_time_ms: float
     error_message: Optional[str] = None
     
+    @cached_property
+    def extracted_text(self) -> str:
+        """Full document text, joined from the page texts on first access."""
+        return "\n".join(self.page_texts)
+    
     def get_summary(self) -> Dict[str, Union[int, float, Dict[str, int]]]:
         """
         Generate summary statistics for the processing result.
@@ -61,19 +111,15 @@ class PDFProcessingResult:
         Returns:
             Dictionary containing summary statistics.
         """
-        findings_by_type = {}
-        pages_with_findings = set()
-        
-        for finding in self.findings:
-            finding_type = finding.type.value
-            findings_by_type[finding_type] = findings_by_type.get(finding_type, 0) + 1
-            
-            if hasattr(finding, 'page_number'):
-                pages_with_findings.add(finding.page_number)
+        findings_by_type = Counter(finding.type.value for finding in self.findings)
+        pages_with_findings = {
+            finding.page_number for finding in self.findings
+            if hasattr(finding, 'page_number')
+        }
         
         return {
             'total_findings': len(self.findings),
-            'findings_by_type': findings_by_type,
+            'findings_by_type': dict(findings_by_type),
             'pages_with_findings': len(pages_with_findings),
             'file_size_kb': round(self.file_size / 1024, 2),
             'processing_time_ms': self.processing_time_ms,
@@ -92,39 +138,106 @@ class PDFProcessor:
     
     DEFAULT_MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB
     
-    def __init__(self, max_file_size: int = DEFAULT_MAX_FILE_SIZE):
+    def __init__(
+        self,
+        max_file_size: int = DEFAULT_MAX_FILE_SIZE,
+        num_workers: int = min(os.cpu_count() or 1, 4),
+    ):
         """
         Initialize PDF processor with configuration.
         
         Args:
             max_file_size: Maximum allowed file size in bytes.
+            num_workers: Processes used to extract text from large PDFs; 1 disables them.
         """
         self.detector = create_detector()
         self.max_file_size = max_file_size
+        self.num_workers = num_workers
         logger.info(f"PDFProcessor initialized with max file size: {max_file_size} bytes")
     
-    def _is_pdf_encrypted(self, pdf_data: bytes) -> bool:
+    @staticmethod
+    def _as_stream(pdf_data: PDFSource) -> BinaryIO:
+        """
+        Return a seekable stream positioned at the start of the PDF data.
+        
+        Args:
+            pdf_data: Raw PDF bytes or a seekable binary stream.
+            
+        Returns:
+            Binary stream rewound to offset 0.
+        """
+        if isinstance(pdf_data, (bytes, bytearray)):
+            return io.BytesIO(pdf_data)
+        
+        pdf_data.seek(0)
+        return pdf_data
+    
+    @staticmethod
+    def _get_size(pdf_data: PDFSource) -> int:
+        """
+        Get the size of the PDF data in bytes without reading it.
+        
+        Args:
+            pdf_data: Raw PDF bytes or a seekable binary stream.
+            
+        Returns:
+            Size in bytes.
+        """
+        if isinstance(pdf_data, (bytes, bytearray)):
+            return len(pdf_data)
+        
+        return pdf_data.seek(0, io.SEEK_END)
+    
+    @staticmethod
+    def _as_bytes(pdf_data: PDFSource) -> bytes:
+        """
+        Return the PDF data as bytes, reading streams from the start.
+        
+        Args:
+            pdf_data: Raw PDF bytes or a seekable binary stream.
+            
+        Returns:
+            Raw PDF bytes.
+        """
+        if isinstance(pdf_data, bytes):
+            return pdf_data
+        
+        if isinstance(pdf_data, bytearray):
+            return bytes(pdf_data)
+        
+        pdf_data.seek(0)
+        return pdf_data.read()
+    
+    def _is_pdf_encrypted(self, pdf_data: PDFSource) -> bool:
         """
         Check if PDF is encrypted/password-protected.
         
+        Only the trailer regions at the start and end of the file are scanned
+        for an /Encrypt entry, rather than parsing the cross-reference table.
+        
         Args:
-            pdf_data: Raw PDF data.
+            pdf_data: Raw PDF bytes or a seekable binary stream.
             
         Returns:
             True if PDF is encrypted, False otherwise.
         """
-        try:
-            pdf_stream = io.BytesIO(pdf_data)
-            pdf_reader = pypdf.PdfReader(pdf_stream)
-            return pdf_reader.is_encrypted
-        except Exception:
-            return False
+        if isinstance(pdf_data, (bytes, bytearray)):
+            head = pdf_data[:ENCRYPTION_SCAN_BYTES]
+            tail = pdf_data[-ENCRYPTION_SCAN_BYTES:]
+        else:
+            size = self._get_size(pdf_data)
+            pdf_data.seek(0)
+            head = pdf_data.read(ENCRYPTION_SCAN_BYTES)
+            pdf_data.seek(max(0, size - ENCRYPTION_SCAN_BYTES))
+            tail = pdf_data.read()
+        
+        return _ENCRYPT_KEY.search(tail) is not None or _ENCRYPT_KEY.search(head) is not None
     
-    def _extract_with_pypdf2(self, pdf_data: bytes) -> Tuple[str, List[str]]:
+    def _extract_with_pypdf2(self, pdf_data: PDFSource) -> List[str]:
         """Extract text using pypdf as fallback method."""
         page_texts = []
         
-        pdf_stream = io.BytesIO(pdf_data)
+        pdf_stream = self._as_stream(pdf_data)
         pdf_reader = pypdf.PdfReader(pdf_stream)
         
         for page_num in range(len(pdf_reader.pages)):
@@ -136,34 +249,63 @@ class PDFProcessor:
                 logger.warning(f"Failed to extract page {page_num + 1}: {e}")
                 page_texts.append("")
         
-        full_text = "\n".join(page_texts)
-        return full_text, page_texts
+        return page_texts
     
-    def _extract_with_pdfplumber(self, pdf_data: bytes) -> Tuple[str, List[str]]:
-        """Extract text using pdfplumber for better layout handling."""
-        page_texts = []
+    def _extract_with_pdfplumber(self, pdf_data: PDFSource) -> List[str]:
+        """
+        Extract text using pdfplumber for better layout handling.
+        
+        PDFs with at least PARALLEL_EXTRACTION_MIN_PAGES pages are split into
+        contiguous page ranges extracted by up to ``num_workers`` processes.
+        """
+        with pdfplumber.open(self._as_stream(pdf_data)) as pdf:
+            page_count = len(pdf.pages)
+            
+            if self.num_workers < 2 or page_count < PARALLEL_EXTRACTION_MIN_PAGES:
+                page_texts = [
+                    _extract_page_text(page, page_num)
+                    for page_num, page in enumerate(pdf.pages)
+                ]
+            else:
+                page_texts = None
+        
+        if page_texts is None:
+            page_texts = self._extract_pages_in_parallel(self._as_bytes(pdf_data), page_count)
         
-        with pdfplumber.open(io.BytesIO(pdf_data)) as pdf:
-            for page_num, page in enumerate(pdf.pages):
-                try:
-                    text = page.extract_text() or ""
-                    page_texts.append(text)
-                except Exception as e:
-                    logger.warning(f"Failed to extract page {page_num + 1}: {e}")
-                    page_texts.append("")
-        
-        full_text = "\n".join(page_texts)
-        return full_text, page_texts
+        return page_texts
     
-    def _extract_text_from_pdf(self, pdf_data: bytes) -> Tuple[str, List[str]]:
+    def _extract_pages_in_parallel(self, pdf_bytes: bytes, page_count: int) -> List[str]:
+        """
+        Extract page texts across worker processes.
+        
+        Args:
+            pdf_bytes: Raw PDF bytes.
+            page_count: Number of pages in the PDF.
+            
+        Returns:
+            List of page texts in page order.
+        """
+        workers = min(self.num_workers, page_count)
+        bounds = [page_count * i // workers for i in range(workers + 1)]
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = executor.map(
+                _extract_page_range,
+                [pdf_bytes] * workers,
+                bounds[:-1],
+                bounds[1:],
+            )
+            return [text for chunk in chunks for text in chunk]
+    
+    def _extract_text_from_pdf(self, pdf_data: PDFSource) -> List[str]:
         """
         Extract text content from PDF using multiple methods for reliability.
         
         Args:
-            pdf_data: Raw PDF data.
+            pdf_data: Raw PDF bytes or a seekable binary stream.
             
         Returns:
-            Tuple of (full_text, list_of_page_texts).
+            List of page texts in page order.
         """
         # Try pdfplumber first (better for complex layouts)
         try:
@@ -182,43 +324,33 @@ class PDFProcessor:
         """
         Detect sensitive data in each page and track page numbers.
         
+        All pages are scanned in one detector pass rather than one call per page.
+        
         Args:
             page_texts: List of text content for each page.
             
         Returns:
             List of PageFinding objects with page numbers.
         """
-        all_findings = []
-        
-        for page_num, page_text in enumerate(page_texts, start=1):
-            if not page_text.strip():
-                continue
-            
-            # Detect sensitive data in this page
-            page_findings = self.detector.detect(page_text)
-            
-            # Convert to PageFinding with page number
-            for finding in page_findings:
-                page_finding = PageFinding(
-                    type=finding.type,
-                    value=finding.value,
-                    start_pos=finding.start_pos,
-                    end_pos=finding.end_pos,
-                    confidence=finding.confidence,
-                    context=finding.context,
-                    redaction_text=finding.redaction_text,
-                    page_number=page_num
-                )
-                all_findings.append(page_finding)
-        
-        return all_findings
+        return [
+            PageFinding(
+                type=finding.type,
+                value=finding.value,
+                start_pos=finding.start_pos,
+                end_pos=finding.end_pos,
+                confidence=finding.confidence,
+                context=finding.context,
+                page_number=page_index + 1
+            )
+            for page_index, finding in self.detector.detect_pages(page_texts)
+        ]
     
-    def process_pdf(self, pdf_data: bytes, filename: str = "unnamed.pdf") -> PDFProcessingResult:
+    def process_pdf(self, pdf_data: PDFSource, filename: str = "unnamed.pdf") -> PDFProcessingResult:
         """
         Process PDF data to extract text and detect sensitive information.
         
         Args:
-            pdf_data: Raw PDF file data.
+            pdf_data: Raw PDF bytes or a seekable binary stream.
             filename: Name of the PDF file for reference.
             
         Returns:
@@ -232,7 +364,7 @@ class PDFProcessor:
         start_time = time.time()
         
         # Validate file size
-        file_size = len(pdf_data)
+        file_size = self._get_size(pdf_data)
         if file_size > self.max_file_size:
             raise PDFSizeLimitError(
                 f"File {filename} size ({file_size} bytes) exceeds maximum size ({self.max_file_size} bytes)"
@@ -243,7 +375,7 @@ class PDFProcessor:
             raise PDFProcessingError(f"Cannot process password-protected PDF: {filename}")
         
         try:
-            extracted_text, page_texts = self._extract_text_from_pdf(pdf_data)
+            page_texts = self._extract_text_from_pdf(pdf_data)
             page_count = len(page_texts)
             
             findings = self._detect_sensitive_data_by_page(page_texts)
@@ -260,7 +392,7 @@ class PDFProcessor:
                 page_count=page_count,
                 file_size=file_size,
                 findings=findings,
-                extracted_text=extracted_text,
+                page_texts=page_texts,
                 processing_time_ms=processing_time_ms
             )
             
@@ -290,10 +422,10 @@ class PDFProcessor:
         if not file_path.is_file():
             raise PDFProcessingError(f"Not a file: {file_path}")
         
+        # Parse from the open file; the parsers read pages on demand instead
+        # of the whole file being copied into memory first
         with open(file_path, 'rb') as pdf_file:
-            pdf_data = pdf_file.read()
-        
-        return self.process_pdf(pdf_data, filename=file_path.name)
+            return self.process_pdf(pdf_file, filename=file_path.name)
     
     def process_pdf_from_stream(
         self, 
@@ -303,6 +435,8 @@ class PDFProcessor:
         """
         Process PDF from file-like object.
         
+        Seekable streams are parsed in place; others are read into memory first.
+        
         Args:
             stream: File-like object containing PDF data.
             filename: Name for reference.
@@ -310,16 +444,22 @@ class PDFProcessor:
         Returns:
             PDFProcessingResult containing findings and metadata.
         """
-        pdf_data = stream.read()
-        return self.process_pdf(pdf_data, filename=filename)
+        if not stream.seekable():
+            return self.process_pdf(stream.read(), filename=filename)
+        
+        return self.process_pdf(stream, filename=filename)
 
 
-def create_pdf_processor(max_file_size: Optional[int] = None) -> PDFProcessor:
+def create_pdf_processor(
+    max_file_size: Optional[int] = None,
+    num_workers: Optional[int] = None,
+) -> PDFProcessor:
     """
     Factory function to create a configured PDFProcessor instance.
     
     Args:
         max_file_size: Maximum allowed file size in bytes.
+        num_workers: Processes used for page extraction; defaults to the processor's default.
         
     Returns:
         Configured PDFProcessor instance.
@@ -327,7 +467,10 @@ def create_pdf_processor(max_file_size: Optional[int] = None) -> PDFProcessor:
     if max_file_size is None:
         max_file_size = PDFProcessor.DEFAULT_MAX_FILE_SIZE
     
-    return PDFProcessor(max_file_size=max_file_size)
+    if num_workers is None:
+        return PDFProcessor(max_file_size=max_file_size)
+    
+    return PDFProcessor(max_file_size=max_file_size, num_workers=num_workers)
 
 
 if __name__ == "__main__":
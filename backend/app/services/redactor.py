@@ -6,6 +6,7 @@ data is blacked out while maintaining the original document structure.
 """
 
 import logging
+from collections import Counter, defaultdict
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
@@ -90,7 +91,9 @@ class PDFRedactor:
                         f"(document has {pdf_document.page_count} pages)"
                     )
             
-            redacted_data = pdf_document.tobytes()
+            # Drop unreferenced objects (including content replaced by the
+            # redactions) and compress streams
+            redacted_data = pdf_document.tobytes(garbage=4, deflate=True, clean=True)
             
             if output_path:
                 self._save_redacted_pdf(redacted_data, output_path)
@@ -189,40 +192,28 @@ class PDFRedactor:
             - by_page: Count of redactions by page number
             - unique_values: Count of unique values by type
         """
-        stats = {
-            "total_redactions": len(findings),
-            "by_type": {},
-            "by_page": {},
-            "unique_values": {}
-        }
+        by_type = Counter()
+        by_page = Counter()
         
         # Track unique values per type for accurate counting
-        unique_values_by_type: Dict[str, Set[str]] = {}
+        unique_values_by_type: Dict[str, Set[str]] = defaultdict(set)
         
         for finding in findings:
             finding_type = finding.type.value
-            
-            # Count by type
-            stats["by_type"][finding_type] = (
-                stats["by_type"].get(finding_type, 0) + 1
-            )
-            
-            # Count by page
-            page = finding.page_number
-            stats["by_page"][page] = stats["by_page"].get(page, 0) + 1
-            
-            # Track unique values
-            if finding_type not in unique_values_by_type:
-                unique_values_by_type[finding_type] = set()
+            by_type[finding_type] += 1
+            by_page[finding.page_number] += 1
             unique_values_by_type[finding_type].add(finding.value)
         
-        # Convert sets to counts for the final statistics
-        stats["unique_values"] = {
-            finding_type: len(values)
-            for finding_type, values in unique_values_by_type.items()
+        return {
+            "total_redactions": len(findings),
+            "by_type": dict(by_type),
+            "by_page": dict(by_page),
+            # Convert sets to counts for the final statistics
+            "unique_values": {
+                finding_type: len(values)
+                for finding_type, values in unique_values_by_type.items()
+            }
         }
-        
-        return stats
     
     def _group_findings_by_page(
         self, 
@@ -237,12 +228,9 @@ class PDFRedactor:
         Returns:
             Dictionary mapping page numbers to lists of findings.
         """
-        grouped = {}
+        grouped = defaultdict(list)
         for finding in findings:
-            page_num = finding.page_number
-            if page_num not in grouped:
-                grouped[page_num] = []
-            grouped[page_num].append(finding)
+            grouped[finding.page_number].append(finding)
         return grouped
     
     def _redact_page(
@@ -257,14 +245,27 @@ class PDFRedactor:
             page: PyMuPDF page object.
             findings: Findings on this page.
         """
-        for finding in findings:
+        # Repeated values share one search; the text dict for the fallback
+        # is extracted at most once per page
+        text_dict = None
+        
+        # Page text with whitespace removed and case folded, for a cheap
+        # check before the much slower search_for
+        page_text = "".join(page.get_text().split()).lower()
+        
+        for value in dict.fromkeys(finding.value for finding in findings):
+            # Absent from the page text even ignoring case and whitespace, so
+            # neither search_for nor the fallback can locate it
+            if "".join(value.split()).lower() not in page_text:
+                continue
+            
             # Search for all instances of the sensitive text
-            text_instances = page.search_for(finding.value)
+            text_instances = page.search_for(value)
             
             if not text_instances:
                 # Fallback: case-insensitive search with whitespace preservation
                 text_instances = page.search_for(
-                    finding.value, 
+                    value, 
                     flags=fitz.TEXT_PRESERVE_WHITESPACE
                 )
             
@@ -272,7 +273,9 @@ class PDFRedactor:
                 self._apply_standard_redactions(page, text_instances)
             else:
                 # Use fallback method if text search fails
-                self._apply_fallback_redaction(page, finding.value)
+                if text_dict is None:
+                    text_dict = page.get_text("dict")
+                self._apply_fallback_redaction(page, value, text_dict)
         
         # Apply all redactions at once for efficiency
         page.apply_redactions()
@@ -304,7 +307,8 @@ class PDFRedactor:
     def _apply_fallback_redaction(
         self, 
         page: fitz.Page, 
-        text: str
+        text: str,
+        text_dict: Optional[Dict] = None
     ) -> None:
         """
         Apply fallback redaction using direct rectangle drawing.
@@ -315,9 +319,11 @@ class PDFRedactor:
         Args:
             page: PyMuPDF page object.
             text: Text to search for and redact.
+            text_dict: Output of ``page.get_text("dict")``, extracted if not given.
         """
         # Extract text with detailed position information
-        text_dict = page.get_text("dict")
+        if text_dict is None:
+            text_dict = page.get_text("dict")
         text_lower = text.lower()
         
         for block in text_dict.get("blocks", []):
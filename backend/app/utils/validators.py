@@ -8,8 +8,9 @@ other user inputs to ensure security and data integrity.
 import logging
 import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import FrozenSet, Optional, Tuple
 
 from fastapi import HTTPException
 
@@ -18,20 +19,28 @@ from app.core.config import get_settings
 logger = logging.getLogger(__name__)
 
 # PDF file signatures (magic bytes)
-PDF_SIGNATURES = [
+PDF_SIGNATURES = (
     b"%PDF-1.",  # Standard PDF header
     b"%PDF-2.",  # PDF 2.0
-]
+)
+
+# Bytes at the end of a PDF searched for the %%EOF marker
+EOF_SCAN_BYTES = 1024
 
 # Valid finding types
 VALID_FINDING_TYPES = ["email", "ssn"]
 
-# UUID regex pattern
+# UUID regex pattern, hyphenated or as the 32-character hex IDs the API returns
 UUID_PATTERN = re.compile(
-    r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$',
+    r'^[0-9a-f]{8}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{12}$',
     re.IGNORECASE
 )
 
+# Characters stripped from stored filenames (everything except ASCII
+# letters, digits, dots, dashes and underscores, including path separators
+# and all non-ASCII text); whole runs are removed with one substitution
+UNSAFE_FILENAME_CHARS = re.compile(r'[^a-zA-Z0-9._-]+')
+
 
 def validate_file_extension(filename: str) -> bool:
     """
@@ -105,11 +114,11 @@ def validate_pdf_content(content: bytes) -> bool:
         raise HTTPException(status_code=400, detail="File content is empty")
     
     # Check PDF signature
-    if not any(content.startswith(sig) for sig in PDF_SIGNATURES):
+    if not content.startswith(PDF_SIGNATURES):
         raise HTTPException(status_code=400, detail="File is not a valid PDF")
     
-    # Check for EOF marker
-    if not content.rstrip().endswith(b"%%EOF"):
+    # Check for EOF marker, stripping only the tail rather than copying the whole file
+    if not content[-EOF_SCAN_BYTES:].rstrip().endswith(b"%%EOF"):
         raise HTTPException(status_code=400, detail="PDF file is corrupted or incomplete")
     
     return True
@@ -241,11 +250,9 @@ def sanitize_filename(filename: Optional[str]) -> str:
     
     # Remove path traversal attempts
     safe_name = safe_name.replace("..", "")
-    safe_name = safe_name.replace("/", "")
-    safe_name = safe_name.replace("\\", "")
     
-    # Remove special characters but keep dots, dashes, and underscores
-    safe_name = re.sub(r'[^a-zA-Z0-9._-]', '', safe_name)
+    # Remove separators and special characters but keep dots, dashes, and underscores
+    safe_name = UNSAFE_FILENAME_CHARS.sub('', safe_name)
     
     # Ensure filename is not empty after sanitization
     if not safe_name or safe_name in [".", ".."]:
@@ -274,20 +281,21 @@ def validate_pdf_content_legacy(file_content: bytes, max_size: Optional[int] = N
         return False
 
 
+@lru_cache(maxsize=32)
+def _extension_set(allowed_extensions: Tuple[str, ...]) -> FrozenSet[str]:
+    """Lower-cased set of allowed extensions, built once per distinct list."""
+    return frozenset(ext.lower() for ext in allowed_extensions)
+
+
 def validate_filename(filename: str, allowed_extensions: Optional[list] = None) -> bool:
     """Legacy function for filename validation."""
+    if allowed_extensions:
+        if not filename:
+            return False
+        return Path(filename).suffix.lower() in _extension_set(tuple(allowed_extensions))
+    
     try:
-        if allowed_extensions:
-            # Temporarily override settings
-            settings = get_settings()
-            original = settings.allowed_file_extensions
-            settings.allowed_file_extensions = allowed_extensions
-            result = validate_file_extension(filename)
-            settings.allowed_file_extensions = original
-            return result
-        else:
-            validate_file_extension(filename)
-            return True
+        return validate_file_extension(filename)
     except HTTPException:
         return False
 
@@ -5,15 +5,21 @@ This module provides common fixtures and test utilities used across
 all test modules.
 """
 
+import asyncio
+import io
 import logging
 import os
 from datetime import datetime, timezone
-from typing import Dict, Generator, List
+from tempfile import NamedTemporaryFile
+from typing import Callable, Dict, Generator, List
 from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
 
 import pytest
 from fastapi.testclient import TestClient
 
+from app.db.clickhouse import FINDING_COLUMNS
+
 # Set test environment variables
 os.environ["TESTING"] = "true"
 os.environ["CLICKHOUSE_HOST"] = "localhost"
@@ -107,9 +113,15 @@ def mock_db_client():
     mock_client.insert_document = AsyncMock()
     mock_client.insert_finding = AsyncMock()
     mock_client.insert_metric = AsyncMock()
+    mock_client.insert_findings_bulk = AsyncMock()
+    mock_client.insert_metrics_bulk = AsyncMock()
     mock_client.get_document = AsyncMock()
     mock_client.get_documents = AsyncMock(return_value=[])
     mock_client.get_findings_by_document = AsyncMock(return_value=[])
+    mock_client.get_findings_columnar = AsyncMock(return_value={
+        column: [] for column in FINDING_COLUMNS
+    })
+    mock_client.get_findings_summary = AsyncMock(return_value={})
     mock_client.count_documents = AsyncMock(return_value=0)
     mock_client.get_summary_statistics = AsyncMock(return_value={
         "total_documents": 0,
@@ -143,6 +155,61 @@ def mock_global_db_client(mock_db_client):
                 yield mock_db_client
 
 
+@pytest.fixture(autouse=True)
+def clear_stats_cache():
+    """
+    Reset the summary statistics cache between tests.
+    
+    Yields:
+        None
+    """
+    from app.api.endpoints.findings import invalidate_stats_cache
+    
+    invalidate_stats_cache()
+    yield
+    invalidate_stats_cache()
+
+
+@pytest.fixture
+def upload_queue() -> Generator[asyncio.Queue, None, None]:
+    """
+    Install an unbounded upload queue so uploads are accepted without workers.
+    
+    Yields:
+        asyncio.Queue: The queue accepted uploads are put on.
+    """
+    queue = asyncio.Queue()
+    
+    with patch("app.api.endpoints.upload._work_queue", queue):
+        yield queue
+
+
+@pytest.fixture
+def make_upload_job() -> Callable:
+    """
+    Factory for queued upload jobs backed by a temporary file, as uploads are.
+    
+    Returns:
+        Callable: Function building an UploadJob from bytes and a filename.
+    """
+    from app.api.endpoints.upload import UploadJob
+    
+    def _make_upload_job(data: bytes = b"%PDF-1.4\nContent\n%%EOF", filename: str = "test.pdf"):
+        pdf_stream = NamedTemporaryFile(suffix=".pdf")
+        pdf_stream.write(data)
+        pdf_stream.flush()
+        pdf_stream.seek(0)
+        return UploadJob(
+            document_id=uuid4().hex,
+            filename=filename,
+            pdf_stream=pdf_stream,
+            file_size=len(data),
+            upload_timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        )
+    
+    return _make_upload_job
+
+
 @pytest.fixture
 def sample_pdf_content() -> bytes:
     """
@@ -59,30 +59,41 @@ class TestAPIEndpoints:
             assert data["status"] == "healthy"
             assert data["database"] == "healthy"
     
-    @pytest.mark.asyncio
-    async def test_upload_valid_pdf(self, test_client: TestClient, valid_pdf_bytes: bytes):
+    def test_upload_valid_pdf(self, test_client: TestClient, valid_pdf_bytes: bytes, upload_queue):
         """Test uploading a valid PDF file."""
+        # Create file upload
+        files = {"file": ("test.pdf", valid_pdf_bytes, "application/pdf")}
+        
+        response = test_client.post("/api/upload", files=files)
+        
+        assert response.status_code == 202
+        data = response.json()
+        
+        assert "document_id" in data
+        assert data["filename"] == "test.pdf"
+        assert data["status"] == "queued"
+        assert upload_queue.qsize() == 1
+    
+    @pytest.mark.asyncio
+    async def test_process_valid_pdf(self, valid_pdf_bytes: bytes, make_upload_job):
+        """Test processing a queued valid PDF file."""
+        from app.api.endpoints.upload import process_upload_job
+        
         with patch("app.api.endpoints.upload.get_db_client") as mock_get_db:
             # Mock database client
             mock_db = AsyncMock()
             mock_db.insert_document = AsyncMock()
-            mock_db.insert_finding = AsyncMock()
-            mock_db.insert_metric = AsyncMock()
+            mock_db.insert_findings_bulk = AsyncMock()
+            mock_db.insert_metrics_bulk = AsyncMock()
             mock_get_db.return_value = mock_db
             
-            # Create file upload
-            files = {"file": ("test.pdf", valid_pdf_bytes, "application/pdf")}
+            await process_upload_job(make_upload_job(valid_pdf_bytes, "test.pdf"))
             
-            response = test_client.post("/api/upload", files=files)
-            
-            assert response.status_code == 201
-            data = response.json()
-            
-            assert "document_id" in data
-            assert data["filename"] == "test.pdf"
-            assert data["status"] == "success"
-            assert data["findings_count"] == 2  # 1 email + 1 SSN
-            assert data["page_count"] == 1
+            document = mock_db.insert_document.call_args[1]
+            assert document["filename"] == "test.pdf"
+            assert document["status"] == "success"
+            assert document["page_count"] == 1
+            assert len(mock_db.insert_findings_bulk.call_args[0][0]) == 2  # 1 email + 1 SSN
     
     def test_upload_invalid_file_type(self, test_client: TestClient):
         """Test uploading non-PDF file."""
@@ -93,7 +104,7 @@ class TestAPIEndpoints:
         assert response.status_code == 400
         assert "not allowed" in response.json()["detail"]
     
-    def test_upload_oversized_file(self, test_client: TestClient):
+    def test_upload_oversized_file(self, test_client: TestClient, upload_queue):
         """Test uploading file exceeding size limit."""
         # Create large content
         large_content = b"PDF" + b"x" * (51 * 1024 * 1024)  # 51MB
@@ -103,9 +114,13 @@ class TestAPIEndpoints:
         
         assert response.status_code == 413
         assert "exceeds maximum" in response.json()["detail"]
+        assert upload_queue.empty()
     
-    def test_upload_corrupted_pdf(self, test_client: TestClient, invalid_pdf_bytes: bytes):
-        """Test uploading corrupted PDF."""
+    @pytest.mark.asyncio
+    async def test_process_corrupted_pdf(self, invalid_pdf_bytes: bytes, make_upload_job):
+        """Test processing a queued corrupted PDF."""
+        from app.api.endpoints.upload import process_upload_job
+        
         with patch("app.api.endpoints.upload.get_db_client") as mock_get_db:
             mock_db = AsyncMock()
             mock_db.insert_document = AsyncMock()
@@ -113,12 +128,12 @@ class TestAPIEndpoints:
             
             # Add PDF header to make it pass initial validation
             corrupted_pdf = b"%PDF-1.4\n" + invalid_pdf_bytes + b"\n%%EOF"
-            files = {"file": ("corrupted.pdf", corrupted_pdf, "application/pdf")}
             
-            response = test_client.post("/api/upload", files=files)
+            await process_upload_job(make_upload_job(corrupted_pdf, "corrupted.pdf"))
             
-            assert response.status_code == 422
-            assert "corrupted" in response.json()["detail"].lower()
+            document = mock_db.insert_document.call_args[1]
+            assert document["status"] == "failed"
+            assert document["error_message"]
     
     @pytest.mark.asyncio
     async def test_get_all_findings(self, test_client: TestClient):
@@ -138,20 +153,23 @@ class TestAPIEndpoints:
                 "error_message": None,
             }]
             
-            mock_findings = [{
-                "finding_id": "456e7890-e89b-12d3-a456-426614174000",
-                "document_id": "123e4567-e89b-12d3-a456-426614174000",
-                "finding_type": "email",
-                "value": "test@example.com",
-                "page_number": 1,
-                "confidence": 1.0,
-                "context": "Email: test@example.com",
-                "detected_at": datetime.now(timezone.utc),
-            }]
+            mock_findings = {
+                "finding_id": ["456e7890-e89b-12d3-a456-426614174000"],
+                "document_id": ["123e4567-e89b-12d3-a456-426614174000"],
+                "finding_type": ["email"],
+                "value": ["test@example.com"],
+                "page_number": [1],
+                "confidence": [1.0],
+                "context": ["Email: test@example.com"],
+                "detected_at": [datetime.now(timezone.utc)],
+            }
             
             mock_db.count_documents = AsyncMock(return_value=1)
             mock_db.get_documents = AsyncMock(return_value=mock_documents)
-            mock_db.get_findings_by_document = AsyncMock(return_value=mock_findings)
+            mock_db.get_findings_columnar = AsyncMock(return_value=mock_findings)
+            mock_db.get_findings_summary = AsyncMock(return_value={
+                "123e4567-e89b-12d3-a456-426614174000": {"total": 1, "email": 1},
+            })
             mock_get_db.return_value = mock_db
             
             response = test_client.get("/api/findings")
@@ -164,6 +182,12 @@ class TestAPIEndpoints:
             assert data["page_size"] == 20
             assert len(data["findings"]) == 1
             assert data["findings"][0]["document_id"] == "123e4567-e89b-12d3-a456-426614174000"
+            assert len(data["findings"][0]["findings"]) == 1
+            assert data["findings"][0]["summary"] == {"total": 1, "email": 1}
+            mock_db.get_findings_columnar.assert_awaited_once_with(
+                document_ids=["123e4567-e89b-12d3-a456-426614174000"],
+                finding_type=None,
+            )
     
     @pytest.mark.asyncio
     async def test_get_findings_with_filters(self, test_client: TestClient):
@@ -247,6 +271,15 @@ class TestAPIEndpoints:
             assert data["summary"]["total"] == 2
             assert data["summary"]["email"] == 1
             assert data["summary"]["ssn"] == 1
+            assert response.headers["cache-control"] == "public, max-age=3600, immutable"
+            
+            cached = test_client.get(
+                f"/api/findings/{document_id}",
+                headers={"If-None-Match": response.headers["etag"]},
+            )
+            
+            assert cached.status_code == 304
+            assert mock_db.get_findings_by_document.await_count == 1
     
     def test_get_nonexistent_document(self, test_client: TestClient):
         """Test retrieving findings for non-existent document."""
@@ -296,28 +329,21 @@ class TestAPIEndpoints:
         assert response.status_code == 422
         assert "field required" in str(response.json()["detail"]).lower()
     
-    @pytest.mark.asyncio
-    async def test_concurrent_uploads(self, test_client: TestClient, valid_pdf_bytes: bytes):
+    def test_concurrent_uploads(self, test_client: TestClient, valid_pdf_bytes: bytes, upload_queue):
         """Test handling concurrent uploads."""
-        with patch("app.api.endpoints.upload.get_db_client") as mock_get_db:
-            mock_db = AsyncMock()
-            mock_db.insert_document = AsyncMock()
-            mock_db.insert_finding = AsyncMock()
-            mock_db.insert_metric = AsyncMock()
-            mock_get_db.return_value = mock_db
-            
-            # Simulate multiple uploads
-            files1 = {"file": ("test1.pdf", valid_pdf_bytes, "application/pdf")}
-            files2 = {"file": ("test2.pdf", valid_pdf_bytes, "application/pdf")}
-            
-            response1 = test_client.post("/api/upload", files=files1)
-            response2 = test_client.post("/api/upload", files=files2)
-            
-            assert response1.status_code == 201
-            assert response2.status_code == 201
-            
-            # Ensure different document IDs
-            assert response1.json()["document_id"] != response2.json()["document_id"]
+        # Simulate multiple uploads
+        files1 = {"file": ("test1.pdf", valid_pdf_bytes, "application/pdf")}
+        files2 = {"file": ("test2.pdf", valid_pdf_bytes, "application/pdf")}
+        
+        response1 = test_client.post("/api/upload", files=files1)
+        response2 = test_client.post("/api/upload", files=files2)
+        
+        assert response1.status_code == 202
+        assert response2.status_code == 202
+        assert upload_queue.qsize() == 2
+        
+        # Ensure different document IDs
+        assert response1.json()["document_id"] != response2.json()["document_id"]
     
     def test_pagination_parameters(self, test_client: TestClient):
         """Test pagination parameter validation."""
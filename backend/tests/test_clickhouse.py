@@ -14,7 +14,7 @@ import pytest
 from clickhouse_driver.errors import Error as ClickHouseError
 from unittest.mock import ANY
 
-from app.db.clickhouse import ClickHouseClient, create_clickhouse_client
+from app.db.clickhouse import FINDING_COLUMNS, ClickHouseClient, create_clickhouse_client
 from app.db.models import ProcessingStatus, FindingType, MetricType
 
 
@@ -82,12 +82,17 @@ class TestClickHouseClient:
                 None,    # CREATE TABLE documents
                 None,    # CREATE TABLE findings
                 None,    # CREATE TABLE metrics
+                [("ReplacingMergeTree",)],  # documents engine check
+                [],      # findings view does not exist yet
+                [(0,)],  # findings view cutoff
+                None,    # CREATE MATERIALIZED VIEW findings_by_type_mv
+                [("CREATE MATERIALIZED VIEW findings_by_type_mv",)],  # view owner check
             ]
             
             await client.initialize()
             
             # Check that tables were created
-            assert mock_client.execute.call_count >= 6  # Connection test + DB + USE + 3 tables
+            assert mock_client.execute.call_count >= 11  # Connection test + DB + USE + 3 tables + engine + views
     
     @pytest.mark.asyncio
     async def test_health_check_success(self, clickhouse_client, mock_client):
@@ -165,11 +170,60 @@ class TestClickHouseClient:
         assert "INSERT INTO metrics" in call_args[0]
     
     @pytest.mark.asyncio
-    async def test_get_document(self, clickhouse_client, mock_client):
-        """Test retrieving a document."""
+    async def test_insert_findings_bulk(self, clickhouse_client, mock_client):
+        """Test inserting many findings with one statement."""
         doc_id = str(uuid4())
+        rows = [
+            {
+                "document_id": doc_id,
+                "finding_type": FindingType.EMAIL.value,
+                "value": f"user{i}@example.com",
+                "page_number": 1,
+                "confidence": 1.0,
+                "context": None,
+            }
+            for i in range(3)
+        ]
+        
+        await clickhouse_client.insert_findings_bulk(rows)
+        
+        mock_client.execute.assert_called_once()
+        query, columns = mock_client.execute.call_args[0]
+        assert query.startswith("INSERT INTO findings")
+        assert mock_client.execute.call_args.kwargs["columnar"] is True
+        assert columns[0] == [doc_id, doc_id, doc_id]
+        assert columns[2] == ["user0@example.com", "user1@example.com", "user2@example.com"]
+    
+    @pytest.mark.asyncio
+    async def test_insert_findings_bulk_empty(self, clickhouse_client, mock_client):
+        """Test that an empty batch issues no query."""
+        await clickhouse_client.insert_findings_bulk([])
+        
+        mock_client.execute.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_insert_metrics_bulk_swallows_errors(self, clickhouse_client, mock_client):
+        """Test that metric batch failures are logged, not raised."""
+        mock_client.execute.side_effect = ClickHouseError("Insert failed")
+        
+        await clickhouse_client.insert_metrics_bulk([
+            {
+                "document_id": str(uuid4()),
+                "metric_type": MetricType.PROCESSING_TIME.value,
+                "value": 150.5,
+                "timestamp": datetime.now(timezone.utc),
+            }
+        ])
+        
+        mock_client.execute.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_get_document(self, clickhouse_client, mock_client):
+        """Test retrieving a document returns its ID in hex form."""
+        doc_uuid = uuid4()
+        doc_id = doc_uuid.hex
         mock_client.execute.return_value = [(
-            doc_id,
+            doc_uuid,
             "test.pdf",
             1024,
             5,
@@ -223,7 +277,67 @@ class TestClickHouseClient:
         assert len(results) == 2
         assert results[0]["finding_type"] == "email"
         assert results[1]["finding_type"] == "ssn"
-    
+
+    @pytest.mark.asyncio
+    async def test_get_findings_columnar(self, clickhouse_client, mock_client):
+        """Test retrieving findings for several documents as columns in one query."""
+        doc_ids = [uuid4().hex, uuid4().hex]
+        finding_uuid = uuid4()
+        mock_client.execute.return_value = [
+            (finding_uuid, uuid4()),
+            (doc_ids[0], doc_ids[1]),
+            ("email", "ssn"),
+            ("test@example.com", "123-45-6789"),
+            (1, 2),
+            (0.95, 0.90),
+            ("Email: test@example.com", "SSN: 123-45-6789"),
+            (datetime.now(timezone.utc), datetime.now(timezone.utc)),
+        ]
+
+        columns = await clickhouse_client.get_findings_columnar(doc_ids, finding_type="email")
+
+        assert columns["document_id"] == doc_ids
+        assert columns["finding_id"][0] == finding_uuid.hex
+        assert columns["page_number"] == (1, 2)
+        mock_client.execute.assert_called_once()
+        query, params = mock_client.execute.call_args[0]
+        assert "IN %(doc_ids)s" in query
+        assert params == {"doc_ids": tuple(doc_ids), "finding_type": "email"}
+        assert mock_client.execute.call_args[1] == {"columnar": True}
+
+    @pytest.mark.asyncio
+    async def test_get_findings_columnar_empty(self, clickhouse_client, mock_client):
+        """Test that no query is issued for an empty document list."""
+        columns = await clickhouse_client.get_findings_columnar([])
+
+        assert columns == {column: [] for column in FINDING_COLUMNS}
+        mock_client.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_findings_columnar_no_rows(self, clickhouse_client, mock_client):
+        """Test that an empty result still yields every column."""
+        mock_client.execute.return_value = []
+
+        columns = await clickhouse_client.get_findings_columnar([uuid4().hex])
+
+        assert columns == {column: [] for column in FINDING_COLUMNS}
+
+    @pytest.mark.asyncio
+    async def test_get_findings_summary(self, clickhouse_client, mock_client):
+        """Test counting findings by type per document."""
+        doc_ids = [uuid4().hex, uuid4().hex]
+        mock_client.execute.return_value = [
+            (doc_ids[0], "email", 2),
+            (doc_ids[0], "ssn", 1),
+            (doc_ids[1], "email", 4),
+        ]
+
+        summaries = await clickhouse_client.get_findings_summary(doc_ids)
+
+        assert summaries[doc_ids[0]] == {"total": 3, "email": 2, "ssn": 1}
+        assert summaries[doc_ids[1]] == {"total": 4, "email": 4}
+        assert "GROUP BY document_id, finding_type" in mock_client.execute.call_args[0][0]
+
     @pytest.mark.asyncio
     async def test_count_documents(self, clickhouse_client, mock_client):
         """Test counting documents."""
@@ -248,11 +362,9 @@ class TestClickHouseClient:
     @pytest.mark.asyncio
     async def test_get_summary_statistics(self, clickhouse_client, mock_client):
         """Test retrieving summary statistics."""
-        # Mock multiple queries - the actual implementation queries differently
-        mock_client.execute.side_effect = [
-            [(100, 500, 125.5, 100)],  # doc stats query returns multiple columns
-            [("email", 150), ("ssn", 100)],  # findings_by_type
-            [(80,)],  # documents_with_findings
+        # Document stats, findings by type, documents with findings and the total in one row
+        mock_client.execute.return_value = [
+            (100, 500, 125.5, [("email", 150), ("ssn", 100)], 80, 250),
         ]
         
         stats = await clickhouse_client.get_summary_statistics()
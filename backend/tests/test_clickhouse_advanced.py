@@ -6,19 +6,27 @@ focusing on edge cases, error handling, and achieving high code coverage.
 """
 
 import asyncio
+import sys
+import threading
 from datetime import datetime, timezone
 from typing import Any, Dict, List
-from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, Mock, patch
 from uuid import uuid4
 
 import pytest
 from clickhouse_driver.errors import Error as ClickHouseError
 
 from app.db.clickhouse import (
+    AsyncConnectBackend,
+    AsynchBackend,
     ClickHouseClient,
+    ConnectBackend,
     DatabaseError,
+    NativePoolBackend,
     create_clickhouse_client,
     get_db_client,
+    insert_statement,
+    set_db_client,
 )
 
 
@@ -125,6 +133,10 @@ class TestClickHouseClientDriverCreation:
                 secure=True,
                 verify=True,
                 compress=False,
+                pool_mgr=ANY,
+                connect_timeout=5,
+                send_receive_timeout=300,
+                autogenerate_session_id=False,
             )
             assert result == mock_client
 
@@ -206,6 +218,70 @@ class TestClickHouseClientDriverCreation:
                 client._create_native_client()
             assert "clickhouse-driver is required" in str(exc_info.value)
 
+    def test_create_cloud_client_pooled(self) -> None:
+        """Test that the cloud client shares a sized keep-alive pool without sessions."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=8443,
+            database="test",
+            user="default",
+            pool_size=8,
+        )
+
+        with patch("clickhouse_connect.get_client") as mock_get_client:
+            client._create_cloud_client()
+
+        kwargs = mock_get_client.call_args.kwargs
+        assert kwargs["pool_mgr"].connection_pool_kw["maxsize"] == 8
+        assert kwargs["autogenerate_session_id"] is False
+
+    def test_create_cloud_client_with_compression(self) -> None:
+        """Test that the configured codec is passed to clickhouse-connect."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=8443,
+            database="test",
+            user="default",
+            compression="zstd",
+        )
+
+        with patch("clickhouse_connect.get_client") as mock_get_client:
+            client._create_cloud_client()
+
+        assert mock_get_client.call_args.kwargs["compress"] == "zstd"
+
+    def test_create_native_client_with_compression(self) -> None:
+        """Test that the native driver compresses when the codec is importable."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=9000,
+            database="test",
+            user="default",
+            compression="lz4",
+        )
+
+        with patch.dict(sys.modules, {"clickhouse_driver.compression.lz4": MagicMock()}):
+            with patch("clickhouse_driver.Client") as mock_client_class:
+                client._create_native_client()
+
+        assert mock_client_class.call_args[1]["compression"] == "lz4"
+
+    def test_create_native_client_compression_unavailable(self) -> None:
+        """Test that a missing codec package falls back to no compression."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=9000,
+            database="test",
+            user="default",
+            compression="lz4",
+        )
+
+        with patch.dict(sys.modules, {"clickhouse_driver.compression.lz4": None}):
+            with patch("clickhouse_driver.Client") as mock_client_class:
+                client._create_native_client()
+
+        assert mock_client_class.call_args[1]["compression"] is False
+
 
 class TestClickHouseClientQueryExecution:
     """Test suite for query execution methods."""
@@ -256,6 +332,26 @@ class TestClickHouseClientQueryExecution:
         )
         assert result == [(1, "test")]
 
+    def test_execute_columnar_cloud_driver(self) -> None:
+        """Test columnar query execution with cloud driver."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=8443,
+            database="test",
+            user="default",
+            use_cloud_driver=True,
+        )
+        mock_cloud_client = MagicMock()
+        mock_cloud_client.query.return_value.result_columns = [(1, 2), ("a", "b")]
+        client._client = mock_cloud_client
+
+        result = client._execute_columnar("SELECT id, name FROM test")
+
+        mock_cloud_client.query.assert_called_once_with(
+            "SELECT id, name FROM test", parameters=None
+        )
+        assert result == [(1, 2), ("a", "b")]
+
     def test_execute_query_native_driver(self) -> None:
         """Test query execution with native driver."""
         client = ClickHouseClient(
@@ -275,6 +371,97 @@ class TestClickHouseClientQueryExecution:
         assert result == [(1, "test")]
 
 
+class TestClickHouseAsyncInserts:
+    """Test suite for server-side async insert settings."""
+
+    @pytest.fixture
+    def client(self) -> ClickHouseClient:
+        """Create a native client with async inserts enabled."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=9000,
+            database="test",
+            user="default",
+            use_cloud_driver=False,
+            async_insert=True,
+        )
+        client._client = MagicMock()
+        return client
+
+    def test_insert_query_gets_settings(self, client: ClickHouseClient) -> None:
+        """Test that INSERT statements carry the async insert settings."""
+        client._execute_query("\n    INSERT INTO documents (document_id) VALUES", [("id",)])
+
+        settings = client._client.execute.call_args.kwargs["settings"]
+        assert settings["async_insert"] == 1
+        assert settings["wait_for_async_insert"] == 1
+
+    def test_metrics_insert_does_not_wait(self, client: ClickHouseClient) -> None:
+        """Test that metric inserts are fire-and-forget on the server."""
+        client._insert_columns("metrics", ["document_id"], [["id"]])
+
+        settings = client._client.execute.call_args.kwargs["settings"]
+        assert settings["async_insert"] == 1
+        assert settings["wait_for_async_insert"] == 0
+
+    def test_select_has_no_settings(self, client: ClickHouseClient) -> None:
+        """Test that non-INSERT statements are sent unchanged."""
+        client._execute_query("SELECT 1")
+
+        client._client.execute.assert_called_once_with("SELECT 1", None)
+
+    def test_cloud_bulk_insert_gets_settings(self) -> None:
+        """Test that clickhouse-connect inserts pass the settings through."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=8443,
+            database="test",
+            user="default",
+            use_cloud_driver=True,
+            async_insert=True,
+        )
+        mock_cloud_client = MagicMock()
+        client._client = mock_cloud_client
+
+        client._insert_columns("findings", ["document_id"], [["id"]])
+
+        settings = mock_cloud_client.insert.call_args.kwargs["settings"]
+        assert settings["async_insert"] == 1
+
+    def test_cloud_bulk_insert_names_column_types(self) -> None:
+        """Test that clickhouse-connect inserts skip the server-side type lookup."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=8443,
+            database="test",
+            user="default",
+            use_cloud_driver=True,
+        )
+        client._client = MagicMock()
+
+        client._insert_columns("metrics", ["document_id", "value"], [["id"], [1.0]])
+        client._insert_columns("metrics", ["document_id", "unknown"], [["id"], [1.0]])
+
+        known, unknown = client._client.insert.call_args_list
+        assert known.kwargs["column_type_names"] == ["UUID", "Float64"]
+        assert "column_type_names" not in unknown.kwargs
+
+    def test_disabled_by_default(self) -> None:
+        """Test that a directly constructed client sends INSERTs without settings."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=9000,
+            database="test",
+            user="default",
+            use_cloud_driver=False,
+        )
+        client._client = MagicMock()
+
+        client._insert_columns("findings", ["document_id"], [["id"]])
+
+        assert "settings" not in client._client.execute.call_args.kwargs
+
+
 class TestClickHouseClientInitializationSync:
     """Test suite for synchronous initialization methods."""
 
@@ -376,27 +563,210 @@ class TestClickHouseClientTableCreation:
         )
         client._client = MagicMock()
 
-        with patch.object(client, "_execute_query") as mock_execute:
+        def execute(query: str) -> Any:
+            if "now64" in query:
+                return [(0,)]
+            return [] if "create_table_query" in query else None
+
+        with patch.object(client, "_execute_query", side_effect=execute) as mock_execute:
             client._create_tables()
 
-            # Verify all three tables are created
-            assert mock_execute.call_count == 3
+            # Verify the three tables, the engine check and the findings view
+            # with its existence, cutoff and ownership queries
+            assert mock_execute.call_count == 8
             
             # Check documents table
             documents_query = mock_execute.call_args_list[0][0][0]
             assert "CREATE TABLE IF NOT EXISTS documents" in documents_query
             assert "document_id UUID" in documents_query
+            assert "ReplacingMergeTree()" in documents_query
+            assert "PARTITION BY toYYYYMM(upload_timestamp)" in documents_query
             
             # Check findings table
             findings_query = mock_execute.call_args_list[1][0][0]
             assert "CREATE TABLE IF NOT EXISTS findings" in findings_query
             assert "finding_id UUID DEFAULT generateUUIDv4()" in findings_query
+            assert "finding_type LowCardinality(String)" in findings_query
+            assert "PROJECTION proj_by_type" in findings_query
             
             # Check metrics table
             metrics_query = mock_execute.call_args_list[2][0][0]
             assert "CREATE TABLE IF NOT EXISTS metrics" in metrics_query
             assert "TTL created_at + INTERVAL 30 DAY" in metrics_query
 
+            # Check the engine of an existing documents table is verified
+            engine_query = mock_execute.call_args_list[3][0][0]
+            assert "FROM system.tables" in engine_query
+            
+            # Check the findings view starts at a cutoff instead of using POPULATE
+            findings_view = mock_execute.call_args_list[6][0][0]
+            assert "findings_by_type_mv" in findings_view
+            assert "AggregatingMergeTree" in findings_view
+            assert "WHERE detected_at >= fromUnixTimestamp64Milli" in findings_view
+            assert "POPULATE" not in findings_view
+
+    def test_create_tables_concurrently_on_cloud(self) -> None:
+        """Test that the pooled HTTP client sends the table DDL in parallel."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=8443,
+            database="test",
+            user="default",
+            use_cloud_driver=True,
+        )
+        client._client = MagicMock()
+        tables_in_flight = threading.Barrier(3, timeout=5)
+
+        def execute(query: str) -> Any:
+            # Sequential execution would leave the barrier waiting for the others
+            if "CREATE TABLE" in query:
+                tables_in_flight.wait()
+            return [(0,)] if "now64" in query else None
+
+        with patch.object(client, "_execute_query", side_effect=execute) as mock_execute:
+            client._create_tables()
+
+        assert mock_execute.call_count == 8
+        queries = [c[0][0] for c in mock_execute.call_args_list]
+        assert all("CREATE TABLE" in q for q in queries[:3])
+        assert "MATERIALIZED VIEW" in queries[6]
+
+    @patch("app.db.clickhouse.logger")
+    def test_create_tables_warns_on_legacy_documents_engine(self, mock_logger: Mock) -> None:
+        """Test that a documents table left on MergeTree by an older release is reported."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=9000,
+            database="test",
+            user="default",
+        )
+        client._client = MagicMock()
+
+        def execute(query: str) -> Any:
+            if "now64" in query:
+                return [(0,)]
+            return [("MergeTree",)] if "system.tables" in query else None
+
+        with patch.object(client, "_execute_query", side_effect=execute):
+            client._create_tables()
+
+        mock_logger.warning.assert_called_once()
+        assert "MergeTree engine" in mock_logger.warning.call_args[0][0]
+
+        mock_logger.reset_mock()
+
+        def execute_migrated(query: str) -> Any:
+            if "now64" in query:
+                return [(0,)]
+            return [("ReplacingMergeTree",)] if "system.tables" in query else None
+
+        with patch.object(client, "_execute_query", side_effect=execute_migrated):
+            client._create_tables()
+
+        mock_logger.warning.assert_not_called()
+
+    def test_create_findings_buffer(self) -> None:
+        """Test that the findings Buffer table is created only when enabled."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=9000,
+            database="test",
+            user="default",
+            findings_buffer=True,
+        )
+        client._client = MagicMock()
+
+        with patch.object(client, "_execute_query") as mock_execute:
+            client._create_tables()
+
+        buffer_query = next(
+            c[0][0] for c in mock_execute.call_args_list if "findings_buffer AS" in c[0][0]
+        )
+        assert "CREATE TABLE IF NOT EXISTS findings_buffer AS findings" in buffer_query
+        assert "ENGINE = Buffer(currentDatabase(), findings" in buffer_query
+
+    def test_findings_view_created_with_cutoff(self) -> None:
+        """Test that the process that creates the findings view gets its cutoff back."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=9000,
+            database="test",
+            user="default",
+        )
+        client._client = MagicMock()
+        created: List[str] = []
+
+        def execute(query: str) -> Any:
+            if "now64" in query:
+                return [(1_000_000,)]
+            if "MATERIALIZED VIEW" in query:
+                created.append(query)
+            if "create_table_query" in query:
+                return [(created[0],)] if created else []
+            return None
+
+        with patch.object(client, "_execute_query", side_effect=execute) as mock_execute:
+            cutoff_ms = client._create_findings_by_type_view()
+
+        assert cutoff_ms == 1_002_000
+        assert "WHERE detected_at >= fromUnixTimestamp64Milli(toInt64(1002000), 'UTC')" in created[0]
+        assert not any("INSERT" in c[0][0] for c in mock_execute.call_args_list)
+
+    def test_findings_view_not_backfilled_when_it_already_exists(self) -> None:
+        """Test that an existing view, or one created by another worker, is not backfilled again."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=9000,
+            database="test",
+            user="default",
+        )
+        client._client = MagicMock()
+        other_view = (
+            "CREATE MATERIALIZED VIEW test.findings_by_type_mv ... "
+            "WHERE detected_at >= fromUnixTimestamp64Milli(toInt64(999000), 'UTC')"
+        )
+
+        # Existing view: only its definition is read
+        with patch.object(client, "_execute_query", return_value=[(other_view,)]) as mock_execute:
+            assert client._create_findings_by_type_view() is None
+        assert mock_execute.call_count == 1
+
+        # Another worker created it between the existence check and ours
+        definitions = iter([[], [(other_view,)]])
+
+        def execute(query: str) -> Any:
+            if "now64" in query:
+                return [(1_000_000,)]
+            return next(definitions) if "create_table_query" in query else None
+
+        with patch.object(client, "_execute_query", side_effect=execute):
+            assert client._create_findings_by_type_view() is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("findings_buffer", [False, True])
+    async def test_findings_view_backfilled_once_cutoff_passed(self, findings_buffer: bool) -> None:
+        """Test that the backfill waits out the cutoff in the background and copies the rows before it."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=9000,
+            database="test",
+            user="default",
+            findings_buffer=findings_buffer,
+        )
+        client._writer = MagicMock()
+        client._writer.fetch = AsyncMock(return_value=[(1_001_500,)])
+        client._writer.execute = AsyncMock()
+
+        with patch("app.db.clickhouse.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            await client._backfill_findings_by_type(1_002_000)
+
+        mock_sleep.assert_awaited_once_with(0.5)
+        backfill = client._writer.execute.call_args[0][0]
+        source = "findings_buffer" if findings_buffer else "findings"
+        assert "INSERT INTO findings_by_type_mv" in backfill
+        assert f"FROM {source}\n" in backfill
+        assert "WHERE detected_at < fromUnixTimestamp64Milli(toInt64(1002000), 'UTC')" in backfill
+
     @patch("app.db.clickhouse.logger")
     def test_create_tables_failure(self, mock_logger: Mock) -> None:
         """Test table creation failure handling."""
@@ -498,127 +868,649 @@ class TestClickHouseClientAsyncMethods:
         client.use_cloud_driver = True
 
         with patch.object(client, "_execute_query") as mock_execute:
-            mock_execute.side_effect = [
-                [("8.0.0",)],  # version
-                [("test_db",)],  # currentDatabase
-                [("documents",), ("findings",), ("metrics",)],  # SHOW TABLES
+            mock_execute.return_value = [
+                ("8.0.0", "test_db", ["documents", "findings", "metrics"]),
             ]
 
-            result = await client.test_connection()
+            result = await client.test_connection()
+
+            mock_execute.assert_called_once()
+            assert result["status"] == "connected"
+            assert result["version"] == "8.0.0"
+            assert result["database"] == "test_db"
+            assert result["tables"] == ["documents", "findings", "metrics"]
+            assert result["host"] == "localhost"
+            assert result["port"] == 8443
+            assert result["secure"] is True
+            assert result["driver"] == "cloud"
+
+    @pytest.mark.asyncio
+    async def test_test_connection_failure(self) -> None:
+        """Test connection test failure."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=9000,
+            database="test",
+            user="default",
+            secure=False,
+        )
+        client._client = MagicMock()
+        client.use_cloud_driver = False
+
+        with patch.object(client, "_execute_query") as mock_execute:
+            mock_execute.side_effect = Exception("Connection error")
+
+            result = await client.test_connection()
+
+            assert result["status"] == "error"
+            assert "Connection error" in result["error"]
+            assert result["host"] == "localhost"
+            assert result["port"] == 9000
+            assert result["driver"] == "native"
+
+    @pytest.mark.asyncio
+    async def test_insert_document_not_initialized(self) -> None:
+        """Test insert document when client is not initialized."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=9000,
+            database="test",
+            user="default",
+        )
+
+        with pytest.raises(DatabaseError) as exc_info:
+            await client.insert_document(
+                document_id=str(uuid4()),
+                filename="test.pdf",
+                file_size=1024,
+                page_count=1,
+                upload_timestamp=datetime.now(timezone.utc),
+                processing_time_ms=100.0,
+                status="success",
+            )
+        assert "Client not initialized" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_insert_finding_cloud_driver(self) -> None:
+        """Test insert finding with cloud driver."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=8443,
+            database="test",
+            user="default",
+            use_cloud_driver=True,
+        )
+        client._initialized = True
+        client._client = MagicMock()
+
+        with patch.object(client, "_execute_query") as mock_execute:
+            await client.insert_finding(
+                document_id=str(uuid4()),
+                finding_type="email",
+                value="test@example.com",
+                page_number=1,
+                confidence=0.95,
+                context="Found email: test@example.com",
+            )
+
+            mock_execute.assert_called_once()
+            query = mock_execute.call_args[0][0]
+            assert "INSERT INTO findings" in query
+            assert "{document_id:UUID}" in query
+
+    @pytest.mark.asyncio
+    async def test_insert_metric_error_handling(self) -> None:
+        """Test insert metric error handling (should not raise)."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=9000,
+            database="test",
+            user="default",
+        )
+        client._initialized = True
+        client._client = MagicMock()
+
+        with patch.object(client, "_execute_query") as mock_execute:
+            with patch("app.db.clickhouse.logger") as mock_logger:
+                mock_execute.side_effect = Exception("Metric insert failed")
+
+                # Should not raise exception
+                await client.insert_metric(
+                    document_id=str(uuid4()),
+                    metric_type="processing_time",
+                    value=100.0,
+                    timestamp=datetime.now(timezone.utc),
+                )
+
+                mock_logger.error.assert_called()
+                assert "Failed to insert metric" in str(mock_logger.error.call_args)
+
+    @pytest.mark.asyncio
+    async def test_get_document_not_found(self) -> None:
+        """Test get document when not found."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=9000,
+            database="test",
+            user="default",
+        )
+        client._initialized = True
+        client._client = MagicMock()
+
+        with patch.object(client, "_execute_query") as mock_execute:
+            mock_execute.return_value = []
+
+            result = await client.get_document(str(uuid4()))
+            assert result is None
+
+    @pytest.mark.asyncio
+    async def test_get_documents_with_all_filters(self) -> None:
+        """Test get documents with all filters applied."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=8443,
+            database="test",
+            user="default",
+            use_cloud_driver=True,
+        )
+        client._initialized = True
+        client._client = MagicMock()
+
+        doc_id = str(uuid4())
+        start_date = datetime.now(timezone.utc)
+        end_date = datetime.now(timezone.utc)
+
+        with patch.object(client, "_execute_query") as mock_execute:
+            mock_execute.return_value = []
+
+            await client.get_documents(
+                limit=10,
+                offset=20,
+                doc_id=doc_id,
+                start_date=start_date,
+                end_date=end_date,
+            )
+
+            query = mock_execute.call_args[0][0]
+            assert "document_id = {doc_id:UUID}" in query
+            assert "upload_timestamp >= {start_date:DateTime}" in query
+            assert "upload_timestamp <= {end_date:DateTime}" in query
+            assert "LIMIT {limit:UInt32} OFFSET {offset:UInt32}" in query
+
+    @pytest.mark.asyncio
+    async def test_document_queries_prewhere_and_project(self) -> None:
+        """Test that document lookups name their columns and filter the ID in PREWHERE."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=8443,
+            database="test",
+            user="default",
+            use_cloud_driver=True,
+        )
+        client._initialized = True
+        client._client = MagicMock()
+        doc_id = str(uuid4())
+
+        with patch.object(client, "_execute_query") as mock_execute:
+            mock_execute.return_value = []
+
+            await client.get_document(doc_id)
+            await client.get_documents(doc_id=doc_id, start_date=datetime.now(timezone.utc))
+            await client.count_documents(doc_id=doc_id)
+
+        get_query, list_query, count_query = (c[0][0] for c in mock_execute.call_args_list)
+        assert "SELECT *" not in get_query
+        assert "SELECT *" not in list_query
+        assert "PREWHERE document_id = {doc_id:UUID}" in get_query
+        assert "FROM documents FINAL PREWHERE" in get_query
+        assert "FROM documents FINAL PREWHERE" in list_query
+        assert "FROM documents FINAL PREWHERE" in count_query
+        assert list_query.index("PREWHERE document_id") < list_query.index("WHERE 1=1")
+        assert list_query.index("WHERE 1=1") < list_query.index("upload_timestamp >=")
+        assert "PREWHERE document_id = {doc_id:UUID} WHERE 1=1" in count_query
+
+    @pytest.mark.asyncio
+    async def test_get_documents_with_keyset_cursor(self) -> None:
+        """Test get documents seeks past the cursor sort key."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=9000,
+            database="test",
+            user="default",
+            use_cloud_driver=False,
+        )
+        client._initialized = True
+        client._client = MagicMock()
+
+        before_timestamp = datetime.now(timezone.utc)
+        before_document_id = str(uuid4())
+
+        with patch.object(client, "_execute_query") as mock_execute:
+            mock_execute.return_value = []
+
+            await client.get_documents(
+                before_timestamp=before_timestamp,
+                before_document_id=before_document_id,
+            )
+
+            query, params = mock_execute.call_args[0]
+            assert "(upload_timestamp, document_id) < (" in query
+            assert "ORDER BY upload_timestamp DESC, document_id DESC" in query
+            assert "OFFSET" not in query
+            assert "offset" not in params
+            assert params["before_timestamp"] == before_timestamp
+            assert params["before_document_id"] == before_document_id
+
+    @pytest.mark.asyncio
+    async def test_get_documents_reuses_cached_sql(self) -> None:
+        """Test that queries with the same filter shape share one SQL string."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=9000,
+            database="test",
+            user="default",
+            use_cloud_driver=False,
+        )
+        client._initialized = True
+        client._client = MagicMock()
+
+        with patch.object(client, "_execute_query") as mock_execute:
+            mock_execute.return_value = []
+
+            await client.get_documents(limit=10, doc_id=str(uuid4()))
+            await client.get_documents(limit=20, doc_id=str(uuid4()))
+            await client.get_documents(limit=20)
+
+        first, second, unfiltered = (c[0][0] for c in mock_execute.call_args_list)
+        assert first is second
+        assert "PREWHERE" not in unfiltered
+
+    @pytest.mark.asyncio
+    async def test_get_documents_with_count(self) -> None:
+        """Test the page and the filtered total arrive in one query."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=9000,
+            database="test",
+            user="default",
+            use_cloud_driver=False,
+        )
+        client._initialized = True
+        client._client = MagicMock()
+
+        row = (uuid4(), "a.pdf", 10, 1, datetime.now(timezone.utc), 5.0, "success", None, 42)
+
+        with patch.object(client, "_execute_query") as mock_execute:
+            mock_execute.return_value = [row]
+
+            documents, total = await client.get_documents_with_count(limit=1)
+
+            assert total == 42
+            assert documents[0]["filename"] == "a.pdf"
+            assert "count() OVER () AS total_count" in mock_execute.call_args[0][0]
+            assert mock_execute.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_documents_with_count_past_last_page(self) -> None:
+        """Test an empty page past the end still reports the total."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=9000,
+            database="test",
+            user="default",
+            use_cloud_driver=False,
+        )
+        client._initialized = True
+        client._client = MagicMock()
+
+        with patch.object(client, "_execute_query") as mock_execute:
+            mock_execute.side_effect = [[], [(7,)]]
+
+            documents, total = await client.get_documents_with_count(limit=10, offset=100)
+
+            assert documents == []
+            assert total == 7
+
+    @pytest.mark.asyncio
+    async def test_count_documents_with_filters_native(self) -> None:
+        """Test count documents with filters using native driver."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=9000,
+            database="test",
+            user="default",
+            use_cloud_driver=False,
+        )
+        client._initialized = True
+        client._client = MagicMock()
+
+        with patch.object(client, "_execute_query") as mock_execute:
+            mock_execute.return_value = [(42,)]
+
+            count = await client.count_documents(
+                doc_id=str(uuid4()),
+                start_date=datetime.now(timezone.utc),
+                end_date=datetime.now(timezone.utc),
+            )
+
+            assert count == 42
+            query = mock_execute.call_args[0][0]
+            assert "document_id = %(doc_id)s" in query
+            assert "upload_timestamp >= %(start_date)s" in query
+            assert "upload_timestamp <= %(end_date)s" in query
+
+    @pytest.mark.asyncio
+    async def test_get_findings_by_document_with_type_filter(self) -> None:
+        """Test get findings with finding type filter."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=9000,
+            database="test",
+            user="default",
+            use_cloud_driver=False,
+        )
+        client._initialized = True
+        client._client = MagicMock()
+
+        with patch.object(client, "_execute_query") as mock_execute:
+            mock_execute.return_value = []
+
+            await client.get_findings_by_document(
+                document_id=str(uuid4()),
+                finding_type="email",
+            )
+
+            query = mock_execute.call_args[0][0]
+            assert "finding_type = %(finding_type)s" in query
+
+    @pytest.mark.asyncio
+    async def test_get_summary_statistics_empty_results(self) -> None:
+        """Test get summary statistics with empty results."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=9000,
+            database="test",
+            user="default",
+        )
+        client._initialized = True
+        client._client = MagicMock()
+
+        with patch.object(client, "_execute_query") as mock_execute:
+            mock_execute.return_value = []
+
+            stats = await client.get_summary_statistics()
+
+            assert stats["total_documents"] == 0
+            assert stats["total_pages"] == 0
+            assert stats["avg_processing_time"] == 0
+            assert stats["documents_with_findings"] == 0
+            assert stats["findings_by_type"] == {}
+            assert stats["total_findings"] == 0
+
+    @pytest.mark.asyncio
+    async def test_close_native_driver(self) -> None:
+        """Test closing connection with native driver."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=9000,
+            database="test",
+            user="default",
+            use_cloud_driver=False,
+        )
+        client._client = MagicMock()
+
+        await client.close()
+        client._client.disconnect.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_close_cloud_driver(self) -> None:
+        """Test closing connection with cloud driver (no-op)."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=8443,
+            database="test",
+            user="default",
+            use_cloud_driver=True,
+        )
+        client._client = MagicMock()
+
+        await client.close()
+        # Cloud driver doesn't have disconnect method
+        assert not hasattr(client._client, "disconnect") or not client._client.disconnect.called
+
+    @pytest.mark.asyncio
+    async def test_close_error_handling(self) -> None:
+        """Test error handling during connection close."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=9000,
+            database="test",
+            user="default",
+            use_cloud_driver=False,
+        )
+        client._client = MagicMock()
+        client._client.disconnect.side_effect = Exception("Close failed")
+
+        with patch("app.db.clickhouse.logger") as mock_logger:
+            await client.close()
+            mock_logger.error.assert_called()
+            assert "Error closing connection" in str(mock_logger.error.call_args)
+
+
+class TestClickHouseReadBackends:
+    """Test suite for the pluggable read backends."""
+
+    def test_asynch_driver_falls_back_on_cloud(self) -> None:
+        """Test that the asynch driver is refused for cloud HTTP connections."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=8443,
+            database="test",
+            user="default",
+            secure=True,
+            driver="asynch",
+        )
+
+        assert client.driver == "connect"
+        assert isinstance(client._reader, ConnectBackend)
+
+    @pytest.mark.asyncio
+    async def test_initialize_asynch_driver(self) -> None:
+        """Test that initialization opens an asynch pool for endpoint reads."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=9000,
+            database="test",
+            user="default",
+            driver="asynch",
+        )
+        mock_asynch = MagicMock()
+        mock_asynch.create_pool = AsyncMock()
+
+        with patch.object(client, "_initialize_sync"):
+            with patch.dict(sys.modules, {"asynch": mock_asynch}):
+                await client.initialize()
+
+        assert isinstance(client._reader, AsynchBackend)
+        assert mock_asynch.create_pool.call_args.kwargs["database"] == "test"
+
+    @pytest.mark.asyncio
+    async def test_asynch_driver_uses_compression(self) -> None:
+        """Test that the asynch pool compresses blocks like the native client."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=9000,
+            database="test",
+            user="default",
+            driver="asynch",
+            compression="lz4",
+        )
+        mock_asynch = MagicMock()
+        mock_asynch.create_pool = AsyncMock()
+
+        with patch.object(client, "_initialize_sync"):
+            with patch.object(client, "_native_compression", return_value="lz4"):
+                with patch.dict(sys.modules, {"asynch": mock_asynch}):
+                    await client.initialize()
+
+        assert mock_asynch.create_pool.call_args.kwargs["compression"] == "lz4"
+
+    @pytest.mark.asyncio
+    async def test_initialize_asynch_driver_not_installed(self) -> None:
+        """Test that a missing asynch package fails initialization clearly."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=9000,
+            database="test",
+            user="default",
+            driver="asynch",
+        )
+
+        with patch.object(client, "_initialize_sync"):
+            with patch.dict(sys.modules, {"asynch": None}):
+                with pytest.raises(DatabaseError) as exc_info:
+                    await client.initialize()
+
+        assert "asynch is required" in str(exc_info.value)
+        assert client._initialized is False
+
+    @pytest.mark.asyncio
+    async def test_asynch_backend_fetch_columnar(self) -> None:
+        """Test that asynch rows are transposed into columns."""
+        backend = AsynchBackend(host="localhost", port=9000, database="test", user="default")
+        cursor = MagicMock()
+        cursor.execute = AsyncMock()
+        cursor.fetchall = AsyncMock(return_value=[("a", 1), ("b", 2)])
+        conn = MagicMock()
+        conn.cursor.return_value.__aenter__.return_value = cursor
+        backend._pool = MagicMock()
+        backend._pool.acquire.return_value.__aenter__.return_value = conn
+
+        columns = await backend.fetch_columnar("SELECT x, y FROM t WHERE z = %(z)s", {"z": 1})
+
+        assert columns == [["a", "b"], [1, 2]]
+        cursor.execute.assert_awaited_once_with("SELECT x, y FROM t WHERE z = %(z)s", {"z": 1})
+
+    @pytest.mark.asyncio
+    async def test_initialize_native_pool(self) -> None:
+        """Test that the native driver opens its minimum pool at startup."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=9000,
+            database="test",
+            user="default",
+            use_cloud_driver=False,
+            pool_size=4,
+            pool_min_size=2,
+        )
+
+        with patch.object(client, "_initialize_sync"):
+            with patch.object(client, "_create_native_client") as mock_create:
+                await client.initialize()
 
-            assert result["status"] == "connected"
-            assert result["version"] == "8.0.0"
-            assert result["database"] == "test_db"
-            assert result["tables"] == ["documents", "findings", "metrics"]
-            assert result["host"] == "localhost"
-            assert result["port"] == 8443
-            assert result["secure"] is True
-            assert result["driver"] == "cloud"
+        assert isinstance(client._reader, NativePoolBackend)
+        assert client._writer is client._reader
+        assert mock_create.call_count == 2
+        mock_create.return_value.connection.force_connect.assert_called()
+        await client.close()
 
     @pytest.mark.asyncio
-    async def test_test_connection_failure(self) -> None:
-        """Test connection test failure."""
+    async def test_native_pool_runs_concurrent_queries_on_separate_clients(self) -> None:
+        """Test that overlapping queries never share a clickhouse-driver client."""
         client = ClickHouseClient(
             host="localhost",
             port=9000,
             database="test",
             user="default",
-            secure=False,
+            use_cloud_driver=False,
         )
-        client._client = MagicMock()
-        client.use_cloud_driver = False
+        backend = NativePoolBackend(client, min_size=0, max_size=2)
+        in_flight = threading.Barrier(2, timeout=5)
 
-        with patch.object(client, "_execute_query") as mock_execute:
-            mock_execute.side_effect = Exception("Connection error")
+        def execute(query: str, params: Any = None, **kwargs: Any) -> List[tuple]:
+            in_flight.wait()
+            return [(1,)]
 
-            result = await client.test_connection()
+        with patch.object(client, "_create_native_client") as mock_create:
+            mock_create.side_effect = lambda: MagicMock(execute=MagicMock(side_effect=execute))
+            results = await asyncio.gather(backend.fetch("SELECT 1"), backend.fetch("SELECT 2"))
 
-            assert result["status"] == "error"
-            assert "Connection error" in result["error"]
-            assert result["host"] == "localhost"
-            assert result["port"] == 9000
-            assert result["driver"] == "native"
+        assert results == [[(1,)], [(1,)]]
+        assert mock_create.call_count == 2
+        await backend.close()
 
     @pytest.mark.asyncio
-    async def test_insert_document_not_initialized(self) -> None:
-        """Test insert document when client is not initialized."""
+    async def test_native_pool_waits_for_a_free_client(self) -> None:
+        """Test that the pool never opens more than max_size clients."""
         client = ClickHouseClient(
             host="localhost",
             port=9000,
             database="test",
             user="default",
+            use_cloud_driver=False,
         )
+        backend = NativePoolBackend(client, min_size=0, max_size=1)
 
-        with pytest.raises(DatabaseError) as exc_info:
-            await client.insert_document(
-                document_id=str(uuid4()),
-                filename="test.pdf",
-                file_size=1024,
-                page_count=1,
-                upload_timestamp=datetime.now(timezone.utc),
-                processing_time_ms=100.0,
-                status="success",
-            )
-        assert "Client not initialized" in str(exc_info.value)
+        with patch.object(client, "_create_native_client") as mock_create:
+            mock_create.return_value.execute.return_value = [(1,)]
+            await asyncio.gather(*(backend.fetch("SELECT 1") for _ in range(3)))
+
+        assert mock_create.call_count == 1
+        assert mock_create.return_value.execute.call_count == 3
+        await backend.close()
 
     @pytest.mark.asyncio
-    async def test_insert_finding_cloud_driver(self) -> None:
-        """Test insert finding with cloud driver."""
+    async def test_native_pool_drops_client_after_query_error(self) -> None:
+        """Test that a client whose query raised is disconnected instead of reused."""
         client = ClickHouseClient(
             host="localhost",
-            port=8443,
+            port=9000,
             database="test",
             user="default",
-            use_cloud_driver=True,
+            use_cloud_driver=False,
         )
-        client._initialized = True
-        client._client = MagicMock()
+        backend = NativePoolBackend(client, min_size=0, max_size=1)
+        broken = MagicMock()
+        broken.execute.side_effect = ClickHouseError("Unexpected packet from server")
+        healthy = MagicMock()
+        healthy.execute.return_value = [(1,)]
 
-        with patch.object(client, "_execute_query") as mock_execute:
-            await client.insert_finding(
-                document_id=str(uuid4()),
-                finding_type="email",
-                value="test@example.com",
-                page_number=1,
-                confidence=0.95,
-                context="Found email: test@example.com",
-            )
+        with patch.object(client, "_create_native_client", side_effect=[broken, healthy]):
+            with pytest.raises(ClickHouseError):
+                await backend.fetch("SELECT 1")
+            assert await backend.fetch("SELECT 1") == [(1,)]
 
-            mock_execute.assert_called_once()
-            query = mock_execute.call_args[0][0]
-            assert "INSERT INTO findings" in query
-            assert "{document_id:UUID}" in query
+        broken.disconnect.assert_called_once()
+        assert backend._size == 1
+        await backend.close()
 
     @pytest.mark.asyncio
-    async def test_insert_metric_error_handling(self) -> None:
-        """Test insert metric error handling (should not raise)."""
+    async def test_native_pool_releases_slot_when_connect_fails(self) -> None:
+        """Test that a client that could not be created does not count against max_size."""
         client = ClickHouseClient(
             host="localhost",
             port=9000,
             database="test",
             user="default",
+            use_cloud_driver=False,
         )
-        client._initialized = True
-        client._client = MagicMock()
-
-        with patch.object(client, "_execute_query") as mock_execute:
-            with patch("app.db.clickhouse.logger") as mock_logger:
-                mock_execute.side_effect = Exception("Metric insert failed")
+        backend = NativePoolBackend(client, min_size=0, max_size=1)
+        healthy = MagicMock()
+        healthy.execute.return_value = [(1,)]
 
-                # Should not raise exception
-                await client.insert_metric(
-                    document_id=str(uuid4()),
-                    metric_type="processing_time",
-                    value=100.0,
-                    timestamp=datetime.now(timezone.utc),
-                )
+        with patch.object(
+            client, "_create_native_client", side_effect=[ClickHouseError("Connection refused"), healthy]
+        ):
+            with pytest.raises(ClickHouseError):
+                await backend.fetch("SELECT 1")
+            assert backend._size == 0
+            assert await asyncio.wait_for(backend.fetch("SELECT 1"), timeout=1) == [(1,)]
 
-                mock_logger.error.assert_called()
-                assert "Failed to insert metric" in str(mock_logger.error.call_args)
+        await backend.close()
 
     @pytest.mark.asyncio
-    async def test_get_document_not_found(self) -> None:
-        """Test get document when not found."""
+    async def test_summary_statistics_use_reader(self) -> None:
+        """Test that summary statistics are read through the selected backend."""
         client = ClickHouseClient(
             host="localhost",
             port=9000,
@@ -626,131 +1518,175 @@ class TestClickHouseClientAsyncMethods:
             user="default",
         )
         client._initialized = True
-        client._client = MagicMock()
+        client._reader = MagicMock()
+        client._reader.fetch = AsyncMock(return_value=[(2, 5, 100.0, [("email", 3)], 1, 3)])
 
-        with patch.object(client, "_execute_query") as mock_execute:
-            mock_execute.return_value = []
+        stats = await client.get_summary_statistics()
 
-            result = await client.get_document(str(uuid4()))
-            assert result is None
+        assert stats["total_documents"] == 2
+        assert stats["total_findings"] == 3
+        assert client._reader.fetch.await_count == 1
+        assert "FROM documents FINAL" in client._reader.fetch.await_args[0][0]
+        assert "arraySum(" in client._reader.fetch.await_args[0][0]
 
-    @pytest.mark.asyncio
-    async def test_get_documents_with_all_filters(self) -> None:
-        """Test get documents with all filters applied."""
+    def test_connect_async_driver_falls_back_on_native(self) -> None:
+        """Test that the async HTTP driver is refused for native protocol connections."""
+        client = ClickHouseClient(
+            host="localhost",
+            port=9000,
+            database="test",
+            user="default",
+            use_cloud_driver=False,
+            driver="connect_async",
+        )
+
+        assert client.driver == "connect"
+        assert client._writer is client._reader
+
+    @pytest.fixture
+    def async_http_client(self) -> MagicMock:
+        """Create a mock clickhouse-connect async client."""
+        async_client = MagicMock()
+        async_client.query = AsyncMock()
+        async_client.command = AsyncMock()
+        async_client.insert = AsyncMock()
+        async_client.close = AsyncMock()
+        return async_client
+
+    @pytest.fixture
+    def connect_async_client(self, async_http_client: MagicMock) -> ClickHouseClient:
+        """Create a cloud client using the connect_async driver."""
         client = ClickHouseClient(
             host="localhost",
             port=8443,
             database="test",
             user="default",
             use_cloud_driver=True,
+            driver="connect_async",
+            async_insert=True,
         )
         client._initialized = True
-        client._client = MagicMock()
-
-        doc_id = str(uuid4())
-        start_date = datetime.now(timezone.utc)
-        end_date = datetime.now(timezone.utc)
-
-        with patch.object(client, "_execute_query") as mock_execute:
-            mock_execute.return_value = []
-
-            await client.get_documents(
-                limit=10,
-                offset=20,
-                doc_id=doc_id,
-                start_date=start_date,
-                end_date=end_date,
-            )
-
-            query = mock_execute.call_args[0][0]
-            assert "document_id = {doc_id:UUID}" in query
-            assert "upload_timestamp >= {start_date:DateTime}" in query
-            assert "upload_timestamp <= {end_date:DateTime}" in query
-            assert "LIMIT {limit:UInt32} OFFSET {offset:UInt32}" in query
+        backend = AsyncConnectBackend(client)
+        backend._async_client = async_http_client
+        client._reader = backend
+        client._writer = backend
+        return client
 
     @pytest.mark.asyncio
-    async def test_count_documents_with_filters_native(self) -> None:
-        """Test count documents with filters using native driver."""
+    async def test_initialize_connect_async_driver(self, async_http_client: MagicMock) -> None:
+        """Test that initialization opens the async HTTP client for reads and writes."""
         client = ClickHouseClient(
             host="localhost",
-            port=9000,
+            port=8443,
             database="test",
             user="default",
-            use_cloud_driver=False,
+            use_cloud_driver=True,
+            driver="connect_async",
         )
-        client._initialized = True
-        client._client = MagicMock()
 
-        with patch.object(client, "_execute_query") as mock_execute:
-            mock_execute.return_value = [(42,)]
+        with patch.object(client, "_initialize_sync"):
+            with patch(
+                "clickhouse_connect.get_async_client",
+                new=AsyncMock(return_value=async_http_client),
+            ) as mock_get_client:
+                await client.initialize()
 
-            count = await client.count_documents(
-                doc_id=str(uuid4()),
-                start_date=datetime.now(timezone.utc),
-                end_date=datetime.now(timezone.utc),
-            )
+        assert isinstance(client._reader, AsyncConnectBackend)
+        assert client._writer is client._reader
+        assert mock_get_client.call_args.kwargs["database"] == "test"
 
-            assert count == 42
-            query = mock_execute.call_args[0][0]
-            assert "document_id = %(doc_id)s" in query
-            assert "upload_timestamp >= %(start_date)s" in query
-            assert "upload_timestamp <= %(end_date)s" in query
+        await client.close()
+
+        async_http_client.close.assert_awaited_once()
 
     @pytest.mark.asyncio
-    async def test_get_findings_by_document_with_type_filter(self) -> None:
-        """Test get findings with finding type filter."""
+    async def test_connect_async_reads_await_http_client(
+        self, connect_async_client: ClickHouseClient, async_http_client: MagicMock
+    ) -> None:
+        """Test that reads are awaited on the async client instead of an executor."""
+        async_http_client.query.return_value.result_rows = [(7,)]
+
+        with patch.object(connect_async_client, "_execute_query") as mock_execute:
+            count = await connect_async_client.count_documents()
+
+        assert count == 7
+        mock_execute.assert_not_called()
+        async_http_client.query.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_connect_async_writes_use_insert_settings(
+        self, connect_async_client: ClickHouseClient, async_http_client: MagicMock
+    ) -> None:
+        """Test that bulk and single-row writes go through the async client with settings."""
+        await connect_async_client.insert_metrics_bulk([{
+            "document_id": str(uuid4()),
+            "metric_type": "page_count",
+            "value": 1.0,
+            "timestamp": datetime.now(timezone.utc),
+        }])
+        await connect_async_client.insert_finding(str(uuid4()), "email", "a@example.com", 1, 1.0)
+
+        insert_call = async_http_client.insert.call_args
+        assert insert_call.args[0] == "metrics"
+        assert insert_call.kwargs["settings"]["wait_for_async_insert"] == 0
+        command_call = async_http_client.command.call_args
+        assert "INSERT INTO findings" in command_call.args[0]
+        assert command_call.kwargs["settings"]["wait_for_async_insert"] == 1
+
+
+class TestClickHouseInsertBuffering:
+    """Test suite for batched single-row inserts."""
+
+    def test_findings_buffer_receives_finding_inserts(self) -> None:
+        """Test that findings go to the Buffer table while other tables do not."""
         client = ClickHouseClient(
             host="localhost",
-            port=9000,
+            port=8443,
             database="test",
             user="default",
-            use_cloud_driver=False,
+            use_cloud_driver=True,
+            findings_buffer=True,
         )
-        client._initialized = True
         client._client = MagicMock()
 
-        with patch.object(client, "_execute_query") as mock_execute:
-            mock_execute.return_value = []
-
-            await client.get_findings_by_document(
-                document_id=str(uuid4()),
-                finding_type="email",
-            )
+        client._insert_columns("findings", ["document_id", "value"], [["id"], ["x"]])
+        client._insert_columns("metrics", ["document_id", "value"], [["id"], [1.0]])
 
-            query = mock_execute.call_args[0][0]
-            assert "finding_type = %(finding_type)s" in query
+        findings_call, metrics_call = client._client.insert.call_args_list
+        assert findings_call[0][0] == "findings_buffer"
+        assert findings_call[0][1] == [["id"], ["x"]]
+        assert findings_call.kwargs["column_oriented"] is True
+        assert findings_call.kwargs["column_type_names"] == ["UUID", "String"]
+        assert metrics_call[0][0] == "metrics"
 
     @pytest.mark.asyncio
-    async def test_get_summary_statistics_empty_results(self) -> None:
-        """Test get summary statistics with empty results."""
+    async def test_findings_buffer_serves_finding_reads(self) -> None:
+        """Test that findings are read through the Buffer table, which includes unflushed rows."""
         client = ClickHouseClient(
             host="localhost",
             port=9000,
             database="test",
             user="default",
+            findings_buffer=True,
         )
         client._initialized = True
-        client._client = MagicMock()
-
-        with patch.object(client, "_execute_query") as mock_execute:
-            mock_execute.side_effect = [
-                [],  # doc_stats
-                [],  # findings_stats
-                [],  # docs_with_findings
-            ]
+        client._reader = MagicMock()
+        client._reader.fetch = AsyncMock(return_value=[])
+        client._reader.fetch_columnar = AsyncMock(return_value=[])
+        doc_id = str(uuid4())
 
-            stats = await client.get_summary_statistics()
+        await client.get_findings_by_document(doc_id)
+        await client.get_findings_columnar([doc_id])
+        await client.get_findings_summary([doc_id])
 
-            assert stats["total_documents"] == 0
-            assert stats["total_pages"] == 0
-            assert stats["avg_processing_time"] == 0
-            assert stats["documents_with_findings"] == 0
-            assert stats["findings_by_type"] == {}
-            assert stats["total_findings"] == 0
+        queries = [c[0][0] for c in client._reader.fetch.await_args_list]
+        queries.append(client._reader.fetch_columnar.await_args[0][0])
+        assert len(queries) == 3
+        for query in queries:
+            assert "FROM findings_buffer\n" in query
 
-    @pytest.mark.asyncio
-    async def test_close_native_driver(self) -> None:
-        """Test closing connection with native driver."""
+    def test_native_insert_statement_is_reused(self) -> None:
+        """Test that native inserts share one statement per column layout."""
         client = ClickHouseClient(
             host="localhost",
             port=9000,
@@ -760,42 +1696,220 @@ class TestClickHouseClientAsyncMethods:
         )
         client._client = MagicMock()
 
-        await client.close()
-        client._client.disconnect.assert_called_once()
+        client._insert_columns("metrics", ["document_id", "value"], [["id"], [1.0]])
+        client._insert_columns("metrics", ["document_id", "value"], [["id"], [2.0]])
 
-    @pytest.mark.asyncio
-    async def test_close_cloud_driver(self) -> None:
-        """Test closing connection with cloud driver (no-op)."""
+        first, second = (c[0][0] for c in client._client.execute.call_args_list)
+        assert first == "INSERT INTO metrics (document_id, value) VALUES"
+        assert first is second
+        assert first is insert_statement("metrics", ("document_id", "value"))
+
+    @pytest.fixture
+    def client(self) -> ClickHouseClient:
+        """Create an initialized native client that buffers up to three rows per table."""
         client = ClickHouseClient(
             host="localhost",
-            port=8443,
+            port=9000,
             database="test",
             user="default",
-            use_cloud_driver=True,
+            use_cloud_driver=False,
+            batch_size=3,
         )
         client._client = MagicMock()
+        client._initialized = True
+        return client
+
+    async def _insert_document(self, client: ClickHouseClient, document_id: str) -> None:
+        """Insert a successful document row."""
+        await client.insert_document(
+            document_id=document_id,
+            filename="test.pdf",
+            file_size=1024,
+            page_count=1,
+            upload_timestamp=datetime.now(timezone.utc),
+            processing_time_ms=10.0,
+            status="success",
+        )
+
+    @pytest.mark.asyncio
+    async def test_small_bulk_inserts_join_the_buffer(self, client: ClickHouseClient) -> None:
+        """Test that bulk lists below a batch coalesce with other documents' rows."""
+        finding = {
+            "finding_type": "email",
+            "value": "a@example.com",
+            "page_number": 1,
+            "confidence": 0.9,
+            "context": None,
+        }
+
+        await client.insert_findings_bulk([{"document_id": str(uuid4()), **finding}] * 2)
+        client._client.execute.assert_not_called()
+
+        await client.insert_findings_bulk([{"document_id": str(uuid4()), **finding}])
+
+        client._client.execute.assert_called_once()
+        assert len(client._client.execute.call_args[0][1][0]) == 3
+
+    @pytest.mark.asyncio
+    async def test_large_bulk_inserts_bypass_the_buffer(self, client: ClickHouseClient) -> None:
+        """Test that a bulk list of a full batch or more is written directly."""
+        rows = [
+            {
+                "document_id": str(uuid4()),
+                "metric_type": "page_count",
+                "value": float(i),
+                "timestamp": datetime.now(timezone.utc),
+            }
+            for i in range(4)
+        ]
+
+        await client.insert_metrics_bulk(rows)
+
+        client._client.execute.assert_called_once()
+        assert len(client._client.execute.call_args[0][1][0]) == 4
+        assert not client._insert_buffers["metrics"]
+
+    @pytest.mark.asyncio
+    async def test_rows_buffered_until_batch_size(self, client: ClickHouseClient) -> None:
+        """Test that rows are held until the batch fills, then written in one INSERT."""
+        for i in range(2):
+            await client.insert_metric(str(uuid4()), "page_count", float(i), datetime.now(timezone.utc))
+
+        client._client.execute.assert_not_called()
+
+        await client.insert_metric(str(uuid4()), "page_count", 2.0, datetime.now(timezone.utc))
+
+        client._client.execute.assert_called_once()
+        query, columns = client._client.execute.call_args[0]
+        assert query.startswith("INSERT INTO metrics")
+        assert columns[2] == (0.0, 1.0, 2.0)
+        assert not client._insert_buffers["metrics"]
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_documents_last(self, client: ClickHouseClient) -> None:
+        """Test that a flush writes findings before the documents they belong to."""
+        document_id = str(uuid4())
+        await self._insert_document(client, document_id)
+        await client.insert_finding(document_id, "email", "a@example.com", 1, 1.0)
+
+        await client.flush()
+
+        tables = [c[0][0].split()[2] for c in client._client.execute.call_args_list]
+        assert tables == ["findings", "documents"]
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_rows(self, client: ClickHouseClient) -> None:
+        """Test that rows survive a failed flush and later tables are not written."""
+        document_id = str(uuid4())
+        await self._insert_document(client, document_id)
+        await client.insert_finding(document_id, "email", "a@example.com", 1, 1.0)
+        client._client.execute.side_effect = ClickHouseError("Insert failed")
+
+        with pytest.raises(DatabaseError):
+            await client.flush()
+
+        assert client._client.execute.call_count == 1
+        assert len(client._insert_buffers["findings"]) == 1
+        assert len(client._insert_buffers["documents"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_on_full_buffer_not_raised(self, client: ClickHouseClient) -> None:
+        """Test that a size-triggered flush failure does not fail the caller's insert."""
+        client._client.execute.side_effect = ClickHouseError("Insert failed")
+
+        for _ in range(3):
+            await self._insert_document(client, str(uuid4()))
+
+        assert len(client._insert_buffers["documents"]) == 3
+
+    @pytest.mark.asyncio
+    async def test_flush_listeners_run_once_rows_are_written(self, client: ClickHouseClient) -> None:
+        """Test that flush listeners run after buffered rows are written, not when they are buffered."""
+        listener = Mock()
+        client.add_flush_listener(listener)
+
+        await self._insert_document(client, str(uuid4()))
+        listener.assert_not_called()
+
+        await client.flush()
+        listener.assert_called_once()
+
+        # Nothing buffered, nothing written
+        await client.flush()
+        listener.assert_called_once()
+
+        # Rows written before a later table failed still count
+        await client.insert_finding(str(uuid4()), "email", "a@example.com", 1, 0.9)
+        await self._insert_document(client, str(uuid4()))
+        client._client.execute.side_effect = [None, ClickHouseError("Insert failed")]
+        with pytest.raises(DatabaseError):
+            await client.flush()
+        assert listener.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch("app.db.clickhouse.logger")
+    async def test_dropped_rows_counted_per_table(
+        self, mock_logger: Mock, client: ClickHouseClient
+    ) -> None:
+        """Test that rows trimmed from a failing buffer, or lost on close, are counted and logged."""
+        client._client.execute.side_effect = ClickHouseError("Insert failed")
+
+        # The buffer keeps ten batches of three rows
+        for _ in range(32):
+            await self._insert_document(client, str(uuid4()))
+
+        assert len(client._insert_buffers["documents"]) == 30
+        assert client.dropped_rows == {"findings": 0, "metrics": 0, "documents": 2}
+        assert any("Dropped 1 buffered documents rows" in c[0][0] for c in mock_logger.error.call_args_list)
 
         await client.close()
-        # Cloud driver doesn't have disconnect method
-        assert not hasattr(client._client, "disconnect") or not client._client.disconnect.called
+
+        assert client.dropped_rows["documents"] == 32
+        assert not client._insert_buffers["documents"]
+        assert any("Dropped 30 buffered documents rows on close" in c[0][0] for c in mock_logger.error.call_args_list)
 
     @pytest.mark.asyncio
-    async def test_close_error_handling(self) -> None:
-        """Test error handling during connection close."""
+    async def test_initialize_starts_flusher_and_close_drains(self) -> None:
+        """Test that buffered rows are written by the periodic flusher and on close."""
         client = ClickHouseClient(
             host="localhost",
             port=9000,
             database="test",
             user="default",
             use_cloud_driver=False,
+            batch_size=100,
+            flush_interval_ms=10,
         )
         client._client = MagicMock()
-        client._client.disconnect.side_effect = Exception("Close failed")
 
-        with patch("app.db.clickhouse.logger") as mock_logger:
-            await client.close()
-            mock_logger.error.assert_called()
-            assert "Error closing connection" in str(mock_logger.error.call_args)
+        with patch.object(client, "_initialize_sync"):
+            await client.initialize()
+
+        await self._insert_document(client, str(uuid4()))
+        await asyncio.sleep(0.05)
+
+        client._client.execute.assert_called_once()
+
+        await self._insert_document(client, str(uuid4()))
+        await client.close()
+
+        assert client._flusher_task is None
+        assert client._client.execute.call_count == 2
+        assert not client._insert_buffers["documents"]
+
+    def test_settings_enable_buffering(self) -> None:
+        """Test that the factory passes the batching settings through."""
+        with patch("app.db.clickhouse.get_settings") as mock_settings:
+            mock_settings.return_value = MagicMock(
+                clickhouse_port=9000,
+                clickhouse_insert_batch_size=500,
+                clickhouse_flush_interval_ms=250,
+            )
+
+            client = create_clickhouse_client()
+
+        assert client.batch_size == 500
+        assert client.flush_interval_ms == 250
 
 
 class TestClickHouseFactoryFunctions:
@@ -833,22 +1947,24 @@ class TestClickHouseFactoryFunctions:
             result = get_db_client()
             assert result == mock_client
 
-    def test_get_db_client_from_main(self) -> None:
-        """Test get_db_client when it needs to import from main."""
+    def test_set_db_client(self) -> None:
+        """Test get_db_client returns the client set at startup until it is cleared."""
         mock_client = MagicMock(spec=ClickHouseClient)
         
         with patch("app.db.clickhouse._db_client", None):
-            with patch("app.main.db_client", mock_client):
-                result = get_db_client()
-                assert result == mock_client
+            set_db_client(mock_client)
+            assert get_db_client() is mock_client
+            
+            set_db_client(None)
+            with pytest.raises(DatabaseError):
+                get_db_client()
 
     def test_get_db_client_not_initialized(self) -> None:
         """Test get_db_client when no client is available."""
         with patch("app.db.clickhouse._db_client", None):
-            with patch("app.main.db_client", None):
-                with pytest.raises(DatabaseError) as exc_info:
-                    get_db_client()
-                assert "Database client not initialized" in str(exc_info.value)
+            with pytest.raises(DatabaseError) as exc_info:
+                get_db_client()
+            assert "Database client not initialized" in str(exc_info.value)
 
 
 class TestClickHouseClientErrorScenarios:
@@ -1071,7 +2187,7 @@ class TestClickHouseClientEdgeCases:
         client._initialized = True
         client._client = MagicMock()
 
-        doc_id = str(uuid4())
+        doc_id = uuid4().hex
         timestamp = datetime.now(timezone.utc)
 
         with patch.object(client, "_execute_query") as mock_execute:
@@ -1112,7 +2228,7 @@ class TestClickHouseClientEdgeCases:
         client._initialized = True
         client._client = MagicMock()
 
-        doc_id = str(uuid4())
+        doc_id = uuid4().hex
         timestamp = datetime.now(timezone.utc)
 
         with patch.object(client, "_execute_query") as mock_execute:
@@ -1166,8 +2282,8 @@ class TestClickHouseClientEdgeCases:
         client._initialized = True
         client._client = MagicMock()
 
-        finding_id = str(uuid4())
-        doc_id = str(uuid4())
+        finding_id = uuid4().hex
+        doc_id = uuid4().hex
         timestamp = datetime.now(timezone.utc)
 
         with patch.object(client, "_execute_query") as mock_execute:
@@ -1206,10 +2322,8 @@ class TestClickHouseClientEdgeCases:
         client._client = MagicMock()
 
         with patch.object(client, "_execute_query") as mock_execute:
-            mock_execute.side_effect = [
-                [(10, 50, 125.5, 10)],  # doc_stats
-                [("email", 15), ("ssn", 8)],  # findings_stats
-                [(7,)],  # docs_with_findings
+            mock_execute.return_value = [
+                (10, 50, 125.5, [("email", 15), ("ssn", 8)], 7, 23),
             ]
 
             stats = await client.get_summary_statistics()
@@ -1347,11 +2461,7 @@ class TestClickHouseClientEdgeCases:
         client._client = MagicMock()
 
         with patch.object(client, "_execute_query") as mock_execute:
-            mock_execute.side_effect = [
-                [],  # version
-                [],  # currentDatabase
-                [],  # SHOW TABLES
-            ]
+            mock_execute.return_value = []
 
             result = await client.test_connection()
 
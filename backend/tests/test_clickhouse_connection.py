@@ -145,6 +145,62 @@ async def test_summary_statistics(clickhouse_client):
     assert stats['documents_with_findings'] >= 0
 
 
+async def _direct_totals(clickhouse_client):
+    """Aggregate the base tables directly, bypassing the summary views."""
+    result = await clickhouse_client._reader.fetch(
+        """
+        SELECT
+            (SELECT count() FROM documents FINAL WHERE status = 'success'),
+            (SELECT count() FROM findings)
+        """
+    )
+    return result[0]
+
+
+@pytest.mark.asyncio
+async def test_summary_statistics_match_direct_aggregates(clickhouse_client):
+    """Test that re-recording a document does not inflate the summary totals."""
+    before = await clickhouse_client.get_summary_statistics()
+    direct_before = await _direct_totals(clickhouse_client)
+    
+    # The same document recorded twice collapses to one row in documents
+    test_doc_id = str(uuid.uuid4())
+    uploaded = datetime.now(timezone.utc).replace(microsecond=0)
+    for _ in range(2):
+        await clickhouse_client.insert_document(
+            document_id=test_doc_id,
+            filename="test-reinsert.pdf",
+            file_size=1024,
+            page_count=3,
+            upload_timestamp=uploaded,
+            processing_time_ms=100.0,
+            status="success",
+        )
+    await clickhouse_client.insert_finding(
+        document_id=test_doc_id,
+        finding_type="email",
+        value="reinsert@example.com",
+        page_number=1,
+        confidence=1.0,
+        context="Email: reinsert@example.com",
+    )
+    await clickhouse_client.flush()
+    
+    after = await clickhouse_client.get_summary_statistics()
+    direct_after = await _direct_totals(clickhouse_client)
+    
+    assert after["total_documents"] - before["total_documents"] == 1
+    assert after["total_pages"] - before["total_pages"] == 3
+    assert (
+        after["total_documents"] - before["total_documents"]
+        == direct_after[0] - direct_before[0]
+    )
+    assert (
+        after["total_findings"] - before["total_findings"]
+        == direct_after[1] - direct_before[1]
+    )
+
+
 @pytest.mark.asyncio
 async def test_health_check(clickhouse_client):
     """Test health check functionality."""
@@ -117,6 +117,41 @@ class TestSettings:
         with pytest.raises(ValueError, match="processing_timeout must be positive"):
             settings.validate_settings()
     
+    def test_validate_settings_zero_processing_workers(self):
+        """Test settings validation with no processing workers."""
+        settings = Settings(processing_workers=0)
+        
+        with pytest.raises(ValueError, match="processing_workers must be positive"):
+            settings.validate_settings()
+    
+    def test_validate_settings_negative_stats_cache_ttl(self):
+        """Test settings validation with negative stats cache TTL."""
+        settings = Settings(stats_cache_ttl_seconds=-1)
+        
+        with pytest.raises(ValueError, match="stats_cache_ttl_seconds must not be negative"):
+            settings.validate_settings()
+    
+    def test_validate_settings_precomputes_derived_values(self):
+        """Test that validation caches the URL and normalized extensions."""
+        settings = Settings(
+            clickhouse_host="db",
+            clickhouse_port=9000,
+            clickhouse_database="scanner",
+            clickhouse_password="",
+            clickhouse_secure=False,
+            allowed_file_extensions=[".PDF", ".Doc"],
+        )
+        settings.validate_settings()
+        
+        assert settings._clickhouse_url == "clickhouse://db:9000/scanner"
+        assert settings.allowed_extensions == frozenset({".pdf", ".doc"})
+        
+        settings.allowed_file_extensions = [".txt"]
+        settings.clickhouse_host = "other"
+        
+        assert settings.allowed_extensions == frozenset({".txt"})
+        assert settings.get_clickhouse_url() == "clickhouse://other:9000/scanner"
+    
     def test_settings_env_file(self):
         """Test loading settings from .env file."""
         # Create a mock .env file content
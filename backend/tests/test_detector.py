@@ -5,8 +5,11 @@ Tests cover email detection, SSN detection with various formats,
 validation logic, edge cases, and performance requirements.
 """
 
+import dataclasses
+import random
 import time
 from typing import List, Tuple
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -91,10 +94,12 @@ class TestSensitiveDataDetector:
             "Invalid SSN: 000-12-3456",  # Invalid area
             "Bad SSN: 666-12-3456",  # Invalid area
             "Wrong SSN: 900-12-3456",  # Invalid area
+            "Wrong SSN: 999-12-3456",  # Invalid area
             "Bad format: 123-00-4567",  # Invalid group
             "Wrong format: 123-45-0000",  # Invalid serial
             "Not SSN: 12-345-6789",  # Wrong format
             "Not SSN: 1234-56-789",  # Wrong format
+            "Mixed SSN: 123-45 6789",  # Inconsistent separators
         ]
 
     def test_detector_initialization(self) -> None:
@@ -102,13 +107,17 @@ class TestSensitiveDataDetector:
         detector = SensitiveDataDetector()
         assert detector is not None
         assert hasattr(detector, "_email_pattern")
-        assert hasattr(detector, "_ssn_patterns")
+        assert hasattr(detector, "_ssn_pattern")
 
     def test_factory_function(self) -> None:
         """Test the factory function creates a valid detector instance."""
         detector = create_detector()
         assert isinstance(detector, SensitiveDataDetector)
 
+    def test_factory_function_reuses_instance(self) -> None:
+        """Test the factory returns one shared detector so patterns compile once."""
+        assert create_detector() is create_detector()
+
     def test_detect_emails_parametrized(
         self, detector: SensitiveDataDetector, email_test_cases: List[Tuple[str, List[str]]]
     ) -> None:
@@ -160,6 +169,35 @@ class TestSensitiveDataDetector:
             ssn_findings = [f for f in findings if f.type == FindingType.SSN]
             assert len(ssn_findings) == 0, f"Invalid SSN detected in: {text}"
 
+    def test_ssn_component_boundaries(self, detector: SensitiveDataDetector) -> None:
+        """
+        Test SSN components right next to the excluded SSA ranges.
+        
+        Args:
+            detector: The detector instance to test.
+        """
+        valid = ["001-01-0001", "665-45-6789", "667-45-6789", "899-99-9999", "660-10-1000"]
+        invalid = ["666-45-6789", "900-45-6789", "000-45-6789", "123-00-6789", "123-45-0000"]
+
+        found = {f.value for f in detector.detect(" ".join(valid + invalid))}
+
+        assert found == set(valid)
+
+    def test_ssn_line_wrapped(self, detector: SensitiveDataDetector) -> None:
+        """
+        Test SSNs whose whitespace separators differ, as when a line wraps.
+        
+        Args:
+            detector: The detector instance to test.
+        """
+        for text in ("x 123 45\n6789 y", "123 45\t6789", "123\n45 6789"):
+            assert [f.value for f in detector.detect(text)] == [text.strip("xy ")]
+            assert detector.redact(text) == text.replace(text.strip("xy "), "[REDACTED]")
+
+        # Dashes and whitespace still do not mix
+        assert detector.detect("123-45\n6789") == []
+        assert detector.redact("123-45\n6789") == "123-45\n6789"
+
     def test_email_position_tracking(self, detector: SensitiveDataDetector) -> None:
         """
         Test accurate position tracking for email addresses.
@@ -221,6 +259,9 @@ class TestSensitiveDataDetector:
         email_values = {f.value for f in email_findings}
         assert email_values == {"john.doe@company.com", "jdoe@personal.com"}
         assert ssn_findings[0].value == "123-45-6789"
+        assert [f.value for f in findings] == [
+            "john.doe@company.com", "123-45-6789", "jdoe@personal.com"
+        ]
 
     def test_ssn_confidence_with_context(self, detector: SensitiveDataDetector) -> None:
         """
@@ -241,6 +282,202 @@ class TestSensitiveDataDetector:
         assert findings_with[0].confidence == 1.0  # Has context
         assert findings_without[0].confidence == 0.8  # No context
 
+    def test_ssn_confidence_keyword_matching(self, detector: SensitiveDataDetector) -> None:
+        """
+        Test that context keywords match literally and case-insensitively.
+        
+        Args:
+            detector: The detector instance to test.
+        """
+        for text in ("Employee SS#: 123-45-6789", "TAX ID 123-45-6789"):
+            findings = detector.detect(text)
+            assert findings[0].confidence == 1.0, text
+
+        findings = detector.detect("Account ss 123-45-6789")
+        assert findings[0].confidence == 0.8
+
+    def test_ssn_confidence_context_window(self, detector: SensitiveDataDetector) -> None:
+        """
+        Test that only keywords within the window before each SSN count.
+        
+        Args:
+            detector: The detector instance to test.
+        """
+        text = (
+            "SSN " + "x" * 60 + " 123-45-6789 "
+            + "taxpayer 234-56-7890 "
+            + "345-67-8901 ssn"
+        )
+        findings = detector.detect(text)
+
+        assert [f.confidence for f in findings] == [0.8, 1.0, 1.0]
+
+        findings = detector.detect("345-67-8901 ssn")
+        assert findings[0].confidence == 0.8
+
+    def test_ssn_context_with_length_changing_case(self, detector: SensitiveDataDetector) -> None:
+        """
+        Test context checks stay aligned when lower-casing changes text length.
+        
+        Args:
+            detector: The detector instance to test.
+        """
+        text = "İstanbul office " * 5 + "SSN: 123-45-6789"
+        findings = detector.detect(text)
+
+        assert findings[0].value == "123-45-6789"
+        assert findings[0].confidence == 1.0
+
+    def test_detect_without_context(self, detector: SensitiveDataDetector) -> None:
+        """
+        Test that context extraction can be skipped.
+        
+        Args:
+            detector: The detector instance to test.
+        """
+        text = "Email: john@example.com, SSN: 123-45-6789"
+        findings = detector.detect(text, include_context=False)
+
+        assert [f.value for f in findings] == ["john@example.com", "123-45-6789"]
+        assert all(f.context is None for f in findings)
+        assert findings[1].confidence == 1.0
+
+    def test_detect_stream_matches_detect(self, detector: SensitiveDataDetector) -> None:
+        """
+        Test that chunked detection equals detection over the joined text.
+        
+        Args:
+            detector: The detector instance to test.
+        """
+        text = "".join(
+            f"Row {i}: user{i}@example.com, SSN 123-45-{1000 + i} filler text. "
+            if i % 3 else f"Row {i}: taxpayer 234 56 {2000 + i} " + "x" * 300 + " "
+            for i in range(60)
+        )
+        expected = detector.detect(text)
+
+        for size in (1, 7, 64, 500, 4096):
+            chunks = [text[i:i + size] for i in range(0, len(text), size)]
+            assert list(detector.detect_stream(chunks)) == expected, size
+
+        assert list(detector.detect_stream([])) == []
+
+    def test_detect_stream_digit_run_across_trim(self, detector: SensitiveDataDetector) -> None:
+        """
+        Test that trimming the buffer inside a digit run does not create a match.
+        
+        Args:
+            detector: The detector instance to test.
+        """
+        text = "334452052579643602011 " + " " * 502
+        chunks = [text[i:i + 104] for i in range(0, len(text), 104)]
+
+        assert detector.detect(text) == []
+        assert list(detector.detect_stream(chunks)) == []
+
+    def test_detect_stream_fuzz(self, detector: SensitiveDataDetector) -> None:
+        """
+        Test chunked detection against detect() on random digit, space and @ text.
+        
+        Args:
+            detector: The detector instance to test.
+        """
+        rng = random.Random(1234)
+        alphabets = ["0123456789 ", "0123456789 @", "0123456789 -@a.", "0123456789  \n-@abc.ssn"]
+
+        for _ in range(150):
+            text = "".join(rng.choice(rng.choice(alphabets)) for _ in range(rng.randint(0, 1500)))
+            if rng.random() < 0.5:
+                text = text.replace("@", "@example.com ", 5)
+            expected = detector.detect(text)
+
+            for size in (1, 7, 64, 104, 500):
+                chunks = [text[i:i + size] for i in range(0, len(text), size)]
+                assert list(detector.detect_stream(chunks)) == expected, (size, text)
+
+    def test_detect_pages_matches_detect(self, detector: SensitiveDataDetector) -> None:
+        """
+        Test that single-pass page detection equals detecting each page alone.
+        
+        Args:
+            detector: The detector instance to test.
+        """
+        pages = [
+            "Contact: admin@company.com",
+            "Employee SSN: 456-78-9012",
+            "",
+            "Page ends with a taxpayer 123",
+            "45-6789 starts this page, then support@company.com",
+        ]
+        expected = [
+            (index, finding)
+            for index, page in enumerate(pages)
+            for finding in detector.detect(page)
+        ]
+
+        assert detector.detect_pages(pages) == expected
+        assert detector.detect_pages([]) == []
+
+    def test_redact(self, detector: SensitiveDataDetector) -> None:
+        """
+        Test single-pass redaction of emails and valid SSNs.
+        
+        Args:
+            detector: The detector instance to test.
+        """
+        text = (
+            "Email john@example.com, SSN 123-45-6789, spaced 123 45 6789, "
+            "invalid 000-12-3456, mixed 123-45 6789"
+        )
+
+        assert detector.redact(text) == (
+            "Email [REDACTED], SSN [REDACTED], spaced [REDACTED], "
+            "invalid 000-12-3456, mixed 123-45 6789"
+        )
+        assert detector.redact("SSN: 123456789", replacement="***") == "SSN: ***"
+        assert detector.redact("") == ""
+        assert detector.redact(None) == ""
+
+    def test_email_tld_rejects_pipe(self, detector: SensitiveDataDetector) -> None:
+        """
+        Test that a pipe character is not accepted as part of the TLD.
+        
+        Args:
+            detector: The detector instance to test.
+        """
+        assert detector.detect("Mail user@example.c|m now") == []
+        assert detector.detect("Mail user@example.com|next")[0].value == "user@example.com"
+
+    def test_email_long_runs_without_domain(self, detector: SensitiveDataDetector) -> None:
+        """
+        Test long local-part and domain runs that never form an email.
+        
+        Args:
+            detector: The detector instance to test.
+        """
+        text = "a." * 2000 + " x@" + "a-" * 2000 + " contact me@example.com"
+        findings = detector.detect(text)
+
+        assert [f.value for f in findings] == ["me@example.com"]
+
+    def test_email_scan_skipped_without_at_sign(self) -> None:
+        """Test that text without "@" never reaches the email regex."""
+        detector = SensitiveDataDetector()
+        detector._email_pattern = MagicMock()
+
+        findings = detector.detect("No addresses here, only SSN 123-45-6789")
+
+        assert [f.type for f in findings] == [FindingType.SSN]
+        detector._email_pattern.finditer.assert_not_called()
+
+    def test_finding_is_slotted_and_immutable(self) -> None:
+        """Test findings carry no per-instance dict and cannot be modified."""
+        finding = Finding(type=FindingType.EMAIL, value="a@b.com", start_pos=0, end_pos=7)
+
+        assert not hasattr(finding, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            finding.confidence = 0.5
+
     def test_empty_and_none_input(self, detector: SensitiveDataDetector) -> None:
         """
         Test handling of empty and None inputs.
@@ -297,6 +534,69 @@ class TestSensitiveDataDetector:
 
         assert len(findings) == 1
         assert findings[0].redaction_text == "[REDACTED]"
+        assert "redaction_text" not in Finding.__slots__
+
+    def test_ascii_and_unicode_paths_agree(self, detector: SensitiveDataDetector) -> None:
+        """
+        Test that ASCII text scanned as bytes yields the same findings as str scanning.
+
+        Args:
+            detector: The detector instance to test.
+        """
+        ascii_text = "SSN: 123-45-6789, mail jane.doe@example.com"
+        unicode_text = "Café SSN: 123-45-6789, mail jane.doe@example.com"
+
+        ascii_findings = detector.detect(ascii_text)
+        unicode_findings = detector.detect(unicode_text)
+        shift = len(unicode_text) - len(ascii_text)
+
+        assert [(f.type, f.value, f.confidence) for f in ascii_findings] == [
+            (f.type, f.value, f.confidence) for f in unicode_findings
+        ]
+        assert [f.start_pos + shift for f in ascii_findings] == [
+            f.start_pos for f in unicode_findings
+        ]
+        assert all(isinstance(f.value, str) for f in ascii_findings)
+
+    def test_ascii_text_uses_bytes_patterns(self, detector: SensitiveDataDetector) -> None:
+        """
+        Test that ASCII-only text is scanned with the byte patterns.
+
+        Args:
+            detector: The detector instance to test.
+        """
+        detector._email_pattern = MagicMock()
+        detector._ssn_pattern = MagicMock()
+
+        findings = detector.detect("Email: test@example.com SSN: 123-45-6789")
+
+        assert len(findings) == 2
+        detector._email_pattern.finditer.assert_not_called()
+        detector._ssn_pattern.finditer.assert_not_called()
+
+    def test_debug_logging_deferred(
+        self,
+        detector: SensitiveDataDetector,
+        caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """
+        Test that per-match debug messages are only emitted when DEBUG is enabled.
+
+        Args:
+            detector: The detector instance to test.
+            caplog: Pytest log capture fixture.
+        """
+        text = "Email: test@example.com SSN: 123-45-6789"
+
+        with caplog.at_level("INFO", logger="app.core.detector"):
+            detector.detect(text)
+        assert not any("Found" in r.getMessage() for r in caplog.records)
+
+        with caplog.at_level("DEBUG", logger="app.core.detector"):
+            detector.detect(text)
+        messages = [r.getMessage() for r in caplog.records]
+        assert "Found email: test@example.com at position 7" in messages
+        assert any(m.startswith("Found SSN at position 29") for m in messages)
 
     @pytest.mark.slow
     def test_performance_large_text(self, detector: SensitiveDataDetector) -> None:
@@ -5,6 +5,8 @@ This module tests the endpoint functions directly to ensure
 proper coverage of error handling and edge cases.
 """
 
+import json
+
 import pytest
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch, ANY
@@ -27,12 +29,8 @@ class TestUploadEndpoint:
             assert result == mock_client
     
     @pytest.mark.asyncio
-    async def test_upload_pdf_success_with_findings(self):
-        """Test successful PDF upload with findings."""
-        mock_file = MagicMock(spec=UploadFile)
-        mock_file.filename = "test.pdf"
-        mock_file.read = AsyncMock(return_value=b"%PDF-1.4\nTest content\n%%EOF")
-        
+    async def test_process_upload_success_with_findings(self, make_upload_job):
+        """Test successful processing of a queued upload with findings."""
         mock_processor = MagicMock()
         mock_result = MagicMock()
         mock_result.document_id = str(uuid4())
@@ -52,22 +50,17 @@ class TestUploadEndpoint:
         
         mock_db = AsyncMock()
         
-        with patch("app.api.endpoints.upload.validate_file_extension"):
-            with patch("app.api.endpoints.upload.create_pdf_processor", return_value=mock_processor):
-                with patch("app.api.endpoints.upload.get_db_client", return_value=mock_db):
-                    with patch("app.api.endpoints.upload.datetime") as mock_datetime:
-                        mock_datetime.utcnow.return_value = datetime(2024, 1, 1)
-                        
-                        result = await upload.upload_pdf(mock_file)
-                        
-                        assert result["status"] == "success"
-                        assert result["findings_count"] == 1
-                        assert mock_db.insert_document.called
-                        assert mock_db.insert_finding.called
-                        assert mock_db.insert_metric.called
+        with patch("app.api.endpoints.upload.create_pdf_processor", return_value=mock_processor):
+            with patch("app.api.endpoints.upload.get_db_client", return_value=mock_db):
+                await upload.process_upload_job(make_upload_job())
+                
+                assert mock_db.insert_document.called
+                mock_db.insert_findings_bulk.assert_awaited_once()
+                assert len(mock_db.insert_findings_bulk.call_args[0][0]) == 1
+                mock_db.insert_metrics_bulk.assert_awaited_once()
     
     @pytest.mark.asyncio
-    async def test_upload_pdf_file_read_error(self):
+    async def test_upload_pdf_file_read_error(self, upload_queue):
         """Test upload with file read error."""
         mock_file = MagicMock(spec=UploadFile)
         mock_file.filename = "test.pdf"
@@ -79,29 +72,23 @@ class TestUploadEndpoint:
             
             assert exc_info.value.status_code == 400
             assert "Failed to read uploaded file" in str(exc_info.value.detail)
+            assert upload_queue.empty()
     
     @pytest.mark.asyncio
-    async def test_upload_pdf_processing_error(self):
-        """Test upload with processing error."""
-        mock_file = MagicMock(spec=UploadFile)
-        mock_file.filename = "test.pdf"
-        mock_file.read = AsyncMock(return_value=b"%PDF-1.4\nTest\n%%EOF")
-        
+    async def test_process_upload_processing_error(self, make_upload_job):
+        """Test processing of a queued upload with an unexpected error."""
         mock_processor = MagicMock()
         mock_processor.process_pdf.side_effect = Exception("Processing failed")
         
         mock_db = AsyncMock()
         
-        with patch("app.api.endpoints.upload.validate_file_extension"):
-            with patch("app.api.endpoints.upload.create_pdf_processor", return_value=mock_processor):
-                with patch("app.api.endpoints.upload.get_db_client", return_value=mock_db):
-                    with patch("app.api.endpoints.upload.datetime") as mock_datetime:
-                        mock_datetime.utcnow.return_value = datetime(2024, 1, 1)
-                        
-                        with pytest.raises(HTTPException) as exc_info:
-                            await upload.upload_pdf(mock_file)
-                        
-                        assert exc_info.value.status_code == 500
+        with patch("app.api.endpoints.upload.create_pdf_processor", return_value=mock_processor):
+            with patch("app.api.endpoints.upload.get_db_client", return_value=mock_db):
+                await upload.process_upload_job(make_upload_job())
+                
+                call_args = mock_db.insert_document.call_args[1]
+                assert call_args["status"] == "failed"
+                assert call_args["error_message"] == "Processing failed"
 
 
 class TestFindingsEndpoint:
@@ -132,27 +119,27 @@ class TestFindingsEndpoint:
                 "error_message": None
             }
         ]
-        mock_db.get_findings_by_document.return_value = [
-            {
-                "finding_id": str(uuid4()),
-                "document_id": str(uuid4()),
-                "finding_type": "email",
-                "value": "test@example.com",
-                "page_number": 1,
-                "confidence": 0.95,
-                "context": "Email: test@example.com",
-                "detected_at": datetime.now(timezone.utc)
-            }
-        ]
+        mock_db.get_findings_summary.return_value = {}
+        mock_db.get_findings_columnar.return_value = {
+            "finding_id": [str(uuid4())],
+            "document_id": [str(uuid4())],
+            "finding_type": ["email"],
+            "value": ["test@example.com"],
+            "page_number": [1],
+            "confidence": [0.95],
+            "context": ["Email: test@example.com"],
+            "detected_at": [datetime.now(timezone.utc)]
+        }
         
         with patch("app.api.endpoints.findings.get_db_client", return_value=mock_db):
-            result = await findings.get_all_findings(
+            response = await findings.get_all_findings(
                 finding_type="email",
                 start_date=datetime(2024, 1, 1),
                 end_date=datetime(2024, 12, 31),
                 page=2,
                 page_size=5
             )
+            result = findings.FindingsListResponse.model_validate_json(response.body)
             
             assert result.total == 10
             assert result.page == 2
@@ -218,7 +205,8 @@ class TestFindingsEndpoint:
         ]
         
         with patch("app.api.endpoints.findings.get_db_client", return_value=mock_db):
-            result = await findings.get_document_findings(doc_id)
+            response = await findings.get_document_findings(doc_id)
+            result = findings.DocumentFindingsResponse.model_validate_json(response.body)
             
             assert result.document_id == doc_id
             assert result.filename == "test.pdf"
@@ -241,7 +229,8 @@ class TestFindingsEndpoint:
         }
         
         with patch("app.api.endpoints.findings.get_db_client", return_value=mock_db):
-            result = await findings.get_findings_summary()
+            response = await findings.get_findings_summary()
+            result = json.loads(response.body)
             
             assert result["total_documents"] == 100
             assert result["total_findings"] == 250
@@ -4,16 +4,29 @@ Additional tests for findings endpoint to increase coverage.
 This module tests edge cases and error scenarios in the findings endpoint.
 """
 
+import asyncio
+import base64
+import json
+
 import pytest
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch, ANY
 from uuid import uuid4
 
 from fastapi import HTTPException
+from app.db.clickhouse import FINDING_COLUMNS
 from app.api.endpoints.findings import (
+    DocumentFindingsResponse,
+    FindingsListResponse,
+    _row_to_document,
+    _row_to_finding,
+    decode_cursor,
+    document_etag,
+    encode_cursor,
     get_all_findings,
     get_document_findings,
     get_findings_summary,
+    invalidate_stats_cache,
 )
 
 
@@ -41,13 +54,128 @@ class TestFindingsEndpointCoverage:
         mock_db.get_documents.return_value = []
         
         with patch("app.api.endpoints.findings.get_db_client", return_value=mock_db):
-            result = await get_all_findings(page=1, page_size=20)
+            response = await get_all_findings(page=1, page_size=20)
+            result = FindingsListResponse.model_validate_json(response.body)
             
             assert result.total == 0
             assert result.page == 1
             assert result.page_size == 20
             assert result.findings == []
     
+    @pytest.mark.asyncio
+    async def test_get_all_findings_summary_only(self):
+        """Test get_all_findings skips the row fetch when findings are excluded."""
+        doc_id = str(uuid4())
+        mock_db = AsyncMock()
+        mock_db.count_documents.return_value = 1
+        mock_db.get_documents.return_value = [
+            {
+                "document_id": doc_id,
+                "filename": "summary.pdf",
+                "file_size": 1024,
+                "page_count": 1,
+                "upload_timestamp": datetime.now(timezone.utc),
+                "processing_time_ms": 100.0,
+                "status": "success",
+                "error_message": None
+            }
+        ]
+        mock_db.get_findings_summary.return_value = {
+            doc_id: {"total": 3, "email": 2, "ssn": 1}
+        }
+        
+        with patch("app.api.endpoints.findings.get_db_client", return_value=mock_db):
+            response = await get_all_findings(
+                page=1, page_size=20, finding_type=None, include_findings=False
+            )
+            result = FindingsListResponse.model_validate_json(response.body)
+            
+            assert result.findings[0].findings == []
+            assert result.findings[0].summary == {"total": 3, "email": 2, "ssn": 1}
+            mock_db.get_findings_columnar.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_get_all_findings_returns_next_cursor(self):
+        """Test that a full page reports more results and a cursor to them."""
+        timestamps = [datetime(2024, 1, 3), datetime(2024, 1, 2), datetime(2024, 1, 1)]
+        documents = [
+            {
+                "document_id": str(uuid4()),
+                "filename": f"doc{i}.pdf",
+                "file_size": 1024,
+                "page_count": 1,
+                "upload_timestamp": ts,
+                "processing_time_ms": 100.0,
+                "status": "success",
+                "error_message": None
+            }
+            for i, ts in enumerate(timestamps)
+        ]
+        mock_db = AsyncMock()
+        mock_db.count_documents.return_value = 3
+        mock_db.get_documents.return_value = documents
+        mock_db.get_findings_columnar.return_value = {
+            column: [] for column in FINDING_COLUMNS
+        }
+        mock_db.get_findings_summary.return_value = {}
+        
+        with patch("app.api.endpoints.findings.get_db_client", return_value=mock_db):
+            response = await get_all_findings(page=1, page_size=2, finding_type=None)
+            result = FindingsListResponse.model_validate_json(response.body)
+            
+            assert len(result.findings) == 2
+            assert result.has_more is True
+            assert decode_cursor(result.next_cursor) == (
+                timestamps[1], documents[1]["document_id"]
+            )
+            assert mock_db.get_documents.call_args.kwargs["limit"] == 3
+    
+    @pytest.mark.asyncio
+    async def test_get_all_findings_with_cursor_skips_count(self):
+        """Test that cursor requests seek past the cursor and skip the count."""
+        doc_id = str(uuid4())
+        cursor = encode_cursor(datetime(2024, 1, 2), doc_id)
+        mock_db = AsyncMock()
+        mock_db.get_documents.return_value = []
+        
+        with patch("app.api.endpoints.findings.get_db_client", return_value=mock_db):
+            response = await get_all_findings(
+                page=1, page_size=20, doc_id=None, start_date=None, end_date=None,
+                cursor=cursor,
+            )
+            result = FindingsListResponse.model_validate_json(response.body)
+            
+            assert result.total is None
+            assert result.has_more is False
+            assert result.next_cursor is None
+            mock_db.count_documents.assert_not_called()
+            kwargs = mock_db.get_documents.call_args.kwargs
+            assert kwargs["offset"] == 0
+            assert kwargs["before_timestamp"] == datetime(2024, 1, 2)
+            assert kwargs["before_document_id"] == doc_id
+    
+    @pytest.mark.asyncio
+    async def test_get_all_findings_invalid_cursor(self):
+        """Test that a malformed cursor is rejected as a bad request."""
+        with pytest.raises(HTTPException) as exc_info:
+            await get_all_findings(cursor="not-a-cursor")
+        
+        assert exc_info.value.status_code == 400
+    
+    @pytest.mark.parametrize("cursor", [
+        "not-a-cursor",
+        "abc",  # incorrect base64 padding
+        base64.urlsafe_b64encode(b"\xff\xfe|x").decode(),  # not UTF-8
+        base64.urlsafe_b64encode(b"2024-01-02T00:00:00").decode(),  # no document ID
+        base64.urlsafe_b64encode(b"2024-01-02T00:00:00|' OR 1=1 --").decode(),
+    ])
+    def test_decode_cursor_rejects_malformed_cursor(self, cursor):
+        """Test that every malformed cursor is a bad request rather than a server error."""
+        with pytest.raises(HTTPException) as exc_info:
+            decode_cursor(cursor)
+        
+        assert exc_info.value.status_code == 400
+    
     @pytest.mark.asyncio
     async def test_get_document_findings_database_error(self):
         """Test get_document_findings with database error during document fetch."""
@@ -98,6 +226,57 @@ class TestFindingsEndpointCoverage:
             assert exc_info.value.status_code == 500
             assert "Failed to retrieve summary statistics" in str(exc_info.value.detail)
     
+    @pytest.mark.asyncio
+    async def test_get_findings_summary_is_cached(self):
+        """Test get_findings_summary serves repeat requests from the cache."""
+        mock_db = AsyncMock()
+        mock_db.get_summary_statistics.return_value = {
+            "total_documents": 3,
+            "total_findings": 7,
+        }
+        
+        with patch("app.api.endpoints.findings.get_db_client", return_value=mock_db):
+            first = await get_findings_summary()
+            second = await get_findings_summary()
+            
+            assert first.body == second.body
+            assert json.loads(first.body)["total_documents"] == 3
+            mock_db.get_summary_statistics.assert_awaited_once()
+            
+            invalidate_stats_cache()
+            await get_findings_summary()
+            
+            assert mock_db.get_summary_statistics.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_get_findings_summary_single_flight(self):
+        """Test concurrent get_findings_summary calls share one refresh."""
+        mock_db = AsyncMock()
+        mock_db.get_summary_statistics.return_value = {"total_documents": 1}
+        
+        with patch("app.api.endpoints.findings.get_db_client", return_value=mock_db):
+            results = await asyncio.gather(*(get_findings_summary() for _ in range(5)))
+        
+        assert all(result.body == results[0].body for result in results)
+        mock_db.get_summary_statistics.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_get_findings_summary_invalidated_during_refresh(self):
+        """Test a refresh overlapping an upload is not cached as fresh."""
+        mock_db = AsyncMock()
+        
+        async def stats_then_upload():
+            invalidate_stats_cache()
+            return {"total_documents": 1}
+        
+        mock_db.get_summary_statistics.side_effect = stats_then_upload
+        
+        with patch("app.api.endpoints.findings.get_db_client", return_value=mock_db):
+            await get_findings_summary()
+            await get_findings_summary()
+        
+        assert mock_db.get_summary_statistics.await_count == 2
+    
     @pytest.mark.asyncio
     async def test_get_all_findings_with_all_filters(self):
         """Test get_all_findings with all filter parameters."""
@@ -115,27 +294,27 @@ class TestFindingsEndpointCoverage:
                 "error_message": None
             }
         ]
-        mock_db.get_findings_by_document.return_value = [
-            {
-                "finding_id": str(uuid4()),
-                "document_id": str(uuid4()),
-                "finding_type": "email",
-                "value": "test@example.com",
-                "page_number": 1,
-                "confidence": 0.95,
-                "context": "Email: test@example.com",
-                "detected_at": datetime.now(timezone.utc)
-            }
-        ]
+        mock_db.get_findings_summary.return_value = {}
+        mock_db.get_findings_columnar.return_value = {
+            "finding_id": [str(uuid4())],
+            "document_id": [str(uuid4())],
+            "finding_type": ["email"],
+            "value": ["test@example.com"],
+            "page_number": [1],
+            "confidence": [0.95],
+            "context": ["Email: test@example.com"],
+            "detected_at": [datetime.now(timezone.utc)]
+        }
         
         with patch("app.api.endpoints.findings.get_db_client", return_value=mock_db):
-            result = await get_all_findings(
+            response = await get_all_findings(
                 finding_type="email",
                 start_date=datetime(2024, 1, 1),
                 end_date=datetime(2024, 12, 31),
                 page=1,
                 page_size=10
             )
+            result = FindingsListResponse.model_validate_json(response.body)
             
             assert result.total == 5
             assert result.page == 1
@@ -167,7 +346,8 @@ class TestFindingsEndpointCoverage:
         mock_db.get_findings_by_document.return_value = []
         
         with patch("app.api.endpoints.findings.get_db_client", return_value=mock_db):
-            result = await get_document_findings(doc_id)
+            response = await get_document_findings(doc_id)
+            result = DocumentFindingsResponse.model_validate_json(response.body)
             
             assert result.document_id == doc_id
             assert result.filename == "empty.pdf"
@@ -175,3 +355,112 @@ class TestFindingsEndpointCoverage:
             assert result.summary["total"] == 0
             assert result.summary.get("email", 0) == 0
             assert result.summary.get("ssn", 0) == 0
+    
+    def test_row_to_finding_maps_all_fields(self):
+        """Test that finding rows map onto FindingResponse field by field."""
+        row = {
+            "finding_id": uuid4().hex,
+            "document_id": uuid4().hex,
+            "finding_type": "ssn",
+            "value": "123-45-6789",
+            "page_number": 2,
+            "confidence": 0.9,
+            "detected_at": datetime(2024, 1, 1, tzinfo=timezone.utc),
+        }
+        
+        finding = _row_to_finding(row)
+        
+        assert finding.model_dump() == {**row, "context": None}
+    
+    def test_row_to_document_maps_all_fields(self):
+        """Test that document rows map onto DocumentFindingsResponse field by field."""
+        row = {
+            "document_id": uuid4().hex,
+            "filename": "mapped.pdf",
+            "file_size": 2048,
+            "page_count": 3,
+            "upload_timestamp": datetime(2024, 1, 1, tzinfo=timezone.utc),
+            "processing_time_ms": 12.5,
+            "status": "success",
+            "error_message": None,
+        }
+        
+        document = _row_to_document(row, [], {"total": 0})
+        
+        expected = {key: value for key, value in row.items() if key != "error_message"}
+        assert document.model_dump() == {**expected, "findings": [], "summary": {"total": 0}}
+    
+    @pytest.mark.asyncio
+    async def test_get_document_findings_sets_cache_headers(self):
+        """Test that processed documents are served with an ETag and immutable caching."""
+        document = {
+            "document_id": uuid4().hex,
+            "filename": "cached.pdf",
+            "file_size": 1024,
+            "page_count": 1,
+            "upload_timestamp": datetime(2024, 1, 1, tzinfo=timezone.utc),
+            "processing_time_ms": 100.0,
+            "status": "success",
+            "error_message": None
+        }
+        mock_db = AsyncMock()
+        mock_db.get_document.return_value = document
+        mock_db.get_findings_by_document.return_value = []
+        
+        with patch("app.api.endpoints.findings.get_db_client", return_value=mock_db):
+            response = await get_document_findings(document["document_id"])
+            
+            assert response.headers["ETag"] == document_etag(document)
+            assert response.headers["Cache-Control"] == "public, max-age=3600, immutable"
+    
+    @pytest.mark.asyncio
+    async def test_get_document_findings_not_modified(self):
+        """Test that a matching If-None-Match skips the findings query."""
+        document = {
+            "document_id": uuid4().hex,
+            "filename": "cached.pdf",
+            "file_size": 1024,
+            "page_count": 1,
+            "upload_timestamp": datetime(2024, 1, 1, tzinfo=timezone.utc),
+            "processing_time_ms": 100.0,
+            "status": "success",
+            "error_message": None
+        }
+        mock_db = AsyncMock()
+        mock_db.get_document.return_value = document
+        etag = document_etag(document)
+        
+        with patch("app.api.endpoints.findings.get_db_client", return_value=mock_db):
+            result = await get_document_findings(
+                document["document_id"], if_none_match=f'"other", W/{etag}'
+            )
+            
+            assert result.status_code == 304
+            assert result.headers["ETag"] == etag
+            mock_db.get_findings_by_document.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_get_document_findings_failed_not_cached(self):
+        """Test that failed documents are never cached or revalidated."""
+        document = {
+            "document_id": uuid4().hex,
+            "filename": "broken.pdf",
+            "file_size": 1024,
+            "page_count": 0,
+            "upload_timestamp": datetime(2024, 1, 1, tzinfo=timezone.utc),
+            "processing_time_ms": 0.0,
+            "status": "failed",
+            "error_message": "PDF is corrupted"
+        }
+        mock_db = AsyncMock()
+        mock_db.get_document.return_value = document
+        mock_db.get_findings_by_document.return_value = []
+        
+        with patch("app.api.endpoints.findings.get_db_client", return_value=mock_db):
+            response = await get_document_findings(document["document_id"], if_none_match="*")
+            result = DocumentFindingsResponse.model_validate_json(response.body)
+            
+            assert result.status == "failed"
+            assert result.error_message == "PDF is corrupted"
+            assert response.headers["Cache-Control"] == "no-store"
+            assert "ETag" not in response.headers
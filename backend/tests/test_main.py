@@ -7,9 +7,12 @@ and global configurations.
 
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi.responses import ORJSONResponse
 from fastapi.testclient import TestClient
 
-from app.main import create_application, lifespan
+from app.api.endpoints import findings, upload
+from app.db.clickhouse import get_db_client
+from app.main import UploadSizeLimitMiddleware, create_application, lifespan
 
 
 class TestApplication:
@@ -32,6 +35,7 @@ class TestApplication:
             assert app.docs_url == "/api/docs"
             assert app.redoc_url == "/api/redoc"
             assert app.openapi_url == "/api/openapi.json"
+            assert app.router.default_response_class is ORJSONResponse
     
     @pytest.mark.asyncio
     async def test_lifespan_success(self):
@@ -40,6 +44,7 @@ class TestApplication:
         mock_db_client = AsyncMock()
         mock_db_client.initialize = AsyncMock()
         mock_db_client.close = AsyncMock()
+        mock_db_client.add_flush_listener = MagicMock()
         
         with patch("app.main.create_clickhouse_client", return_value=mock_db_client):
             with patch("app.main.logger") as mock_logger:
@@ -47,9 +52,14 @@ class TestApplication:
                     # Startup
                     mock_logger.info.assert_any_call("Starting PDF sensitive data scanner application")
                     mock_db_client.initialize.assert_called_once()
+                    mock_db_client.add_flush_listener.assert_called_once_with(findings.invalidate_stats_cache)
                     mock_logger.info.assert_any_call("ClickHouse connection established")
+                    assert upload._work_queue is not None
+                    mock_app.openapi.assert_called_once_with()
+                    assert get_db_client() is mock_db_client
                 
                 # Shutdown
+                assert upload._work_queue is None
                 mock_logger.info.assert_any_call("Shutting down application")
                 mock_db_client.close.assert_called_once()
                 mock_logger.info.assert_any_call("ClickHouse connection closed")
@@ -76,6 +86,7 @@ class TestApplication:
         mock_db_client = AsyncMock()
         mock_db_client.initialize = AsyncMock()
         mock_db_client.close = AsyncMock(side_effect=Exception("Close failed"))
+        mock_db_client.add_flush_listener = MagicMock()
         
         with patch("app.main.create_clickhouse_client", return_value=mock_db_client):
             with patch("app.main.logger") as mock_logger:
@@ -97,7 +108,8 @@ class TestApplication:
     
     def test_api_health_endpoint(self, test_client):
         """Test API health check endpoint."""
-        with patch("app.main.db_client") as mock_db:
+        with patch("app.main.db_client") as mock_db, \
+             patch("app.main._last_health_ok_ns", 0):
             mock_db.health_check = AsyncMock(return_value=True)
             
             response = test_client.get("/api/health")
@@ -109,7 +121,8 @@ class TestApplication:
     
     def test_api_health_endpoint_db_unhealthy(self, test_client):
         """Test API health check with unhealthy database."""
-        with patch("app.main.db_client") as mock_db:
+        with patch("app.main.db_client") as mock_db, \
+             patch("app.main._last_health_ok_ns", 0):
             mock_db.health_check = AsyncMock(side_effect=Exception("DB Error"))
             
             with patch("app.main.logger") as mock_logger:
@@ -121,6 +134,19 @@ class TestApplication:
                 assert data["database"] == "unhealthy"
                 mock_logger.error.assert_called_once()
     
+    def test_api_health_endpoint_reuses_recent_check(self, test_client):
+        """Test repeated health checks within the TTL probe the database once."""
+        with patch("app.main.db_client") as mock_db, \
+             patch("app.main._last_health_ok_ns", 0):
+            mock_db.health_check = AsyncMock(return_value=True)
+            
+            first = test_client.get("/api/health")
+            second = test_client.get("/api/health")
+            
+            assert first.json()["database"] == "healthy"
+            assert second.json()["database"] == "healthy"
+            mock_db.health_check.assert_awaited_once()
+    
     def test_middleware_configuration(self):
         """Test middleware is properly configured."""
         mock_settings = MagicMock(
@@ -142,6 +168,35 @@ class TestApplication:
             assert any("CORSMiddleware" in m for m in middleware_stack)
             assert any("TrustedHostMiddleware" in m for m in middleware_stack)
     
+    @pytest.mark.asyncio
+    async def test_upload_size_limit_rejects_declared_oversized_body(self):
+        """Test oversized uploads are refused from Content-Length before the body is read."""
+        inner_app = AsyncMock()
+        receive = AsyncMock()
+        middleware = UploadSizeLimitMiddleware(inner_app, max_body_size=1000)
+        sent = []
+        
+        async def send(message):
+            sent.append(message)
+        
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "path": "/api/upload",
+            "headers": [(b"content-length", b"1001")],
+        }
+        await middleware(scope, receive, send)
+        
+        inner_app.assert_not_awaited()
+        receive.assert_not_awaited()
+        assert sent[0]["status"] == 413
+        assert b"exceeds maximum" in sent[1]["body"]
+        
+        # Bodies within the limit, and other routes, reach the application
+        await middleware({**scope, "headers": [(b"content-length", b"1000")]}, receive, send)
+        await middleware({**scope, "path": "/api/findings"}, receive, send)
+        assert inner_app.await_count == 2
+    
     def test_router_inclusion(self):
         """Test all routers are included."""
         app = create_application()
@@ -17,11 +17,13 @@ from app.db.models import (
     DocumentWithFindings,
     Finding,
     FindingResponse,
+    FilterParams,
     FindingType,
     Metric,
     MetricType,
     PaginatedResponse,
     ProcessingStatus,
+    StatisticsResponse,
     SummaryStatistics,
     UploadResponse,
 )
@@ -502,3 +504,31 @@ class TestModelDefaults:
             time_diff = datetime.now(timezone.utc) - metric.recorded_at
         
         assert time_diff.total_seconds() < 60
+
+
+class TestModelValidators:
+    """Test suite for cross-field model validators."""
+
+    def test_filter_params_date_range(self) -> None:
+        """Test that an end date before the start date is rejected."""
+        params = FilterParams(
+            start_date=datetime(2024, 1, 1), end_date=datetime(2024, 12, 31)
+        )
+        assert params.end_date == datetime(2024, 12, 31)
+
+        with pytest.raises(ValidationError, match="end_date must be after start_date"):
+            FilterParams(start_date=datetime(2024, 12, 31), end_date=datetime(2024, 1, 1))
+
+    def test_statistics_response_success_rate(self) -> None:
+        """Test that a missing success rate is filled in when documents exist."""
+        base_params = {
+            "total_findings": 5,
+            "findings_by_type": {"email": 5},
+            "average_processing_time_ms": 10.0,
+            "total_pages_processed": 3,
+            "documents_with_findings": 1,
+            "success_rate": 0.0,
+        }
+
+        assert StatisticsResponse(total_documents=2, **base_params).success_rate == 1.0
+        assert StatisticsResponse(total_documents=0, **base_params).success_rate == 0.0
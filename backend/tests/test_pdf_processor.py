@@ -132,6 +132,37 @@ class TestPDFProcessor:
             assert hasattr(finding, 'page_number')
             assert 1 <= finding.page_number <= 3
     
+    def test_parallel_extraction_preserves_page_order(self):
+        """Test page ranges extracted by worker processes are reassembled in order."""
+        buffer = io.BytesIO()
+        pdf_canvas = canvas.Canvas(buffer, pagesize=letter)
+        for page_num in range(1, 6):
+            pdf_canvas.drawString(100, 750, f"Page {page_num}")
+            pdf_canvas.drawString(100, 700, f"Contact: user{page_num}@company.com")
+            pdf_canvas.showPage()
+        pdf_canvas.save()
+        
+        processor = create_pdf_processor(num_workers=2)
+        with patch.object(processor, "_extract_pages_in_parallel",
+                          wraps=processor._extract_pages_in_parallel) as parallel:
+            result = processor.process_pdf(buffer.getvalue(), filename="parallel.pdf")
+        
+        parallel.assert_called_once()
+        assert result.page_count == 5
+        assert [f.page_number for f in result.findings] == [1, 2, 3, 4, 5]
+        assert [f.value for f in result.findings] == [
+            f"user{page_num}@company.com" for page_num in range(1, 6)
+        ]
+    
+    def test_small_pdf_extracted_in_process(self, multi_page_pdf_bytes):
+        """Test PDFs below the page threshold skip the worker processes."""
+        processor = create_pdf_processor(num_workers=4)
+        with patch.object(processor, "_extract_pages_in_parallel") as parallel:
+            result = processor.process_pdf(multi_page_pdf_bytes, filename="small.pdf")
+        
+        parallel.assert_not_called()
+        assert result.page_count == 3
+    
     def test_process_empty_pdf(self, processor, empty_pdf_bytes):
         """Test processing an empty PDF."""
         result = processor.process_pdf(empty_pdf_bytes, filename="empty.pdf")
@@ -184,6 +215,17 @@ class TestPDFProcessor:
         assert result.status == "success"
         assert len(result.findings) == 2
     
+    def test_process_pdf_from_spooled_stream(self, processor, simple_pdf_bytes):
+        """Test that seekable streams are parsed in place and sized without reading."""
+        with tempfile.SpooledTemporaryFile(max_size=16) as spooled:
+            spooled.write(simple_pdf_bytes)
+            
+            result = processor.process_pdf_from_stream(spooled, filename="spooled.pdf")
+            
+            assert result.file_size == len(simple_pdf_bytes)
+            assert result.status == "success"
+            assert len(result.findings) == 2
+    
     def test_extract_text_with_encoding_issues(self, processor):
         """Test handling of PDFs with various text encodings."""
         # Create PDF with special characters
@@ -278,6 +320,18 @@ class TestPDFProcessor:
             
             assert "password-protected" in str(exc_info.value).lower()
     
+    def test_encryption_detected_from_trailer(self, processor, simple_pdf_bytes):
+        """Test encrypted PDFs are recognised from their trailer."""
+        writer = PdfWriter(clone_from=PdfReader(io.BytesIO(simple_pdf_bytes)))
+        writer.encrypt("secret")
+        buffer = io.BytesIO()
+        writer.write(buffer)
+        
+        assert processor._is_pdf_encrypted(buffer.getvalue()) is True
+        assert processor._is_pdf_encrypted(buffer) is True
+        assert processor._is_pdf_encrypted(simple_pdf_bytes) is False
+        assert processor._is_pdf_encrypted(io.BytesIO(simple_pdf_bytes)) is False
+    
     def test_get_summary_statistics(self, processor, multi_page_pdf_bytes):
         """Test generation of summary statistics."""
         result = processor.process_pdf(multi_page_pdf_bytes, filename="stats.pdf")
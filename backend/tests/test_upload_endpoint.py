@@ -5,16 +5,28 @@ This module tests additional scenarios for the upload endpoint
 to increase code coverage.
 """
 
+import io
 import pytest
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 from fastapi import HTTPException, UploadFile
-from app.api.endpoints.upload import upload_pdf, get_db_client
+from reportlab.lib.pagesizes import letter
+from reportlab.pdfgen import canvas
+from app.api.endpoints import upload
+from app.api.endpoints.upload import (
+    get_db_client,
+    process_pdf_async,
+    process_upload_job,
+    start_upload_workers,
+    stop_upload_workers,
+    upload_pdf,
+    validate_file_extension,
+)
 from app.services.pdf_processor import (
-    PDFSizeLimitError, 
-    CorruptedPDFError, 
+    PDFSizeLimitError,
+    CorruptedPDFError,
     PDFProcessingError
 )
 from app.db.models import ProcessingStatus
@@ -23,91 +35,155 @@ from app.db.models import ProcessingStatus
 class TestUploadEndpointCoverage:
     """Additional tests for upload endpoint coverage."""
     
+    @pytest.fixture
+    def valid_pdf_bytes(self) -> bytes:
+        """Create a valid PDF with one email and one SSN."""
+        buffer = io.BytesIO()
+        pdf_canvas = canvas.Canvas(buffer, pagesize=letter)
+        pdf_canvas.drawString(100, 700, "Email: test@example.com")
+        pdf_canvas.drawString(100, 650, "SSN: 123-45-6789")
+        pdf_canvas.save()
+        return buffer.getvalue()
+    
+    @pytest.mark.asyncio
+    async def test_upload_pdf_queues_job(self, upload_queue, mock_db_client):
+        """Test that an accepted upload is queued and acknowledged immediately."""
+        mock_file = MagicMock(spec=UploadFile)
+        mock_file.filename = "queued.pdf"
+        mock_file.read = AsyncMock(side_effect=[b"%PDF-1.4\nContent\n%%EOF", b""])
+        
+        result = await upload_pdf(mock_file)
+        
+        assert result["status"] == "queued"
+        assert result["filename"] == "queued.pdf"
+        assert len(result["document_id"]) == 32  # UUID hex format
+        
+        job = upload_queue.get_nowait()
+        assert job.document_id == result["document_id"]
+        assert job.file_size == len(b"%PDF-1.4\nContent\n%%EOF")
+        assert job.pdf_stream.read() == b"%PDF-1.4\nContent\n%%EOF"
+        
+        # Worker processes open the upload by path
+        with open(job.pdf_stream.name, "rb") as pdf_file:
+            assert pdf_file.read() == b"%PDF-1.4\nContent\n%%EOF"
+        
+        # Pollers see the upload as pending until the worker replaces the row
+        pending = mock_db_client.insert_document.call_args[1]
+        assert pending["document_id"] == job.document_id
+        assert pending["status"] == "pending"
+        assert pending["upload_timestamp"] == job.upload_timestamp
+    
     @pytest.mark.asyncio
-    async def test_upload_pdf_size_limit_error(self):
-        """Test upload with PDF size limit error."""
+    async def test_upload_pdf_unavailable_without_workers(self):
+        """Test that uploads are refused when no processing workers are running."""
         mock_file = MagicMock(spec=UploadFile)
-        mock_file.filename = "large.pdf"
-        mock_file.read = AsyncMock(return_value=b"%PDF-1.4\nLarge content\n%%EOF")
+        mock_file.filename = "test.pdf"
+        
+        with pytest.raises(HTTPException) as exc_info:
+            await upload_pdf(mock_file)
+        
+        assert exc_info.value.status_code == 503
+        mock_file.read.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_upload_workers_process_queued_jobs(self, make_upload_job):
+        """Test that started workers drain the queue and close each upload stream."""
+        job = make_upload_job()
+        
+        with patch("app.api.endpoints.upload.process_upload_job", new_callable=AsyncMock) as mock_process:
+            start_upload_workers(2)
+            try:
+                await upload._work_queue.put(job)
+            finally:
+                await stop_upload_workers()
+        
+        mock_process.assert_awaited_once_with(job)
+        assert job.pdf_stream.closed
+        assert upload._work_queue is None
+        assert upload._workers == []
+    
+    @pytest.mark.asyncio
+    async def test_upload_workers_compile_detector_at_startup(self):
+        """Test that the detector is built before the first upload and in each worker."""
+        with patch("app.api.endpoints.upload.create_detector") as mock_create:
+            with patch("app.api.endpoints.upload.ProcessPoolExecutor") as mock_pool:
+                start_upload_workers(1)
+                try:
+                    mock_create.assert_called_once_with()
+                    mock_pool.assert_called_once_with(max_workers=1, initializer=mock_create)
+                finally:
+                    await stop_upload_workers()
+    
+    @pytest.mark.asyncio
+    async def test_process_pdf_async_in_process_pool(self, valid_pdf_bytes, tmp_path):
+        """Test that PDFs are parsed in a worker process when the pool is running."""
+        pdf_path = tmp_path / "upload.pdf"
+        pdf_path.write_bytes(valid_pdf_bytes)
         
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            with patch("app.api.endpoints.upload._pdf_pool", pool):
+                result = await process_pdf_async(str(pdf_path), "pooled.pdf")
+        
+        assert result.filename == "pooled.pdf"
+        assert result.status == "success"
+        assert len(result.findings) == 2
+    
+    @pytest.mark.asyncio
+    async def test_process_upload_size_limit_error(self, make_upload_job):
+        """Test processing an upload that exceeds the processor size limit."""
         mock_processor = MagicMock()
         mock_processor.process_pdf.side_effect = PDFSizeLimitError("File too large")
         
         mock_db = AsyncMock()
         
-        with patch("app.api.endpoints.upload.validate_file_extension"):
-            with patch("app.api.endpoints.upload.create_pdf_processor", return_value=mock_processor):
-                with patch("app.api.endpoints.upload.get_db_client", return_value=mock_db):
-                    with patch("app.api.endpoints.upload.datetime") as mock_datetime:
-                        mock_datetime.utcnow.return_value = datetime(2024, 1, 1)
-                        
-                        with pytest.raises(HTTPException) as exc_info:
-                            await upload_pdf(mock_file)
-                        
-                        assert exc_info.value.status_code == 413
-                        assert "File too large" in str(exc_info.value.detail)
+        with patch("app.api.endpoints.upload.create_pdf_processor", return_value=mock_processor):
+            with patch("app.api.endpoints.upload.get_db_client", return_value=mock_db):
+                await process_upload_job(make_upload_job(filename="large.pdf"))
+                
+                call_args = mock_db.insert_document.call_args[1]
+                assert call_args["status"] == ProcessingStatus.FAILED.value
+                assert call_args["error_message"] == "File too large"
     
     @pytest.mark.asyncio
-    async def test_upload_pdf_corrupted_error(self):
-        """Test upload with corrupted PDF error."""
-        mock_file = MagicMock(spec=UploadFile)
-        mock_file.filename = "corrupted.pdf"
-        mock_file.read = AsyncMock(return_value=b"%PDF-1.4\nCorrupted\n%%EOF")
-        
+    async def test_process_upload_corrupted_error(self, make_upload_job):
+        """Test processing a corrupted upload."""
         mock_processor = MagicMock()
         mock_processor.process_pdf.side_effect = CorruptedPDFError("PDF is corrupted")
         
         mock_db = AsyncMock()
         
-        with patch("app.api.endpoints.upload.validate_file_extension"):
-            with patch("app.api.endpoints.upload.create_pdf_processor", return_value=mock_processor):
-                with patch("app.api.endpoints.upload.get_db_client", return_value=mock_db):
-                    with patch("app.api.endpoints.upload.datetime") as mock_datetime:
-                        mock_datetime.utcnow.return_value = datetime(2024, 1, 1)
-                        
-                        with pytest.raises(HTTPException) as exc_info:
-                            await upload_pdf(mock_file)
-                        
-                        assert exc_info.value.status_code == 422
-                        assert "PDF is corrupted" in str(exc_info.value.detail)
+        with patch("app.api.endpoints.upload.create_pdf_processor", return_value=mock_processor):
+            with patch("app.api.endpoints.upload.get_db_client", return_value=mock_db):
+                await process_upload_job(make_upload_job(filename="corrupted.pdf"))
+                
+                call_args = mock_db.insert_document.call_args[1]
+                assert call_args["status"] == "failed"
+                assert call_args["error_message"] == "PDF is corrupted"
     
     @pytest.mark.asyncio
-    async def test_upload_pdf_processing_error_specific(self):
-        """Test upload with specific PDF processing error."""
-        mock_file = MagicMock(spec=UploadFile)
-        mock_file.filename = "error.pdf"
-        mock_file.read = AsyncMock(return_value=b"%PDF-1.4\nContent\n%%EOF")
-        
+    async def test_process_upload_processing_error_specific(self, make_upload_job):
+        """Test processing an upload with a specific PDF processing error."""
         mock_processor = MagicMock()
         mock_processor.process_pdf.side_effect = PDFProcessingError("Processing failed")
         
         mock_db = AsyncMock()
+        job = make_upload_job(filename="error.pdf")
         
-        with patch("app.api.endpoints.upload.validate_file_extension"):
-            with patch("app.api.endpoints.upload.create_pdf_processor", return_value=mock_processor):
-                with patch("app.api.endpoints.upload.get_db_client", return_value=mock_db):
-                    with patch("app.api.endpoints.upload.datetime") as mock_datetime:
-                        mock_datetime.utcnow.return_value = datetime(2024, 1, 1)
-                        
-                        with pytest.raises(HTTPException) as exc_info:
-                            await upload_pdf(mock_file)
-                        
-                        assert exc_info.value.status_code == 500
-                        assert "Failed to process PDF" in str(exc_info.value.detail)
-                        
-                        # Check that document was inserted with failed status
-                        mock_db.insert_document.assert_called_once()
-                        call_args = mock_db.insert_document.call_args[1]
-                        assert call_args["status"] == "failed"
-                        assert call_args["error_message"] == "Processing failed"
+        with patch("app.api.endpoints.upload.create_pdf_processor", return_value=mock_processor):
+            with patch("app.api.endpoints.upload.get_db_client", return_value=mock_db):
+                await process_upload_job(job)
+                
+                # Check that document was inserted with failed status
+                mock_db.insert_document.assert_called_once()
+                call_args = mock_db.insert_document.call_args[1]
+                assert call_args["document_id"] == job.document_id
+                assert call_args["file_size"] == job.file_size
+                assert call_args["status"] == "failed"
+                assert call_args["error_message"] == "Processing failed"
     
     @pytest.mark.asyncio
-    async def test_upload_pdf_with_metrics(self):
-        """Test upload with metric insertion."""
-        mock_file = MagicMock(spec=UploadFile)
-        mock_file.filename = "metrics.pdf"
-        mock_file.read = AsyncMock(return_value=b"%PDF-1.4\nContent\n%%EOF")
-        
+    async def test_process_upload_with_metrics(self, make_upload_job):
+        """Test upload processing with metric insertion."""
         mock_processor = MagicMock()
         mock_result = MagicMock()
         mock_result.document_id = str(uuid4())
@@ -120,33 +196,26 @@ class TestUploadEndpointCoverage:
         
         mock_db = AsyncMock()
         
-        with patch("app.api.endpoints.upload.validate_file_extension"):
-            with patch("app.api.endpoints.upload.create_pdf_processor", return_value=mock_processor):
-                with patch("app.api.endpoints.upload.get_db_client", return_value=mock_db):
-                    with patch("app.api.endpoints.upload.datetime") as mock_datetime:
-                        mock_datetime.utcnow.return_value = datetime(2024, 1, 1)
-                        
-                        result = await upload_pdf(mock_file)
-                        
-                        assert result["status"] == "success"
-                        
-                        # Check metrics were inserted
-                        assert mock_db.insert_metric.call_count == 3  # processing_time, page_count, file_size
-                        
-                        # Verify metric types
-                        metric_calls = mock_db.insert_metric.call_args_list
-                        metric_types = [call[1]["metric_type"] for call in metric_calls]
-                        assert "processing_time" in metric_types
-                        assert "page_count" in metric_types
-                        assert "file_size" in metric_types
+        with patch("app.api.endpoints.upload.create_pdf_processor", return_value=mock_processor):
+            with patch("app.api.endpoints.upload.get_db_client", return_value=mock_db):
+                await process_upload_job(make_upload_job(filename="metrics.pdf"))
+                
+                assert mock_db.insert_document.call_args[1]["status"] == "success"
+                
+                # Check metrics were inserted in one batch
+                mock_db.insert_metrics_bulk.assert_awaited_once()
+                
+                # Verify metric types
+                metric_rows = mock_db.insert_metrics_bulk.call_args[0][0]
+                metric_types = [row["metric_type"] for row in metric_rows]
+                assert len(metric_types) == 3  # processing_time, page_count, file_size
+                assert "processing_time" in metric_types
+                assert "page_count" in metric_types
+                assert "file_size" in metric_types
     
     @pytest.mark.asyncio
-    async def test_upload_pdf_database_error_during_insert(self):
-        """Test upload with database error during document insert."""
-        mock_file = MagicMock(spec=UploadFile)
-        mock_file.filename = "db_error.pdf"
-        mock_file.read = AsyncMock(return_value=b"%PDF-1.4\nContent\n%%EOF")
-        
+    async def test_process_upload_database_error_during_insert(self, make_upload_job):
+        """Test upload processing with database error during document insert."""
         mock_processor = MagicMock()
         mock_result = MagicMock()
         mock_result.document_id = str(uuid4())
@@ -160,25 +229,19 @@ class TestUploadEndpointCoverage:
         mock_db = AsyncMock()
         mock_db.insert_document.side_effect = Exception("Database error")
         
-        with patch("app.api.endpoints.upload.validate_file_extension"):
-            with patch("app.api.endpoints.upload.create_pdf_processor", return_value=mock_processor):
-                with patch("app.api.endpoints.upload.get_db_client", return_value=mock_db):
-                    with patch("app.api.endpoints.upload.datetime") as mock_datetime:
-                        mock_datetime.utcnow.return_value = datetime(2024, 1, 1)
-                        
-                        with pytest.raises(HTTPException) as exc_info:
-                            await upload_pdf(mock_file)
-                        
-                        assert exc_info.value.status_code == 500
-                        assert "An unexpected error occurred while processing the PDF" in str(exc_info.value.detail)
+        with patch("app.api.endpoints.upload.create_pdf_processor", return_value=mock_processor):
+            with patch("app.api.endpoints.upload.get_db_client", return_value=mock_db):
+                with patch("app.api.endpoints.upload.logger") as mock_logger:
+                
+                    # Errors are logged, not raised, so the worker keeps running
+                    await process_upload_job(make_upload_job(filename="db_error.pdf"))
+                    
+                    assert mock_db.insert_document.await_count == 2
+                    assert "Failed to store error document" in str(mock_logger.error.call_args)
     
     @pytest.mark.asyncio
-    async def test_upload_pdf_finding_insert_continues_on_error(self):
-        """Test that upload continues even if finding insert fails."""
-        mock_file = MagicMock(spec=UploadFile)
-        mock_file.filename = "finding_error.pdf"
-        mock_file.read = AsyncMock(return_value=b"%PDF-1.4\nContent\n%%EOF")
-        
+    async def test_process_upload_finding_insert_error_fails_document(self, make_upload_job):
+        """Test that a document whose findings could not be stored is not marked processed."""
         mock_processor = MagicMock()
         mock_result = MagicMock()
         mock_result.document_id = str(uuid4())
@@ -196,20 +259,77 @@ class TestUploadEndpointCoverage:
         mock_processor.process_pdf.return_value = mock_result
         
         mock_db = AsyncMock()
-        mock_db.insert_finding.side_effect = Exception("Finding insert error")
+        mock_db.insert_findings_bulk.side_effect = Exception("Finding insert error")
+        
+        with patch("app.api.endpoints.upload.create_pdf_processor", return_value=mock_processor):
+            with patch("app.api.endpoints.upload.get_db_client", return_value=mock_db):
+                with patch("app.api.endpoints.upload.logger") as mock_logger:
+                
+                    await process_upload_job(make_upload_job(filename="finding_error.pdf"))
+                    
+                    # The only document row records the failure
+                    mock_db.insert_document.assert_awaited_once()
+                    assert mock_db.insert_document.call_args[1]["status"] == "failed"
+                    assert mock_db.insert_document.call_args[1]["error_message"] == "Finding insert error"
+                    
+                    # Should log the error
+                    mock_logger.error.assert_called()
+                    assert mock_logger.error.call_args_list[0][0][:2] == ("Failed to insert %s: %s", "findings")
+                    
+                    # Metrics are still written alongside the failed findings batch
+                    mock_db.insert_metrics_bulk.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_process_upload_stores_findings_before_document(self, make_upload_job):
+        """Test that the document row, which marks the upload processed, is written last."""
+        mock_processor = MagicMock()
+        mock_result = MagicMock()
+        mock_finding = MagicMock()
+        mock_finding.type.value = "email"
+        mock_finding.value = "test@example.com"
+        mock_finding.page_number = 1
+        mock_finding.confidence = 0.95
+        mock_finding.context = "Email: test@example.com"
+        mock_result.findings = [mock_finding]
+        mock_result.page_count = 1
+        mock_result.processing_time_ms = 100.0
+        mock_result.file_size = 1024
+        mock_result.status = "success"
+        mock_processor.process_pdf.return_value = mock_result
+        
+        mock_db = AsyncMock()
+        
+        with patch("app.api.endpoints.upload.create_pdf_processor", return_value=mock_processor):
+            with patch("app.api.endpoints.upload.get_db_client", return_value=mock_db):
+                await process_upload_job(make_upload_job())
+        
+        calls = [name for name, _, _ in mock_db.mock_calls]
+        assert calls.index("insert_document") > calls.index("insert_findings_bulk")
+        assert calls.index("insert_document") > calls.index("insert_metrics_bulk")
+    
+    @pytest.mark.asyncio
+    async def test_upload_pdf_rejects_oversized_stream_early(self, upload_queue):
+        """Test that reading stops as soon as the running size exceeds the limit."""
+        mock_file = MagicMock(spec=UploadFile)
+        mock_file.filename = "huge.pdf"
+        mock_file.read = AsyncMock(side_effect=[b"x" * 600, b"x" * 600, b"x" * 600, b""])
         
         with patch("app.api.endpoints.upload.validate_file_extension"):
-            with patch("app.api.endpoints.upload.create_pdf_processor", return_value=mock_processor):
-                with patch("app.api.endpoints.upload.get_db_client", return_value=mock_db):
-                    with patch("app.api.endpoints.upload.datetime") as mock_datetime:
-                        mock_datetime.utcnow.return_value = datetime(2024, 1, 1)
-                        with patch("app.api.endpoints.upload.logger") as mock_logger:
-                            
-                            result = await upload_pdf(mock_file)
-                            
-                            # Should still return success
-                            assert result["status"] == "success"
-                            
-                            # Should log the error
-                            mock_logger.error.assert_called()
-                            assert "Failed to insert finding" in str(mock_logger.error.call_args)
+            with patch("app.api.endpoints.upload._MAX_UPLOAD_SIZE", 1000):
+                
+                with pytest.raises(HTTPException) as exc_info:
+                    await upload_pdf(mock_file)
+                
+                assert exc_info.value.status_code == 413
+                assert mock_file.read.await_count == 2
+                assert upload_queue.empty()
+    
+    def test_validate_file_extension_case_insensitive(self):
+        """Test extension validation ignores case and rejects missing suffixes."""
+        validate_file_extension("REPORT.PDF")
+        
+        for filename in ("report", ".pdf", "report.pdf.txt"):
+            with pytest.raises(HTTPException) as exc_info:
+                validate_file_extension(filename)
+            
+            assert exc_info.value.status_code == 400
@@ -79,6 +79,16 @@ class TestValidators:
         for pdf_content in valid_pdfs:
             assert validate_pdf_content(pdf_content) is True
     
+    def test_validate_pdf_content_large_file_tail(self):
+        """Test the EOF marker is found at the end of a large PDF."""
+        body = b"%PDF-1.4\n" + b"x" * 100_000
+        
+        assert validate_pdf_content(body + b"\n%%EOF\r\n") is True
+        
+        # A marker followed by more content is not the end of the file
+        with pytest.raises(HTTPException):
+            validate_pdf_content(b"%PDF-1.4\n%%EOF\n" + b"x" * 100_000)
+    
     def test_validate_pdf_content_invalid(self):
         """Test invalid PDF content."""
         # Not a PDF
@@ -182,6 +192,7 @@ class TestValidators:
             "123e4567-e89b-12d3-a456-426614174000",
             "550e8400-e29b-41d4-a716-446655440000",
             "6ba7b810-9dad-11d1-80b4-00c04fd430c8",
+            "123e4567e89b12d3a456426614174000",  # API form without hyphens
         ]
         
         for doc_id in valid_ids:
@@ -29,7 +29,7 @@ export function FileDropzone({ onUploadSuccess, onUploadError }: FileDropzonePro
       const response = await api.uploadPDF(file);
       setUploadStatus({
         type: 'success',
-        message: `Successfully processed ${file.name}. Found ${response.findings_count} sensitive items.`,
+        message: `Uploaded ${file.name}. Scanning for sensitive data in the background.`,
       });
       onUploadSuccess?.(response);
     } catch (error) {
@@ -0,0 +1,27 @@
+import useSWR from 'swr';
+import { api } from '@/services/api';
+import { DOCUMENT_POLL_INTERVAL_MS } from '@/lib/constants';
+import type { DocumentWithFindings } from '@/types';
+
+// A pending document is replaced by one of these once the worker finishes
+const isProcessed = (
+  document: DocumentWithFindings | null | undefined
+): document is DocumentWithFindings =>
+  document?.status === 'success' || document?.status === 'failed';
+
+export function useDocumentFindings(documentId: string | null) {
+  const { data, error } = useSWR(
+    documentId ? ['document-findings', documentId] : null,
+    () => api.findDocumentFindings(documentId as string),
+    {
+      revalidateOnFocus: false,
+      // Poll until the background worker has stored the processed document
+      refreshInterval: (latest) => (isProcessed(latest) ? 0 : DOCUMENT_POLL_INTERVAL_MS),
+    }
+  );
+
+  return {
+    document: isProcessed(data) ? data : null,
+    isError: error,
+  };
+}
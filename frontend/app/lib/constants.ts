@@ -5,6 +5,8 @@ export const API_ENDPOINTS = {
   stats: '/findings/stats/summary',
 } as const;
 
+export const DOCUMENT_POLL_INTERVAL_MS = 2000;
+
 export const MAX_FILE_SIZE = 50 * 1024 * 1024; // 50MB
 export const ACCEPTED_FILE_TYPES = {
   'application/pdf': ['.pdf'],
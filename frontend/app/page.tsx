@@ -1,6 +1,6 @@
 'use client';
 
-import { useState } from 'react';
+import { useEffect, useState } from 'react';
 import { FileDropzone } from '@/components/upload/FileDropzone';
 import { FindingCard } from '@/components/findings/FindingCard';
 import { MetricCard } from '@/components/stats/MetricCard';
@@ -16,18 +16,28 @@ import {
 } from '@heroicons/react/24/outline';
 import { useFindings } from '@/hooks/useFindings';
 import { useStats } from '@/hooks/useStats';
+import { useDocumentFindings } from '@/hooks/useDocumentFindings';
 import type { UploadResponse } from '@/types';
 
 export default function Home() {
   const [recentUpload, setRecentUpload] = useState<UploadResponse | null>(null);
   const { findings, isLoading: findingsLoading, isError: findingsError, mutate } = useFindings();
   const { stats, isLoading: statsLoading } = useStats();
+  const { document: processedDocument, isError: processingError } = useDocumentFindings(
+    recentUpload?.document_id ?? null
+  );
 
   const handleUploadSuccess = (response: UploadResponse) => {
     setRecentUpload(response);
-    mutate(); // Refresh findings
   };
 
+  // Uploads are processed in the background; refresh once the document is stored
+  useEffect(() => {
+    if (processedDocument) {
+      mutate();
+    }
+  }, [processedDocument, mutate]);
+
   return (
     <div className="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8 py-8">
       <div className="space-y-8">
@@ -43,11 +53,28 @@ export default function Home() {
 
         {/* Recent Upload */}
         {recentUpload && (
-          <Alert
-            type="success"
-            title="Upload Complete"
-            message={`${recentUpload.filename} processed successfully. Found ${recentUpload.findings_count} sensitive items across ${recentUpload.page_count} pages.`}
-          />
+          processingError ? (
+            <Alert
+              type="error"
+              message={`Could not check the status of ${recentUpload.filename}. Please reload the page.`}
+            />
+          ) : processedDocument ? (
+            <Alert
+              type={processedDocument.status === 'failed' ? 'error' : 'success'}
+              title={processedDocument.status === 'failed' ? 'Scan Failed' : 'Scan Complete'}
+              message={
+                processedDocument.status === 'failed'
+                  ? processedDocument.error_message || `${recentUpload.filename} could not be processed.`
+                  : `${recentUpload.filename} was scanned: ${processedDocument.findings.length} findings.`
+              }
+            />
+          ) : (
+            <Alert
+              type="success"
+              title="Upload Queued"
+              message={`${recentUpload.filename} is being scanned. Its findings will appear below once processing finishes.`}
+            />
+          )
         )}
 
         {/* Statistics */}
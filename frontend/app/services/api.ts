@@ -39,6 +39,15 @@ export const api = {
     return handleResponse<DocumentWithFindings>(response);
   },
 
+  async findDocumentFindings(documentId: string): Promise<DocumentWithFindings | null> {
+    // 404 means the upload has not been recorded yet
+    const response = await fetch(`${API_URL}${API_ENDPOINTS.findingsById(documentId)}`);
+    if (response.status === 404) {
+      return null;
+    }
+    return handleResponse<DocumentWithFindings>(response);
+  },
+
   async getStatistics(): Promise<Statistics> {
     const response = await fetch(`${API_URL}${API_ENDPOINTS.stats}`);
     return handleResponse<Statistics>(response);
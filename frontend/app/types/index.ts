@@ -16,8 +16,8 @@ export interface Document {
  page_count: number;
  upload_timestamp: string;
  processing_time_ms: number;
- status: 'success' | 'failed' | 'processing';
- error_message?: string;
+ status: 'success' | 'failed' | 'processing' | 'pending';
+ error_message?: string | null;
 }
 
 export interface DocumentWithFindings extends Document {
@@ -31,19 +31,18 @@ export interface DocumentWithFindings extends Document {
 }
 
 export interface FindingsResponse {
- total: number;
+ total: number | null;
  page: number;
  page_size: number;
  findings: DocumentWithFindings[];
+ has_more: boolean;
+ next_cursor: string | null;
 }
 
 export interface UploadResponse {
  document_id: string;
  filename: string;
  status: string;
- page_count: number;
- findings_count: number;
- processing_time_ms: number;
  message: string;
 }
 